@@ -159,7 +159,9 @@ def main(main_file: Path = None, name: str = None, config_file: Path = None, ini
                                                icon=config.icon,
                                                dry_run=dry_run,
                                                permissions=config.permissions,
-                                               mode=config.mode)
+                                               mode=config.mode,
+                                               resource_files=config.resource_files,
+                                               project_dir=config.project_dir)
     except Exception:
         print(f"[DEPLOY] Exception occurred: {traceback.format_exc()}")
     finally:
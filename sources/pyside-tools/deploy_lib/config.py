@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: LicenseRef-Qt-Commercial OR LGPL-3.0-only OR GPL-2.0-only OR GPL-3.0-only
 from __future__ import annotations
 
+import os
 import sys
 import configparser
 import logging
@@ -165,6 +166,9 @@ class Config(BaseConfig):
         else:
             self.excluded_qml_plugins = self._find_excluded_qml_plugins()
 
+        # Binary resource files are build artifacts, hence not stored in the config file
+        self._resource_files = self._find_resource_files()
+
         if DesignStudio.isDSProject(self.source_file):
             self._generated_files_path = self.project_dir / "Python" / "deployment"
         else:
@@ -337,6 +341,31 @@ class Config(BaseConfig):
 
         return qml_files
 
+    @property
+    def resource_files(self):
+        return self._resource_files
+
+    def _find_resource_files(self):
+        """
+        Finds the binary resource files (.rcc) of the project, which are loaded by the modules
+        generated by 'pyside6-project build --binary-resources' instead of being compiled into
+        Python modules
+        """
+        if self.project_data:
+            qrc_files = list(self.project_data.qrc_files)
+            for sub_project_file in self.project_data.sub_projects_files:
+                qrc_files.extend(ProjectData(project_file=sub_project_file).qrc_files)
+            rcc_files = [qrc_file.with_suffix(".rcc") for qrc_file in qrc_files]
+            return [rcc_file for rcc_file in rcc_files if rcc_file.is_file()]
+
+        # Prune the ignored directories like get_py_files(), since they can be large, e.g. venvs
+        ignore_dirs = ["__pycache__", *DEFAULT_IGNORE_DIRS, *(self.extra_ignore_dirs or [])]
+        rcc_files = []
+        for root, dirs, files in os.walk(self.project_dir):
+            dirs[:] = [d for d in dirs if d not in ignore_dirs and not d.startswith(".")]
+            rcc_files.extend(Path(root) / file for file in files if file.endswith(".rcc"))
+        return rcc_files
+
     def _find_project_dir(self) -> Path:
         if DesignStudio.isDSProject(self.source_file):
             ds = DesignStudio(self.source_file)
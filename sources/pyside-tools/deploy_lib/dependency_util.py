@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import ast
+import hashlib
+import importlib.metadata
 import re
 import os
 import site
@@ -11,10 +13,12 @@ import warnings
 import logging
 import shutil
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from functools import lru_cache
 
 from . import IMPORT_WARNING_PYSIDE, DEFAULT_IGNORE_DIRS, run_command
+from .elf_reader import read_needed_libraries
 
 
 @lru_cache(maxsize=None)
@@ -66,64 +70,215 @@ def get_py_files(project_dir: Path, extra_ignore_dirs: list[Path] = None, projec
     return py_candidates
 
 
-@lru_cache(maxsize=None)
-def get_ast(py_file: Path):
-    """Given a Python file returns the abstract syntax tree
+IMPORT_CACHE_FILE = ".pysidedeploy.imports.json"
+# Increment when the results of _scan_file_imports() change
+IMPORT_CACHE_VERSION = 1
+# Below this number of files to be scanned, starting worker processes does not pay off
+PARALLEL_SCAN_MIN_FILES = 64
+
+PYSIDE_MODULE_PATTERN = re.compile("PySide6.Qt(?P<mod_name>.*)")
+PERMISSION_PATTERN = re.compile("Q(?P<mod_name>.*)Permission")
+
+
+def _scan_file_imports(py_file: Path) -> dict:
+    """Walks the abstract syntax tree of a Python file once and returns the PySide modules
+    and the permission categories it imports, and the warnings to be logged.
+
+    This runs in worker processes and its result is stored in the import cache, hence
+    the warnings are returned instead of being logged.
     """
-    contents = py_file.read_text(encoding="utf-8")
+    modules = set()
+    perm_categories = set()
+    messages = []
     try:
-        tree = ast.parse(contents)
-    except SyntaxError:
-        print(f"[DEPLOY] Unable to parse {py_file}")
-    return tree
+        tree = ast.parse(py_file.read_text(encoding="utf-8"))
+        for node in ast.walk(tree):
+            if isinstance(node, ast.ImportFrom):
+                main_mod_name = node.module
+                if not main_mod_name or not main_mod_name.startswith("PySide6"):
+                    continue
+                if main_mod_name == "PySide6":
+                    # considers 'from PySide6 import QtCore'
+                    for imported_module in node.names:
+                        full_mod_name = imported_module.name
+                        if full_mod_name.startswith("Qt"):
+                            modules.add(full_mod_name[2:])
+                    continue
 
+                # considers 'from PySide6.QtCore import Qt'
+                match = PYSIDE_MODULE_PATTERN.search(main_mod_name)
+                if match:
+                    modules.add(match.group("mod_name"))
+                else:
+                    messages.append(f"[DEPLOY] Unable to find module name from {ast.dump(node)}")
 
-def find_permission_categories(project_dir: Path, extra_ignore_dirs: list[Path] = None,
-                               project_data=None):
-    """Given the project directory, finds all the permission categories required by the
-    project. eg: Camera, Bluetooth, Contacts etc.
+                if main_mod_name == "PySide6.QtCore":
+                    # considers 'from PySide6.QtCore import QtMicrophonePermission'
+                    for imported_module in node.names:
+                        match = PERMISSION_PATTERN.search(imported_module.name)
+                        if match:
+                            perm_categories.add(match.group("mod_name"))
 
-    Note: This function is only relevant for mac0S deployment.
+            elif isinstance(node, ast.Import):
+                for imported_module in node.names:
+                    if imported_module.name == "PySide6":
+                        messages.append(IMPORT_WARNING_PYSIDE.format(str(py_file)))
+    except Exception as e:
+        raise RuntimeError(f"[DEPLOY] Finding module imports failed on file {str(py_file)} with "
+                           f"error {e}")
+
+    return {"modules": sorted(modules), "permissions": sorted(perm_categories),
+            "warnings": messages}
+
+
+def _hash_file(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+class ImportCache:
+    """
+    Cache of the imports found in the Python files of a project, stored in the project
+    directory. The results are keyed by the content hash of the files, so that repeated
+    deployments only scan the files that were modified. The modification time and size
+    of a file are recorded with its hash, so that unchanged files are not hashed again.
     """
-    all_perm_categories = set()
-    mod_pattern = re.compile("Q(?P<mod_name>.*)Permission")
 
-    def pyside_permission_imports(py_file: Path):
-        perm_categories = []
+    def __init__(self, project_dir: Path):
+        self.path = project_dir / IMPORT_CACHE_FILE
+        self._root = project_dir
+        self._entries = {}
+        self._dirty = False
         try:
-            tree = get_ast(py_file)
-            for node in ast.walk(tree):
-                if isinstance(node, ast.ImportFrom):
-                    main_mod_name = node.module
-                    if main_mod_name == "PySide6.QtCore":
-                        # considers 'from PySide6.QtCore import QtMicrophonePermission'
-                        for imported_module in node.names:
-                            full_mod_name = imported_module.name
-                            match = mod_pattern.search(full_mod_name)
-                            if match:
-                                mod_name = match.group("mod_name")
-                                perm_categories.append(mod_name)
-                        continue
-
-                if isinstance(node, ast.Import):
-                    for imported_module in node.names:
-                        full_mod_name = imported_module.name
-                        if full_mod_name == "PySide6":
-                            logging.warning(IMPORT_WARNING_PYSIDE.format(str(py_file)))
-        except Exception as e:
-            raise RuntimeError(f"[DEPLOY] Finding permission categories failed on file "
-                               f"{str(py_file)} with error {e}")
+            with self.path.open(encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == IMPORT_CACHE_VERSION:
+                self._entries = data["entries"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+
+    def _key(self, py_file: Path) -> str:
+        try:
+            return Path(py_file).relative_to(self._root).as_posix()
+        except ValueError:
+            return os.fspath(py_file)
+
+    def _state(self, py_file: Path, recorded: list | None) -> list:
+        """Returns [mtime_ns, size, hash] of a file, hashing it only when it was touched."""
+        st = py_file.stat()
+        if recorded and recorded[0] == st.st_mtime_ns and recorded[1] == st.st_size:
+            return recorded
+        return [st.st_mtime_ns, st.st_size, _hash_file(py_file)]
+
+    def lookup(self, py_file: Path) -> dict | None:
+        """Returns the cached imports of a file, or None if the file changed."""
+        entry = self._entries.get(self._key(py_file))
+        if not entry:
+            return None
+        try:
+            state = self._state(py_file, entry["state"])
+        except OSError:
+            return None
+        if state[2] != entry["state"][2]:
+            return None
+        if state is not entry["state"]:
+            # Touched, but unchanged: remember the new time stamp.
+            entry["state"] = state
+            self._dirty = True
+        return entry["imports"]
+
+    def store(self, py_file: Path, imports: dict):
+        try:
+            state = self._state(py_file, None)
+        except OSError:
+            return
+        self._entries[self._key(py_file)] = {"state": state, "imports": imports}
+        self._dirty = True
+
+    def save(self):
+        """Writes the cache if it changed."""
+        if not self._dirty:
+            return
+        data = {"version": IMPORT_CACHE_VERSION, "entries": self._entries}
+        tmp_path = self.path.with_suffix(".tmp")
+        try:
+            with tmp_path.open("w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logging.warning(f"[DEPLOY] Unable to write the import cache {self.path}: {e}")
+        self._dirty = False
+
+
+def scan_imports(py_files: list[Path], project_dir: Path, jobs: int = None) -> dict[Path, dict]:
+    """Returns the imports of the Python files (see _scan_file_imports()). The files which
+    are not in the import cache are scanned in up to 'jobs' processes (default: number of
+    CPUs).
+    """
+    cache = ImportCache(project_dir)
+    results = {}
+    pending = []
+    for py_file in py_files:
+        imports = cache.lookup(py_file)
+        if imports is None:
+            pending.append(py_file)
+        else:
+            results[py_file] = imports
+
+    if pending:
+        logging.info(f"[DEPLOY] Scanning {len(pending)} of {len(py_files)} Python files for "
+                     "imports")
+        jobs = jobs or os.cpu_count() or 1
+        if jobs <= 1 or len(pending) < PARALLEL_SCAN_MIN_FILES:
+            scanned = map(_scan_file_imports, pending)
+            for py_file, imports in zip(pending, scanned):
+                results[py_file] = imports
+                cache.store(py_file, imports)
+        else:
+            chunksize = max(1, len(pending) // (jobs * 4))
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                scanned = executor.map(_scan_file_imports, pending, chunksize=chunksize)
+                for py_file, imports in zip(pending, scanned):
+                    results[py_file] = imports
+                    cache.store(py_file, imports)
+        cache.save()
+
+    return results
 
-        return set(perm_categories)
 
+@lru_cache(maxsize=None)
+def _find_project_imports(project_dir: Path, extra_ignore_dirs: tuple[str] = None,
+                          project_data=None) -> tuple[set[str], set[str]]:
+    """Returns the PySide modules and the permission categories imported by the project.
+    Scanning the files once serves both find_pyside_modules() and
+    find_permission_categories().
+    """
     py_candidates = get_py_files(project_dir, extra_ignore_dirs, project_data)
-    for py_candidate in py_candidates:
-        all_perm_categories = all_perm_categories.union(pyside_permission_imports(py_candidate))
+    all_modules = set()
+    all_perm_categories = set()
+    for imports in scan_imports(py_candidates, project_dir).values():
+        all_modules.update(imports["modules"])
+        all_perm_categories.update(imports["permissions"])
+        for message in imports["warnings"]:
+            logging.warning(message)
+    return all_modules, all_perm_categories
+
+
+def find_permission_categories(project_dir: Path, extra_ignore_dirs: list[Path] = None,
+                               project_data=None):
+    """Given the project directory, finds all the permission categories required by the
+    project. eg: Camera, Bluetooth, Contacts etc.
+
+    Note: This function is only relevant for mac0S deployment.
+    """
+    if extra_ignore_dirs:
+        extra_ignore_dirs = tuple(extra_ignore_dirs)
+    _, all_perm_categories = _find_project_imports(project_dir, extra_ignore_dirs,
+                                                   project_data)
 
     if not all_perm_categories:
         ValueError("[DEPLOY] No permission categories were found for macOS app bundle creation.")
 
-    return all_perm_categories
+    return set(all_perm_categories)
 
 
 def find_pyside_modules(project_dir: Path, extra_ignore_dirs: list[Path] = None,
@@ -132,49 +287,9 @@ def find_pyside_modules(project_dir: Path, extra_ignore_dirs: list[Path] = None,
     Searches all the python files in the project to find all the PySide modules used by
     the application.
     """
-    all_modules = set()
-    mod_pattern = re.compile("PySide6.Qt(?P<mod_name>.*)")
-
-    @lru_cache
-    def pyside_module_imports(py_file: Path):
-        modules = []
-        try:
-            tree = get_ast(py_file)
-            for node in ast.walk(tree):
-                if isinstance(node, ast.ImportFrom):
-                    main_mod_name = node.module
-                    if main_mod_name.startswith("PySide6"):
-                        if main_mod_name == "PySide6":
-                            # considers 'from PySide6 import QtCore'
-                            for imported_module in node.names:
-                                full_mod_name = imported_module.name
-                                if full_mod_name.startswith("Qt"):
-                                    modules.append(full_mod_name[2:])
-                            continue
-
-                        # considers 'from PySide6.QtCore import Qt'
-                        match = mod_pattern.search(main_mod_name)
-                        if match:
-                            mod_name = match.group("mod_name")
-                            modules.append(mod_name)
-                        else:
-                            logging.warning((
-                                f"[DEPLOY] Unable to find module name from {ast.dump(node)}"))
-
-                if isinstance(node, ast.Import):
-                    for imported_module in node.names:
-                        full_mod_name = imported_module.name
-                        if full_mod_name == "PySide6":
-                            logging.warning(IMPORT_WARNING_PYSIDE.format(str(py_file)))
-        except Exception as e:
-            raise RuntimeError(f"[DEPLOY] Finding module import failed on file {str(py_file)} with "
-                               f"error {e}")
-
-        return set(modules)
-
-    py_candidates = get_py_files(project_dir, extra_ignore_dirs, project_data)
-    for py_candidate in py_candidates:
-        all_modules = all_modules.union(pyside_module_imports(py_candidate))
+    if extra_ignore_dirs:
+        extra_ignore_dirs = tuple(extra_ignore_dirs)
+    all_modules, _ = _find_project_imports(project_dir, extra_ignore_dirs, project_data)
 
     if not all_modules:
         ValueError("[DEPLOY] No PySide6 modules were found")
@@ -182,6 +297,12 @@ def find_pyside_modules(project_dir: Path, extra_ignore_dirs: list[Path] = None,
     return list(all_modules)
 
 
+def _normalized_distribution_name(name: str) -> str:
+    """Normalizes a distribution name (PEP 503), "PySide6-Essentials" being the same
+    distribution as "PySide6_Essentials"."""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
 class QtDependencyReader:
     def __init__(self, dry_run: bool = False) -> None:
         self.dry_run = dry_run
@@ -192,10 +313,10 @@ class QtDependencyReader:
         self.qt_libs_dir = None
 
         if sys.platform == "linux":
-            self.lib_reader_name = "readelf"
+            # The ELF files are read in-process, see elf_reader.py
+            self.lib_reader_name = "ELF reader"
             self.qt_module_path_pattern = "libQt6{module}.so.6"
             self.lib_pattern = re.compile("libQt6(?P<mod_name>.*).so.6")
-            self.command_args = "-d"
         elif sys.platform == "darwin":
             self.lib_reader_name = "dyld_info"
             self.qt_module_path_pattern = "Qt{module}.framework/Versions/A/Qt{module}"
@@ -212,7 +333,12 @@ class QtDependencyReader:
 
         self.pyside_install_dir = None
         self.qt_libs_dir = self.get_qt_libs_dir()
-        self._lib_reader = shutil.which(self.lib_reader_name)
+        if sys.platform == "linux":
+            self._lib_reader = read_needed_libraries
+        else:
+            self._lib_reader = shutil.which(self.lib_reader_name)
+        # Memoized graph of Qt module -> the Qt modules it directly depends on
+        self._module_dependencies: dict[str, set[str]] = {}
 
     def get_qt_libs_dir(self):
         """
@@ -236,34 +362,37 @@ class QtDependencyReader:
 
     @property
     def lib_reader(self):
+        """The tool reading the dependencies of a library: read_needed_libraries() on Linux,
+        otherwise the path of an executable, or None if it was not found."""
         return self._lib_reader
 
-    def find_dependencies(self, module: str, used_modules: set[str] = None):
+    def _read_dependencies(self, module: str, qt_module_path: Path) -> set[str]:
         """
-        Given a Qt module, find all the other Qt modules it is dependent on and add it to the
-        'used_modules' set
+        Returns the Qt modules the library of a Qt module directly depends on.
         """
-        qt_module_path = self.qt_libs_dir / self.qt_module_path_pattern.format(module=module)
-        if not qt_module_path.exists():
-            warnings.warn(f"[DEPLOY] {qt_module_path.name} not found in {str(qt_module_path)}."
-                          "Skipping finding its dependencies.", category=RuntimeWarning)
-            return
-
         lib_pattern = re.compile(self.lib_pattern)
-        command = [self.lib_reader, self.command_args, str(qt_module_path)]
-        # print the command if dry_run is True.
-        # Normally run_command is going to print the command in dry_run mode. But, this is a
-        # special case where we need to print the command as well as to run it.
-        if self.dry_run:
-            command_str = " ".join(command)
-            print(command_str + "\n")
-
-        # We need to run this even for dry run, to see the full Nuitka command being executed
-        _, output = run_command(command=command, dry_run=False, fetch_output=True)
-
         dependent_modules = set()
-        for line in output.splitlines():
-            line = line.decode("utf-8").lstrip()
+        if sys.platform == "linux":
+            try:
+                lines = read_needed_libraries(qt_module_path)
+            except (OSError, ValueError) as e:
+                warnings.warn(f"[DEPLOY] Unable to read {qt_module_path}: {e}. Skipping finding "
+                              "its dependencies.", category=RuntimeWarning)
+                return dependent_modules
+        else:
+            command = [self.lib_reader, self.command_args, str(qt_module_path)]
+            # print the command if dry_run is True.
+            # Normally run_command is going to print the command in dry_run mode. But, this is a
+            # special case where we need to print the command as well as to run it.
+            if self.dry_run:
+                command_str = " ".join(command)
+                print(command_str + "\n")
+
+            # We need to run this even for dry run, to see the full Nuitka command being executed
+            _, output = run_command(command=command, dry_run=False, fetch_output=True)
+            lines = [line.decode("utf-8").lstrip() for line in output.splitlines()]
+
+        for line in lines:
             if sys.platform == "darwin":
                 if line.endswith(f"Qt{module} [arm64]:"):
                     # macOS Qt frameworks bundles have both x86_64 and arm64 architectures
@@ -278,16 +407,34 @@ class QtDependencyReader:
                 break
             match = lib_pattern.search(line)
             if match:
-                dep_module = match.group("mod_name")
-                dependent_modules.add(dep_module)
-                if dep_module not in used_modules:
-                    used_modules.add(dep_module)
-                    self.find_dependencies(module=dep_module, used_modules=used_modules)
+                dependent_modules.add(match.group("mod_name"))
 
         if dependent_modules:
             logging.info(f"[DEPLOY] Following dependencies found for {module}: {dependent_modules}")
         else:
             logging.info(f"[DEPLOY] No Qt dependencies found for {module}")
+        return dependent_modules
+
+    def find_dependencies(self, module: str, used_modules: set[str] = None):
+        """
+        Given a Qt module, find all the other Qt modules it is dependent on and add it to the
+        'used_modules' set
+        """
+        dependent_modules = self._module_dependencies.get(module)
+        if dependent_modules is None:
+            qt_module_path = self.qt_libs_dir / self.qt_module_path_pattern.format(module=module)
+            if not qt_module_path.exists():
+                warnings.warn(f"[DEPLOY] {qt_module_path.name} not found in "
+                              f"{str(qt_module_path)}. Skipping finding its dependencies.",
+                              category=RuntimeWarning)
+                return
+            dependent_modules = self._read_dependencies(module, qt_module_path)
+            self._module_dependencies[module] = dependent_modules
+
+        for dep_module in dependent_modules:
+            if dep_module not in used_modules:
+                used_modules.add(dep_module)
+                self.find_dependencies(module=dep_module, used_modules=used_modules)
 
     def find_plugin_dependencies(self, used_modules: list[str], python_exe: Path) -> list[str]:
         """
@@ -295,12 +442,14 @@ class QtDependencyReader:
         """
         plugins = set()
         pyside_wheels = ["PySide6_Essentials", "PySide6_Addons"]
-        # TODO from 3.12 use list(dist.name for dist in importlib.metadata.distributions())
-        _, installed_packages = run_command(command=[str(python_exe), "-m", "pip", "freeze"],
-                                            dry_run=False, fetch_output=True)
-        installed_packages = [p.decode().split('==')[0] for p in installed_packages.split()]
+        # Look up the distributions next to the PySide6 package whose plugin json files are
+        # read below, which does not require running pip of python_exe.
+        site_dir = str(self.pyside_install_dir.parent)
+        installed_packages = {_normalized_distribution_name(dist.metadata["Name"])
+                              for dist in importlib.metadata.distributions(path=[site_dir])
+                              if dist.metadata["Name"]}
         for pyside_wheel in pyside_wheels:
-            if pyside_wheel not in installed_packages:
+            if _normalized_distribution_name(pyside_wheel) not in installed_packages:
                 # the wheel is not installed and hence no plugins are checked for its modules
                 logging.warning((f"[DEPLOY] The package {pyside_wheel} is not installed. "))
                 continue
@@ -0,0 +1,117 @@
+# Copyright (C) 2024 The Qt Company Ltd.
+# SPDX-License-Identifier: LicenseRef-Qt-Commercial OR LGPL-3.0-only OR GPL-2.0-only OR GPL-3.0-only
+"""
+Minimal reader for the dynamic section of ELF shared libraries, replacing
+'readelf -d' for finding the libraries a Qt library depends on (DT_NEEDED).
+"""
+
+from __future__ import annotations
+
+import mmap
+import struct
+from functools import lru_cache
+from pathlib import Path
+
+ELF_MAGIC = b"\x7fELF"
+ELFCLASS32 = 1
+ELFCLASS64 = 2
+ELFDATA2LSB = 1
+ELFDATA2MSB = 2
+
+PT_LOAD = 1
+PT_DYNAMIC = 2
+
+DT_NULL = 0
+DT_NEEDED = 1
+DT_STRTAB = 5
+
+# Header fields following e_ident: e_type, e_machine, e_version, e_entry,
+# e_phoff, e_shoff, e_flags, e_ehsize, e_phentsize, e_phnum, ...
+_HEADER_FORMATS = {ELFCLASS32: "HHIIIIIHHH", ELFCLASS64: "HHIQQQIHHH"}
+# Program header fields: p_type, p_offset, p_vaddr, p_filesz in the order
+# they are unpacked, see _program_headers()
+_PROGRAM_HEADER_FORMATS = {ELFCLASS32: "IIIIIIII", ELFCLASS64: "IIQQQQQQ"}
+_DYNAMIC_ENTRY_FORMATS = {ELFCLASS32: "iI", ELFCLASS64: "qQ"}
+
+
+def _program_headers(data: mmap.mmap, byte_order: str, elf_class: int, phoff: int,
+                     phentsize: int, phnum: int):
+    """Yields (p_type, p_offset, p_vaddr, p_filesz) of the program headers."""
+    fmt = struct.Struct(byte_order + _PROGRAM_HEADER_FORMATS[elf_class])
+    for i in range(phnum):
+        fields = fmt.unpack_from(data, phoff + i * phentsize)
+        if elf_class == ELFCLASS64:
+            p_type, _, p_offset, p_vaddr, _, p_filesz, _, _ = fields
+        else:
+            p_type, p_offset, p_vaddr, _, p_filesz, _, _, _ = fields
+        yield p_type, p_offset, p_vaddr, p_filesz
+
+
+def _read_string(data: mmap.mmap, offset: int) -> str:
+    end = data.find(b"\0", offset)
+    if end < 0:
+        raise ValueError("unterminated string")
+    return data[offset:end].decode("utf-8")
+
+
+@lru_cache(maxsize=None)
+def read_needed_libraries(library: Path) -> tuple[str, ...]:
+    """Returns the names of the libraries an ELF shared library depends on
+    (its DT_NEEDED entries). Raises ValueError if the file cannot be parsed."""
+    with open(library, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        try:
+            return _read_needed_libraries(data)
+        except struct.error as e:
+            raise ValueError(f"{library} is truncated: {e}") from e
+
+
+def _read_needed_libraries(data: mmap.mmap) -> tuple[str, ...]:
+    if data[:4] != ELF_MAGIC:
+        raise ValueError("not an ELF file")
+    elf_class = data[4]
+    if elf_class not in _HEADER_FORMATS:
+        raise ValueError(f"unknown ELF class {elf_class}")
+    byte_order = {ELFDATA2LSB: "<", ELFDATA2MSB: ">"}.get(data[5])
+    if not byte_order:
+        raise ValueError(f"unknown ELF data encoding {data[5]}")
+
+    header = struct.unpack_from(byte_order + _HEADER_FORMATS[elf_class], data, 16)
+    phoff, phentsize, phnum = header[4], header[8], header[9]
+
+    loads = []
+    dynamic = None
+    for p_type, p_offset, p_vaddr, p_filesz in _program_headers(data, byte_order, elf_class,
+                                                                phoff, phentsize, phnum):
+        if p_type == PT_LOAD:
+            loads.append((p_vaddr, p_offset, p_filesz))
+        elif p_type == PT_DYNAMIC:
+            dynamic = (p_offset, p_filesz)
+    if dynamic is None:
+        return ()  # statically linked
+
+    entry = struct.Struct(byte_order + _DYNAMIC_ENTRY_FORMATS[elf_class])
+    needed_offsets = []
+    strtab_address = None
+    offset, size = dynamic
+    for entry_offset in range(offset, offset + size - entry.size + 1, entry.size):
+        tag, value = entry.unpack_from(data, entry_offset)
+        if tag == DT_NULL:
+            break
+        if tag == DT_NEEDED:
+            needed_offsets.append(value)
+        elif tag == DT_STRTAB:
+            strtab_address = value
+    if not needed_offsets:
+        return ()
+    if strtab_address is None:
+        raise ValueError("no string table in the dynamic section")
+
+    # DT_STRTAB is a virtual address, map it to a file offset
+    for vaddr, load_offset, filesz in loads:
+        if vaddr <= strtab_address < vaddr + filesz:
+            strtab = strtab_address - vaddr + load_offset
+            break
+    else:
+        raise ValueError("the string table is not in a loadable segment")
+
+    return tuple(_read_string(data, strtab + name_offset) for name_offset in needed_offsets)
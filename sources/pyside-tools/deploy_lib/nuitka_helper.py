@@ -87,7 +87,8 @@ class Nuitka:
     def create_executable(self, source_file: Path, extra_args: str, qml_files: list[Path],
                           qt_plugins: list[str], excluded_qml_plugins: list[str], icon: str,
                           dry_run: bool, permissions: list[str],
-                          mode: DesktopConfig.NuitkaMode):
+                          mode: DesktopConfig.NuitkaMode, resource_files: list[Path] = None,
+                          project_dir: Path = None):
         qt_plugins = [plugin for plugin in qt_plugins if plugin not in self.qt_plugins_to_ignore]
 
         extra_args = shlex.split(extra_args)
@@ -103,6 +104,8 @@ class Nuitka:
             extra_args.append(f"--{mode.value}")
 
         qml_args = []
+        # directories included as data directories
+        all_relevant_subdirs = []
         if qml_files:
             if DesignStudio.isDSProject(source_file):
                 ds = DesignStudio(source_file)
@@ -112,10 +115,10 @@ class Nuitka:
                     if subdir.is_dir():
                         extra_args.append(f"--include-data-dir={subdir}="
                                           f"./{subdir.name}")
+                        all_relevant_subdirs.append(subdir)
             else:
                 # include all the subdirectories in the project directory as data directories
                 # This includes all the qml modules
-                all_relevant_subdirs = []
                 for subdir in source_file.parent.iterdir():
                     if subdir.is_dir() and subdir.name not in DEFAULT_IGNORE_DIRS:
                         extra_args.append(f"--include-data-dir={subdir}="
@@ -150,6 +153,25 @@ class Nuitka:
             # These files are not relevant for PySide6 applications
             qml_args.append("--noinclude-dlls=*/qml/QtQuickEffectMaker/*")
 
+        # Binary resource files are registered by the generated rc_<name>.py modules, relative
+        # to their location. They are placed relative to the main file or, outside of its
+        # directory, relative to the project directory.
+        if resource_files:
+            roots = [source_file.resolve().parent]
+            if project_dir:
+                roots.append(project_dir.resolve())
+            for rcc_file in resource_files:
+                if any(subdir in rcc_file.parents for subdir in all_relevant_subdirs):
+                    continue
+                rcc_file = rcc_file.resolve()
+                root = next((root for root in roots if rcc_file.is_relative_to(root)), None)
+                if root is None:
+                    logging.warning(f"[DEPLOY] Skipping the binary resource file {rcc_file}, "
+                                    "which is outside of the project directory")
+                    continue
+                qml_args.append(
+                    f"--include-data-files={rcc_file}=./{rcc_file.relative_to(root)}")
+
         # Exclude files that cannot be processed by Nuitka
         for file in self.files_to_ignore:
             extra_args.append(f"--noinclude-dlls=*{file}")
@@ -13,12 +13,24 @@ Deploys the application by creating an executable for the corresponding platform
 For each entry in a '.pyproject' file:
 - <name>.pyproject: Recurse to handle subproject
 - <name>.qrc      : Runs the resource compiler to create a file rc_<name>.py
+                    (with --binary-resources, a binary resource file <name>.rcc
+                    and a module rc_<name>.py registering it)
 - <name>.ui       : Runs the user interface compiler to create a file ui_<name>.py
 
+The user interface and resource compilers are run directly (see
+pyside_tool.uic_command()), not via the pyside6-uic/pyside6-rcc wrappers,
+which would start a Python interpreter for each file.
+
 For a Python file declaring a QML module, a directory matching the URI is
 created and populated with .qmltypes and qmldir files for use by code analysis
 tools. Currently, only one QML module consisting of several classes can be
 handled per project file.
+
+The artifacts are built along a graph of their dependencies (for example,
+.py -> metatypes.json -> .qmltypes, or a .qrc file listing generated files),
+so that with --jobs, independent tools run in parallel. A build database
+(see BuildDatabase) records the content hashes of the inputs of each artifact,
+so that only the tools whose inputs changed are run again.
 """
 import sys
 import os
@@ -30,10 +42,13 @@ from project import (QmlProjectData, check_qml_decorators, is_python_file,
                      SHADER_SUFFIXES, TRANSLATION_SUFFIX,
                      requires_rebuild, run_command, remove_path,
                      ProjectData, resolve_project_file, new_project,
-                     ProjectType, ClOptions)
+                     ProjectType, ClOptions, BuildStep, run_build_steps,
+                     qrc_file_list, write_resource_loader, BuildDatabase)
+from pyside_tool import uic_command, rcc_command
 
 MODE_HELP = """build    Builds the project
 run        Builds the project and runs the first file")
+watch      Builds the project and rebuilds artifacts when files change
 clean      Cleans the build artifacts")
 qmllint    Runs the qmllint tool
 deploy     Deploys the application
@@ -43,8 +58,6 @@ new-widget Creates a new QtWidgets project with a main window
 new-quick  Creates a new QtQuick project
 """
 
-UIC_CMD = "pyside6-uic"
-RCC_CMD = "pyside6-rcc"
 LRELEASE_CMD = "pyside6-lrelease"
 LUPDATE_CMD = "pyside6-lupdate"
 QMLTYPEREGISTRAR_CMD = "pyside6-qmltyperegistrar"
@@ -74,6 +87,7 @@ class Project:
     def __init__(self, project_file: Path):
         self.project = ProjectData(project_file=project_file)
         self.cl_options = ClOptions()
+        self._build_database = BuildDatabase(project_file)
 
         # Files for QML modules using the QmlElement decorators
         self._qml_module_sources: list[Path] = []
@@ -117,10 +131,14 @@ class Project:
         """Return path and command for a file's artifact"""
         if file.suffix == ".ui":  # Qt form files
             py_file = f"{file.parent}/ui_{file.stem}.py"
-            return ([Path(py_file)], [UIC_CMD, os.fspath(file), "--rc-prefix", "-o", py_file])
+            return ([Path(py_file)], uic_command(file, py_file, ["--rc-prefix"]))
         if file.suffix == ".qrc":  # Qt resources
             py_file = f"{file.parent}/rc_{file.stem}.py"
-            return ([Path(py_file)], [RCC_CMD, os.fspath(file), "-o", py_file])
+            if self.cl_options.binary_resources:
+                # Binary resource file loaded by rc_<name>.py, see _build_artifacts()
+                rcc_file = f"{file.parent}/{file.stem}.rcc"
+                return ([Path(rcc_file), Path(py_file)], rcc_command(file, rcc_file, binary=True))
+            return ([Path(py_file)], rcc_command(file, py_file))
         # generate .qmltypes from sources with Qml decorators
         if file.suffix == ".py" and file in self._qml_module_sources:
             assert self._qml_module_dir
@@ -161,23 +179,96 @@ class Project:
                 for f in self._qml_module_dir.glob("*.qmltypes"):
                     qf.write(f"typeinfo {f.name}\n")
 
+    def _build_inputs(self, source: Path) -> list[Path]:
+        """Return the files the artifacts of a file are built from."""
+        if source.suffix == ".qrc":
+            listed = qrc_file_list(source)
+            if listed:
+                return [source] + listed
+        return [source]
+
+    def _build_artifacts(self, source: Path) -> list[Path]:
+        """Build the artifacts of a file (not recursing) and return them."""
+        artifacts, command = self._get_artifacts(source)
+        if not artifacts:
+            return artifacts
+        inputs = self._build_inputs(source)
+        if self.cl_options.force or self._build_database.requires_rebuild(source, artifacts,
+                                                                          command, inputs):
+            run_command(command, cwd=self.project.project_file.parent)
+            if source.suffix == ".qrc":
+                if not self.cl_options.binary_resources:
+                    # Remove a binary resource file of a previous build, which
+                    # pyside6-deploy would otherwise ship.
+                    remove_path(source.with_suffix(".rcc"))
+                elif not self.cl_options.dry_run:
+                    rcc_file, py_file = artifacts
+                    write_resource_loader(py_file, rcc_file)
+            if not self.cl_options.dry_run:
+                self._build_database.record(source, artifacts, command, inputs)
+        return artifacts
+
     def _build_file(self, source: Path):
         """Build an artifact."""
-        artifacts, command = self._get_artifacts(source)
-        for artifact in artifacts:
-            if self.cl_options.force or requires_rebuild([source], artifact):
-                run_command(command, cwd=self.project.project_file.parent)
+        for artifact in self._build_artifacts(source):
             self._build_file(artifact)  # Recurse for QML (json->qmltypes)
 
-    def build(self):
-        """Build."""
+    def _build_steps(self, databases: list[BuildDatabase]) -> list[BuildStep]:
+        """Return the graph of the build steps of the project and its
+        sub-projects, adding their build databases to the list."""
+        databases.append(self._build_database)
+        steps: list[BuildStep] = []
         for sub_project_file in self.project.sub_projects_files:
-            Project(project_file=sub_project_file).build()
+            steps.extend(Project(project_file=sub_project_file)._build_steps(databases))
         if self._qml_module_dir:
             self._qml_module_dir.mkdir(exist_ok=True, parents=True)
+
+        producers: dict[Path, BuildStep] = {}  # artifact -> step building it
+        project_steps: list[BuildStep] = []
+
+        def add_step(source: Path, dependencies: list[BuildStep]):
+            artifacts, _ = self._get_artifacts(source)
+            if not artifacts:
+                return
+            step = BuildStep(source, lambda: self._build_artifacts(source), dependencies)
+            project_steps.append(step)
+            for artifact in artifacts:
+                producers[artifact.resolve()] = step
+                add_step(artifact, [step])  # Recurse for QML (json->qmltypes)
+
+        qrc_files = []
         for file in _sort_sources(self.project.files):
-            self._build_file(file)
-        self._regenerate_qmldir()
+            if file.suffix == ".qrc":
+                qrc_files.append(file)
+            else:
+                add_step(file, [])
+        # .qrc files might list generated files (.qm, .qsb)
+        other_steps = list(project_steps)
+        for file in qrc_files:
+            listed = qrc_file_list(file)
+            if listed is None:
+                dependencies = other_steps
+            else:
+                dependencies = [producers[f.resolve()] for f in listed
+                                if f.resolve() in producers]
+            add_step(file, dependencies)
+
+        steps.extend(project_steps)
+        if self._qml_dir_file:
+            steps.append(BuildStep(self._qml_dir_file, self._regenerate_qmldir, project_steps))
+        return steps
+
+    def build(self):
+        """Build."""
+        databases: list[BuildDatabase] = []
+        steps = self._build_steps(databases)
+        try:
+            run_build_steps(steps, self.cl_options.jobs)
+        finally:
+            # Keep what was built before a failure
+            if not self.cl_options.dry_run:
+                for database in databases:
+                    database.save()
 
     def run(self):
         """Runs the project"""
@@ -185,9 +276,84 @@ class Project:
         cmd = [sys.executable, str(self.project.main_file)]
         run_command(cmd, cwd=self.project.project_file.parent)
 
+    def _all_projects(self) -> list[Project]:
+        """Return the project and its sub-projects."""
+        result = [self]
+        for sub_project_file in self.project.sub_projects_files:
+            result.extend(Project(project_file=sub_project_file)._all_projects())
+        return result
+
+    def _try_build(self, function, *args) -> bool:
+        """Helper for watch(): a failing tool must not stop watching."""
+        try:
+            function(*args)
+        except SystemExit as e:
+            print(f"Build failed ({e.code})", file=sys.stderr)
+            return False
+        return True
+
+    def watch(self, restart: bool = False):
+        """Builds the project, then watches its files and rebuilds the
+        artifacts depending on the files that changed. Optionally, runs the
+        main file and restarts it after each change."""
+        from project.watcher import FileWatcher, RestartableProcess
+
+        self._try_build(self.build)
+        # Map the inputs of the artifacts to the (project, source) building them.
+        dependents: dict[Path, list[tuple[Project, Path]]] = {}
+        generated: set[Path] = set()
+        watched: set[Path] = set()
+        for project in self._all_projects():
+            for file in project.project.files:
+                watched.add(file.resolve())
+                artifacts, _ = project._get_artifacts(file)
+                if not artifacts:
+                    continue
+                generated.update(a.resolve() for a in artifacts)
+                for path in project._build_inputs(file):
+                    dependents.setdefault(path.resolve(), []).append((project, file))
+        watched.update(p for p in dependents if p not in generated)
+
+        process = None
+        if restart:
+            process = RestartableProcess([sys.executable, os.fspath(self.project.main_file)],
+                                         self.project.project_file.parent)
+            process.restart()
+
+        def changed(paths: set[Path]):
+            if not self.cl_options.quiet:
+                print("Changed: " + ", ".join(p.name for p in sorted(paths)))
+            # Follow generated files to the files listing them (.qm -> .qrc).
+            queue = [p.resolve() for p in paths]
+            built: set[tuple[int, Path]] = set()
+            projects = {}
+            while queue:
+                path = queue.pop(0)
+                for project, source in dependents.get(path, []):
+                    if (id(project), source) in built:
+                        continue
+                    built.add((id(project), source))
+                    projects[id(project)] = project
+                    if project._try_build(project._build_file, source):
+                        queue.extend(a.resolve() for a in project._get_artifacts(source)[0])
+            for project in projects.values():
+                project._try_build(project._regenerate_qmldir)
+                if not self.cl_options.dry_run:
+                    project._build_database.save()
+            if process:
+                process.restart()
+
+        watcher = FileWatcher(sorted(watched), changed)
+        if not self.cl_options.quiet:
+            print(f"Watching {len(watched)} file(s), press Ctrl+C to stop")
+        watcher.exec()
+
     def _clean_file(self, source: Path):
         """Clean an artifact."""
         artifacts, command = self._get_artifacts(source)
+        if source.suffix == ".qrc" and not self.cl_options.binary_resources:
+            # Built with or without --binary-resources
+            artifacts.append(source.with_suffix(".rcc"))
         for artifact in artifacts:
             remove_path(artifact)
             self._clean_file(artifact)  # Recurse for QML (json->qmltypes)
@@ -198,6 +364,7 @@ class Project:
             Project(project_file=sub_project_file).clean()
         for file in self.project.files:
             self._clean_file(file)
+        remove_path(self._build_database.path)
         if self._qml_module_dir and self._qml_module_dir.is_dir():
             remove_path(self._qml_module_dir)
             # In case of a dir hierarchy ("a.b" -> a/b), determine and delete
@@ -260,7 +427,15 @@ if __name__ == "__main__":
     parser.add_argument("--force", "-f", action="store_true", help="Force rebuild")
     parser.add_argument("--qml-module", "-Q", action="store_true",
                         help="Perform check for QML module")
-    mode_choices = ["build", "run", "clean", "qmllint", "deploy", "lupdate"]
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="Number of tools to run in parallel (default: 1, "
+                             "0: number of CPUs)")
+    parser.add_argument("--restart", "-r", action="store_true",
+                        help="watch: Run the main file and restart it after changes")
+    parser.add_argument("--binary-resources", action="store_true",
+                        help="Compile .qrc files to binary .rcc files, which are memory-mapped "
+                             "when imported")
+    mode_choices = ["build", "run", "watch", "clean", "qmllint", "deploy", "lupdate"]
     mode_choices.extend(NEW_PROJECT_TYPES.keys())
     parser.add_argument("mode", choices=mode_choices, default="build",
                         type=str, help=MODE_HELP)
@@ -268,7 +443,9 @@ if __name__ == "__main__":
 
     options = parser.parse_args()
     cl_options = ClOptions(dry_run=options.dry_run, quiet=options.quiet, force=options.force,
-                           qml_module=options.qml_module)
+                           qml_module=options.qml_module,
+                           jobs=options.jobs or os.cpu_count() or 1,
+                           binary_resources=options.binary_resources)
 
     mode = options.mode
 
@@ -288,6 +465,8 @@ if __name__ == "__main__":
         project.build()
     elif mode == "run":
         project.run()
+    elif mode == "watch":
+        project.watch(restart=options.restart)
     elif mode == "clean":
         project.clean()
     elif mode == "qmllint":
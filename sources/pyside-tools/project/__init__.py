@@ -38,10 +38,15 @@ class ClOptions(metaclass=Singleton):
     quiet: bool
     force: bool
     qml_module: bool
+    jobs: int = 1
+    binary_resources: bool = False
 
 
 from .utils import (run_command, requires_rebuild, remove_path, package_dir, qtpaths,
-                    qt_metatype_json_dir, resolve_project_file)
+                    qt_metatype_json_dir, resolve_project_file, qrc_file_list,
+                    write_resource_loader)
+from .build_graph import BuildStep, run_build_steps
+from .build_database import BuildDatabase
 from .project_data import (is_python_file, ProjectData, QmlProjectData,
                            check_qml_decorators)
 from .newproject import new_project, ProjectType
@@ -0,0 +1,148 @@
+# Copyright (C) 2024 The Qt Company Ltd.
+# SPDX-License-Identifier: LicenseRef-Qt-Commercial OR LGPL-3.0-only OR GPL-2.0-only OR GPL-3.0-only
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+
+BUILD_DATABASE_VERSION = 1
+
+_tool_version: str | None = None
+
+
+def tool_version() -> str:
+    """Return the version of the tools, which are those of PySide6."""
+    global _tool_version
+    if _tool_version is None:
+        try:
+            from PySide6 import __version__ as version
+            _tool_version = version
+        except ImportError:
+            _tool_version = ""
+    return _tool_version
+
+
+def _hash_file(path: Path) -> str:
+    hasher = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+class BuildDatabase:
+    """
+    The build database of a project, stored next to the project file. For
+    each source, it records the command line and the tool version used to
+    build its artifacts, and the content hashes of the inputs (the source
+    and, for .qrc files, the files listed in it). Artifacts are only
+    rebuilt when one of these changes, not when a file is merely touched,
+    and a checkout or a restored cache does not rebuild everything.
+
+    The modification time and size of an input are recorded with its hash,
+    so that unchanged files do not need to be hashed again.
+    """
+
+    def __init__(self, project_file: Path):
+        self.path = project_file.parent / f".{project_file.stem}.build.json"
+        self._root = project_file.parent
+        self._entries: dict[str, dict] | None = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def _key(self, path: Path) -> str:
+        """Return a path relative to the project directory where possible,
+        so that the database survives moving the project."""
+        try:
+            return Path(path).relative_to(self._root).as_posix()
+        except ValueError:
+            return os.fspath(path)
+
+    def _portable_command(self, command: list[str]) -> list[str]:
+        return [self._key(Path(arg)) if os.path.isabs(arg) else arg for arg in command]
+
+    def _load(self) -> dict[str, dict]:
+        if self._entries is None:
+            entries = {}
+            try:
+                with self.path.open(encoding="utf-8") as f:
+                    data = json.load(f)
+                if data.get("version") == BUILD_DATABASE_VERSION:
+                    entries = data["entries"]
+            except (OSError, ValueError, KeyError, AttributeError):
+                pass
+            self._entries = entries
+        return self._entries
+
+    @staticmethod
+    def _input_state(path: Path, recorded: list | None) -> list | None:
+        """Return [mtime_ns, size, hash] of an input, or None if it does not
+        exist or cannot be read, which causes a rebuild. The hash is only
+        computed when the file was touched."""
+        try:
+            st = path.stat()
+            if recorded and recorded[0] == st.st_mtime_ns and recorded[1] == st.st_size:
+                return recorded
+            return [st.st_mtime_ns, st.st_size, _hash_file(path)]
+        except OSError:
+            return None
+
+    def requires_rebuild(self, source: Path, artifacts: list[Path], command: list[str],
+                         inputs: list[Path]) -> bool:
+        """Returns whether the artifacts of source need to be rebuilt."""
+        with self._lock:
+            entry = self._load().get(self._key(source))
+        if (entry is None or entry["command"] != self._portable_command(command)
+                or entry["tool_version"] != tool_version()
+                or not all(artifact.is_file() for artifact in artifacts)):
+            return True
+        recorded_inputs = entry["inputs"]
+        if set(recorded_inputs) != {self._key(i) for i in inputs}:
+            return True
+        for path in inputs:
+            key = self._key(path)
+            recorded = recorded_inputs[key]
+            state = self._input_state(path, recorded)
+            if state is None or state[2] != recorded[2]:
+                return True
+            if state is not recorded:
+                # Touched, but unchanged: remember the new time stamp.
+                with self._lock:
+                    recorded_inputs[key] = state
+                    self._dirty = True
+        return False
+
+    def record(self, source: Path, artifacts: list[Path], command: list[str],
+               inputs: list[Path]):
+        """Record a successful build of the artifacts of source."""
+        states = {}
+        for path in inputs:
+            state = self._input_state(path, None)
+            if state is not None:
+                states[self._key(path)] = state
+        with self._lock:
+            self._load()[self._key(source)] = {
+                "command": self._portable_command(command),
+                "tool_version": tool_version(),
+                "artifacts": [self._key(a) for a in artifacts],
+                "inputs": states,
+            }
+            self._dirty = True
+
+    def save(self):
+        """Write the database if it changed."""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {"version": BUILD_DATABASE_VERSION, "entries": self._entries}
+            tmp_path = self.path.with_suffix(".tmp")
+            try:
+                with tmp_path.open("w", encoding="utf-8") as f:
+                    json.dump(data, f, indent=1, sort_keys=True)
+                os.replace(tmp_path, self.path)
+            except OSError as e:
+                print(f"Unable to write the build database {self.path}: {e}")
+            self._dirty = False
@@ -0,0 +1,69 @@
+# Copyright (C) 2024 The Qt Company Ltd.
+# SPDX-License-Identifier: LicenseRef-Qt-Commercial OR LGPL-3.0-only OR GPL-2.0-only OR GPL-3.0-only
+from __future__ import annotations
+
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+
+
+@dataclass(eq=False)
+class BuildStep:
+    """
+    A node of the build graph: an action building the artifacts of a source
+    file, which runs when all the steps it depends on are done. Steps are
+    compared by identity.
+    """
+    source: Path
+    action: Callable[[], None]
+    dependencies: list[BuildStep] = field(default_factory=list)
+
+
+def _sort_steps(steps: list[BuildStep]) -> list[BuildStep]:
+    """Sort the steps topologically, keeping the given order where possible."""
+    result: list[BuildStep] = []
+    visited: set[BuildStep] = set()
+
+    def visit(step: BuildStep):
+        if step in visited:
+            return
+        visited.add(step)
+        for dependency in step.dependencies:
+            visit(dependency)
+        result.append(step)
+
+    for step in steps:
+        visit(step)
+    return result
+
+
+def run_build_steps(steps: list[BuildStep], jobs: int = 1):
+    """Run the build steps in the order of their dependencies, up to 'jobs'
+       steps in parallel. The tools run in subprocesses, so threads suffice."""
+    steps = _sort_steps(steps)
+    if jobs <= 1 or len(steps) <= 1:
+        for step in steps:
+            step.action()
+        return
+
+    remaining = {step: len(set(step.dependencies)) for step in steps}
+    dependents: dict[BuildStep, list[BuildStep]] = {step: [] for step in steps}
+    for step in steps:
+        for dependency in set(step.dependencies):
+            dependents[dependency].append(step)
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        running = {executor.submit(step.action): step
+                   for step in steps if not remaining[step]}
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                step = running.pop(future)
+                # A failing tool exits (see run_command()), which is re-raised
+                # here. The steps that are still running are completed.
+                future.result()
+                for dependent in dependents[step]:
+                    remaining[dependent] -= 1
+                    if not remaining[dependent]:
+                        running[executor.submit(dependent.action)] = dependent
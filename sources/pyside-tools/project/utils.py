@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import sys
 import subprocess
+import xml.etree.ElementTree as ET
 from pathlib import Path
 
 from . import QTPATHS_CMD, PROJECT_FILE_SUFFIX, ClOptions
@@ -31,6 +32,60 @@ def requires_rebuild(sources: list[Path], artifact: Path) -> bool:
     return False
 
 
+def qrc_file_list(qrc_file: Path) -> list[Path] | None:
+    """Return the files listed in a .qrc file, or None if it cannot be parsed.
+       Like rcc, listed directories are expanded to the files they contain."""
+    try:
+        root = ET.parse(qrc_file).getroot()
+    except (OSError, ET.ParseError):
+        return None
+    result = []
+    for f in root.iter("file"):
+        if not f.text:
+            continue
+        path = qrc_file.parent / f.text.strip()
+        if path.is_dir():
+            result.extend(sorted(p for p in path.rglob("*") if p.is_file()))
+        else:
+            result.append(path)
+    return result
+
+
+RESOURCE_LOADER_TEMPLATE = """# Resource object code (Python 3)
+# Created by: pyside6-project
+#
+# Registers the binary resource file {rcc_file}, which Qt maps into memory
+# instead of keeping a copy of the resources in Python byte literals.
+#
+# WARNING! All changes made in this file will be lost!
+
+import os
+
+from PySide6.QtCore import QResource
+
+_rcc_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "{rcc_file}")
+
+
+def qInitResources():
+    if not QResource.registerResource(_rcc_file):
+        raise ImportError(f"Unable to register the resource file {{_rcc_file}}")
+
+
+def qCleanupResources():
+    QResource.unregisterResource(_rcc_file)
+
+
+qInitResources()
+"""
+
+
+def write_resource_loader(py_file: Path, rcc_file: Path):
+    """Write a module loading a binary resource file, which replaces the
+    module generated by rcc. rcc_file needs to be in the same directory."""
+    py_file.write_text(RESOURCE_LOADER_TEMPLATE.format(rcc_file=rcc_file.name),
+                       encoding="utf-8")
+
+
 def _remove_path_recursion(path: Path):
     """Recursion to remove a file or directory."""
     if path.is_file():
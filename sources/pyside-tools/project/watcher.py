@@ -0,0 +1,89 @@
+# Copyright (C) 2024 The Qt Company Ltd.
+# SPDX-License-Identifier: LicenseRef-Qt-Commercial OR LGPL-3.0-only OR GPL-2.0-only OR GPL-3.0-only
+from __future__ import annotations
+
+import os
+import signal
+import sys
+from collections.abc import Callable
+from pathlib import Path
+
+from PySide6.QtCore import QCoreApplication, QFileSystemWatcher, QProcess, QTimer
+
+# Editors save files in several steps, wait until the changes settled.
+SETTLE_DELAY_MS = 150
+
+
+class FileWatcher:
+    """
+    Watches files by QFileSystemWatcher and passes the set of changed files
+    to a callback once the changes settled. Files that are replaced (saved
+    by renaming) or removed and created again are noticed by watching their
+    directories.
+    """
+
+    def __init__(self, files: list[Path], callback: Callable[[set[Path]], None]):
+        self._app = QCoreApplication.instance() or QCoreApplication(sys.argv[:1])
+        self._files = {os.fspath(f) for f in files}
+        self._callback = callback
+        self._changed: set[Path] = set()
+        self._timer = QTimer(singleShot=True, interval=SETTLE_DELAY_MS)
+        self._timer.timeout.connect(self._notify)
+        self._watcher = QFileSystemWatcher()
+        self._watcher.fileChanged.connect(self._file_changed)
+        self._watcher.directoryChanged.connect(self._directory_changed)
+        self._watch()
+
+    def _watch(self):
+        """(Re-)add the files which exist and are not watched."""
+        watched = set(self._watcher.files())
+        files = [f for f in self._files if f not in watched and os.path.isfile(f)]
+        if files:
+            self._watcher.addPaths(files)
+        directories = ({os.path.dirname(f) for f in self._files}
+                       - set(self._watcher.directories()))
+        if directories:
+            self._watcher.addPaths(list(directories))
+
+    def _file_changed(self, path: str):
+        self._changed.add(Path(path))
+        self._timer.start()
+
+    def _directory_changed(self, directory: str):
+        watched = set(self._watcher.files())
+        for f in self._files:
+            if f not in watched and os.path.dirname(f) == directory and os.path.isfile(f):
+                self._changed.add(Path(f))
+                self._timer.start()
+
+    def _notify(self):
+        self._watch()
+        changed, self._changed = self._changed, set()
+        if changed:
+            self._callback(changed)
+
+    def exec(self) -> int:
+        """Run until interrupted."""
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        return self._app.exec()
+
+
+class RestartableProcess:
+    """Runs a command whose output is forwarded, and restarts it on request."""
+
+    def __init__(self, command: list[str], cwd: Path):
+        self._process = QProcess()
+        self._process.setProcessChannelMode(QProcess.ProcessChannelMode.ForwardedChannels)
+        self._process.setProgram(command[0])
+        self._process.setArguments(command[1:])
+        self._process.setWorkingDirectory(os.fspath(cwd))
+        self._command = command
+
+    def restart(self):
+        if self._process.state() != QProcess.ProcessState.NotRunning:
+            self._process.terminate()
+            if not self._process.waitForFinished(3000):
+                self._process.kill()
+                self._process.waitForFinished()
+        print(" ".join(self._command))
+        self._process.start()
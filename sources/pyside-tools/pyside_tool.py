@@ -8,6 +8,8 @@ import os
 import subprocess
 import sys
 import sysconfig
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import PySide6 as ref_mod
@@ -47,16 +49,18 @@ def main():
     sys.exit(subprocess.call(command))
 
 
-def qt_tool_wrapper(qt_tool, args, libexec=False):
-    # Taking care of pyside6-uic, pyside6-rcc, and pyside6-designer
-    # listed as an entrypoint in setup.py
+def qt_tool_path(qt_tool, libexec=False):
+    """Return the path of a Qt tool shipped with PySide."""
     pyside_dir = Path(ref_mod.__file__).resolve().parent
     if libexec and sys.platform != "win32":
-        exe = pyside_dir / 'Qt' / 'libexec' / qt_tool
-    else:
-        exe = pyside_dir / qt_tool
+        return pyside_dir / 'Qt' / 'libexec' / qt_tool
+    return pyside_dir / qt_tool
+
 
-    cmd = [os.fspath(exe)] + args
+def qt_tool_wrapper(qt_tool, args, libexec=False):
+    # Taking care of pyside6-uic, pyside6-rcc, and pyside6-designer
+    # listed as an entrypoint in setup.py
+    cmd = [os.fspath(qt_tool_path(qt_tool, libexec))] + args
     returncode = subprocess.call(cmd)
     if returncode != 0:
         command = ' '.join(cmd)
@@ -100,6 +104,80 @@ def rcc():
     qt_tool_wrapper("rcc", args, True)
 
 
+def uic_command(ui_file, py_file, args=None):
+    """Return the command line compiling a Qt Designer form to Python,
+       running uic directly instead of the pyside6-uic wrapper."""
+    cmd = [os.fspath(qt_tool_path("uic", True)), "-g", "python", os.fspath(ui_file)]
+    if args:
+        cmd.extend(args)
+    cmd.extend(["-o", os.fspath(py_file)])
+    return cmd
+
+
+def rcc_command(qrc_file, output_file, args=None, binary=False):
+    """Return the command line compiling a resource file to Python (or to a
+       binary .rcc file to be registered by QResource.registerResource()),
+       running rcc directly instead of the pyside6-rcc wrapper."""
+    cmd = [os.fspath(qt_tool_path("rcc", True))]
+    cmd.extend(["--binary"] if binary else ["-g", "python"])
+    cmd.append(os.fspath(qrc_file))
+    if args:
+        cmd.extend(args)
+    cmd.extend(["-o", os.fspath(output_file)])
+    return cmd
+
+
+def run_tool_commands(commands, jobs=None, cwd=None):
+    """Run the commands of Qt tools, up to 'jobs' of them in parallel
+       (default: the number of CPUs), and return their exit codes.
+       The tools run in subprocesses, so threads suffice."""
+    def call(cmd):
+        return subprocess.call(cmd, cwd=cwd)
+
+    jobs = jobs or os.cpu_count() or 1
+    if jobs <= 1 or len(commands) <= 1:
+        return [call(cmd) for cmd in commands]
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        return list(executor.map(call, commands))
+
+
+def _batch_outputs(files, prefix, suffix=".py"):
+    """Helper for the batch functions: Return a dict of source file to
+       output file, which is <prefix><name><suffix> next to the source
+       unless a dict is passed."""
+    if isinstance(files, Mapping):
+        return {Path(source): Path(output) for source, output in files.items()}
+    return {Path(source): Path(source).parent / f"{prefix}{Path(source).stem}{suffix}"
+            for source in files}
+
+
+def compile_ui_files(files, args=None, jobs=None):
+    """Compile Qt Designer forms to Python in one call from Python, without
+       launching a Python process per form as calling pyside6-uic does.
+
+       files is a list of .ui files, compiled to ui_<name>.py next to them,
+       or a dict of .ui file to output file; args are additional uic
+       options (for example, "--rc-prefix"). Returns a dict of .ui file
+       to the exit code of uic."""
+    outputs = _batch_outputs(files, "ui_")
+    commands = [uic_command(source, output, args) for source, output in outputs.items()]
+    return dict(zip(outputs.keys(), run_tool_commands(commands, jobs)))
+
+
+def compile_resource_files(files, args=None, jobs=None, binary=False):
+    """Compile resource files to Python in one call from Python, without
+       launching a Python process per file as calling pyside6-rcc does.
+
+       files is a list of .qrc files, compiled to rc_<name>.py next to them
+       (<name>.rcc if binary is set), or a dict of .qrc file to output file;
+       args are additional rcc options. Returns a dict of .qrc file to the
+       exit code of rcc."""
+    outputs = _batch_outputs(files, "", ".rcc") if binary else _batch_outputs(files, "rc_")
+    commands = [rcc_command(source, output, args, binary)
+                for source, output in outputs.items()]
+    return dict(zip(outputs.keys(), run_tool_commands(commands, jobs)))
+
+
 def qmltyperegistrar():
     qt_tool_wrapper("qmltyperegistrar", sys.argv[1:], True)
 
@@ -5,6 +5,7 @@ from __future__ import annotations
 from .events import (
     QAsyncioEventLoopPolicy, QAsyncioEventLoop, QAsyncioHandle, QAsyncioTimerHandle
 )
+from .executors import QAsyncioThreadPoolExecutor
 from .futures import QAsyncioFuture
 from .tasks import QAsyncioTask
 
@@ -15,7 +16,7 @@ import asyncio
 __all__ = [
     "QAsyncioEventLoopPolicy", "QAsyncioEventLoop",
     "QAsyncioHandle", "QAsyncioTimerHandle",
-    "QAsyncioFuture", "QAsyncioTask"
+    "QAsyncioFuture", "QAsyncioTask", "QAsyncioThreadPoolExecutor"
 ]
 
 
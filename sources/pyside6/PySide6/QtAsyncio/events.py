@@ -2,23 +2,30 @@
 # SPDX-License-Identifier: LicenseRef-Qt-Commercial OR LGPL-3.0-only OR GPL-2.0-only OR GPL-3.0-only
 from __future__ import annotations
 
-from PySide6.QtCore import (QCoreApplication, QDateTime, QDeadlineTimer,
-                            QEventLoop, QObject, QTimer, QThread, Slot)
+from PySide6.QtCore import (Qt, QCoreApplication, QDeadlineTimer, QEventLoop,
+                            QObject, QSocketNotifier, QTimer, QThread, Signal, Slot)
+from shiboken6 import Shiboken
 
+from . import executors
 from . import futures
 from . import tasks
 
 from typing import Any, Callable
 
 import asyncio
+import bisect
 import collections.abc
 import concurrent.futures
 import contextvars
-import enum
+import heapq
+import itertools
+import math
 import os
 import signal
 import socket
 import subprocess
+import threading
+import time
 import warnings
 
 __all__ = [
@@ -26,6 +33,22 @@ __all__ = [
     "QAsyncioHandle", "QAsyncioTimerHandle",
 ]
 
+# Minimum number of scheduled timer handles before the heap is compacted.
+_MIN_SCHEDULED_TIMER_HANDLES = 100
+
+# Minimum fraction of cancelled timer handles in the heap before it is
+# compacted.
+_MIN_CANCELLED_TIMER_HANDLES_FRACTION = 0.5
+
+# Delays (in seconds) below which the timer of the event loop is a precise
+# timer instead of a coarse timer. Coarse timers can fire up to 5% of their
+# interval early or late, which is only acceptable for longer delays.
+_PRECISE_TIMER_THRESHOLD = 0.5
+
+# The upper bounds (in seconds) of the buckets of the latency histograms that
+# are recorded in debug mode. The last bucket holds all longer latencies.
+_LATENCY_HISTOGRAM_BOUNDS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0)
+
 
 class QAsyncioExecutorWrapper(QObject):
     """
@@ -79,6 +102,36 @@ class QAsyncioExecutorWrapper(QObject):
         self._loop.exit()
 
 
+class _LatencyHistogram():
+    """
+    A histogram of latencies (in seconds), e.g., the execution times of
+    callbacks, with the buckets given by _LATENCY_HISTOGRAM_BOUNDS.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(_LATENCY_HISTOGRAM_BOUNDS) + 1)
+
+    def record(self, latency: float) -> None:
+        self.count += 1
+        self.total += latency
+        if latency > self.max:
+            self.max = latency
+        self.buckets[bisect.bisect_left(_LATENCY_HISTOGRAM_BOUNDS, latency)] += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        bounds = _LATENCY_HISTOGRAM_BOUNDS + (math.inf,)
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.total / self.count if self.count else 0.0,
+            "max": self.max,
+            "buckets": dict(zip(bounds, self.buckets)),
+        }
+
+
 class QAsyncioEventLoopPolicy(asyncio.AbstractEventLoopPolicy):
     """
     Event loop policies are expected to be deprecated with Python 3.13, with
@@ -136,10 +189,9 @@ class QAsyncioEventLoop(asyncio.BaseEventLoop, QObject):
     class ShutDownThread(QThread):
         """
         Used to shut down the default executor when calling
-        shutdown_default_executor(). As the executor is a ThreadPoolExecutor,
-        it must be shut down in a separate thread as all the threads from the
-        thread pool must join, which we want to do without blocking the event
-        loop.
+        shutdown_default_executor(). The executor must be shut down in a
+        separate thread as it waits for all the calls that are still running,
+        which we want to do without blocking the event loop.
         """
 
         def __init__(self, future: futures.QAsyncioFuture, loop: "QAsyncioEventLoop") -> None:
@@ -160,6 +212,11 @@ class QAsyncioEventLoop(asyncio.BaseEventLoop, QObject):
                 if not self._loop.is_closed():
                     self._loop.call_soon_threadsafe(self._future.set_exception, e)
 
+    # Emitted from the threads of a QAsyncioThreadPoolExecutor with a future
+    # of run_in_executor() and the result or exception of its call. The signal
+    # is queued to the thread of the loop, where the future is completed.
+    _executor_call_done = Signal(object, object, object)
+
     def __init__(self,
                  application: QCoreApplication, quit_qapp: bool = True) -> None:
         asyncio.BaseEventLoop.__init__(self)
@@ -175,9 +232,38 @@ class QAsyncioEventLoop(asyncio.BaseEventLoop, QObject):
         self._quit_qapp = quit_qapp
 
         self._thread = QThread.currentThread()
+        self._thread_id = threading.get_ident()
 
         self._closed = False
 
+        # The ready queue holds the handles whose callbacks are to be executed
+        # in the next iteration of the event loop. Instead of posting one event
+        # per handle into the Qt event loop, a single event is posted that
+        # drains the whole queue (see _run_ready()), similar to what
+        # asyncio.BaseEventLoop._run_once() does.
+        self._ready: collections.deque[QAsyncioHandle] = collections.deque()
+        self._ready_scheduled = False
+
+        # The handles scheduled with call_later() and call_at() are kept in a
+        # heap ordered by their due time (and by their insertion order for
+        # equal due times). A single timer is re-armed for the earliest due
+        # handle, instead of creating one timer per handle. Cancelled handles
+        # are removed lazily, see _timer_handle_cancelled().
+        self._scheduled: list[tuple[float, int, QAsyncioTimerHandle]] = []
+        self._scheduled_counter = itertools.count()
+        self._timer_cancelled_count = 0
+
+        # The file descriptors watched with add_reader() and add_writer(),
+        # mapped to the socket notifier watching the file descriptor and the
+        # handle of the callback to be called when the file descriptor is
+        # ready.
+        self._readers: dict[int, tuple[QSocketNotifier, asyncio.Handle]] = {}
+        self._writers: dict[int, tuple[QSocketNotifier, asyncio.Handle]] = {}
+
+        # The transports that are currently connected. The signals of their
+        # sockets do not keep them alive, so the loop has to.
+        self._transports: set[asyncio.Transport] = set()
+
         # These two flags are used to determine whether the loop was stopped
         # from inside the loop (i.e., coroutine or callback called stop()) or
         # from outside the loop (i.e., the QApplication is being shut down, for
@@ -192,9 +278,14 @@ class QAsyncioEventLoop(asyncio.BaseEventLoop, QObject):
         # A set of all asynchronous generators that are currently running.
         self._asyncgens: set[collections.abc.AsyncGenerator] = set()
 
-        # Starting with Python 3.11, this must be an instance of
-        # ThreadPoolExecutor.
-        self._default_executor = concurrent.futures.ThreadPoolExecutor()
+        # The default executor runs the calls on the global QThreadPool, which
+        # avoids a second thread pool besides the one of Qt. Alternatively, a
+        # ThreadPoolExecutor can be set with set_default_executor().
+        self._default_executor: (executors.QAsyncioThreadPoolExecutor
+                                 | concurrent.futures.ThreadPoolExecutor) = \
+            executors.QAsyncioThreadPoolExecutor()
+        self._executor_call_done.connect(self._complete_executor_call,
+                                         Qt.ConnectionType.QueuedConnection)
 
         # The exception handler, if set with set_exception_handler(). The
         # exception handler is currently called in two places: One, if an
@@ -212,8 +303,21 @@ class QAsyncioEventLoop(asyncio.BaseEventLoop, QObject):
 
         self._debug = bool(os.getenv("PYTHONASYNCIODEBUG", False))
 
+        # Statistics about the loop, see get_statistics(). The task counters
+        # are always updated, whereas the execution times and queue delays of
+        # the callbacks are only measured in debug mode.
+        self._tasks_created = 0
+        self._tasks_completed = 0
+        self._slow_callbacks = 0
+        self._callback_times = _LatencyHistogram()
+        self._queue_delays = _LatencyHistogram()
+
         self._application.aboutToQuit.connect(self._about_to_quit_cb)
 
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._run_timers)
+
     # Running and stopping the loop
 
     def _run_until_complete_cb(self, future: futures.QAsyncioFuture) -> None:
@@ -300,6 +404,16 @@ class QAsyncioEventLoop(asyncio.BaseEventLoop, QObject):
             return
         if self._default_executor is not None:
             self._default_executor.shutdown(wait=False)
+        self._ready.clear()
+        # The timer might already be deleted if close() is called from __del__().
+        if Shiboken.isValid(self._timer):
+            self._timer.stop()
+        self._scheduled.clear()
+        self._timer_cancelled_count = 0
+        for fd in list(self._readers):
+            self._remove_notifier(self._readers, fd)
+        for fd in list(self._writers):
+            self._remove_notifier(self._writers, fd)
         self._closed = True
 
     async def shutdown_asyncgens(self) -> None:
@@ -346,15 +460,181 @@ class QAsyncioEventLoop(asyncio.BaseEventLoop, QObject):
 
     # Scheduling callbacks
 
+    def _add_ready(self, handle: QAsyncioHandle) -> None:
+        """
+        Append a handle to the ready queue and make sure that the queue will be
+        drained in the next iteration of the event loop.
+        """
+        # Do not schedule events from asyncio when the app is quit from outside
+        # the event loop, as this would cause events to be enqueued after the
+        # event loop was destroyed.
+        if self._closed or self._quit_from_outside:
+            return
+        self._ready.append(handle)
+        if not self._ready_scheduled:
+            if handle._is_threadsafe:
+                # This singleShot overload will push the drain into the thread
+                # of the event loop instead of the current thread's loop. This
+                # allows scheduling a callback from a different thread, which
+                # is necessary for thread-safety.
+                # https://docs.python.org/3/library/asyncio-dev.html#asyncio-multithreading
+                self._ready_scheduled = True
+                QTimer.singleShot(0, self, self._run_ready)
+            elif threading.get_ident() == self._thread_id:
+                self._ready_scheduled = True
+                QTimer.singleShot(0, self._run_ready)
+            # Otherwise, call_soon() was called from a different thread. As
+            # with the default asyncio event loop, the loop is not woken up and
+            # the handle is executed the next time the ready queue is drained.
+
+    @Slot()
+    def _run_ready(self) -> None:
+        """
+        Execute the handles that are in the ready queue at the start of this
+        iteration. Handles that are added while draining the queue are executed
+        in the next iteration.
+        """
+        self._ready_scheduled = False
+        ready = self._ready
+        try:
+            if self._debug:
+                for _ in range(len(ready)):
+                    self._run_handle_debug(ready.popleft())
+            else:
+                for _ in range(len(ready)):
+                    ready.popleft()._cb()
+        finally:
+            if ready and not self._ready_scheduled and not self._closed:
+                # Either a callback raised an exception or handles were added
+                # from another thread without waking up the loop.
+                self._ready_scheduled = True
+                QTimer.singleShot(0, self._run_ready)
+
+    def _add_timer(self, handle: QAsyncioTimerHandle) -> None:
+        """ Push a timer handle into the heap of scheduled handles. """
+        if self._closed or self._quit_from_outside:
+            return
+        if threading.get_ident() != self._thread_id:
+            # Timers cannot be started from another thread. As with the
+            # default asyncio event loop, call_later() and call_at() are not
+            # thread-safe, which it reports in debug mode.
+            raise RuntimeError("Non-thread-safe operation invoked on an event loop other "
+                               "than the current one")
+        heapq.heappush(self._scheduled,
+                       (handle._when, next(self._scheduled_counter), handle))
+        handle._scheduled = True
+        if self._scheduled[0][2] is handle:
+            self._arm_timer()
+
+    def _arm_timer(self) -> None:
+        """ (Re-)start the timer for the earliest handle in the heap. """
+        scheduled = self._scheduled
+        # Cancelled handles at the top of the heap must not cause a wakeup.
+        while scheduled and scheduled[0][2].cancelled():
+            heapq.heappop(scheduled)[2]._scheduled = False
+            self._timer_cancelled_count -= 1
+        if not scheduled:
+            self._timer.stop()
+            return
+        delay = max(scheduled[0][0] - self.time(), 0)
+        timer_type = (Qt.TimerType.PreciseTimer if delay < _PRECISE_TIMER_THRESHOLD
+                      else Qt.TimerType.CoarseTimer)
+        if self._timer.timerType() != timer_type:
+            self._timer.setTimerType(timer_type)
+        # PYSIDE-2644: Timeouts must not be truncated as happens with int().
+        # Otherwise, a timeout of e.g. 0.9 would be handled as 0. They are
+        # rounded up so that the timer does not fire before the handle is
+        # due, as the clock of the loop has a sub-millisecond resolution.
+        self._timer.start(math.ceil(delay * 1000))
+
+    @Slot()
+    def _run_timers(self) -> None:
+        """
+        Execute the handles from the heap that are due and re-arm the timer for
+        the next due handle.
+        """
+        scheduled = self._scheduled
+        end_time = self.time() + self._clock_resolution
+        try:
+            while scheduled and scheduled[0][0] < end_time:
+                handle = heapq.heappop(scheduled)[2]
+                handle._scheduled = False
+                if handle.cancelled():
+                    self._timer_cancelled_count -= 1
+                elif self._debug:
+                    self._run_handle_debug(handle)
+                else:
+                    handle._cb()
+                # A callback might have compacted the heap.
+                scheduled = self._scheduled
+        finally:
+            if not self._closed:
+                self._arm_timer()
+
+    def _run_handle_debug(self, handle: QAsyncioHandle | QAsyncioTimerHandle) -> None:
+        """
+        Execute a handle in debug mode, recording the time that the handle
+        waited in the ready queue (or, for a timer handle, how late it is)
+        and the execution time of its callback. Callbacks that take longer
+        than slow_callback_duration are logged, as they block the Qt event
+        loop and thereby freeze the user interface.
+        """
+        if handle.cancelled():
+            return
+        start = self.time()
+        ready_time = handle._when if isinstance(handle, asyncio.TimerHandle) else handle._ready_time
+        if ready_time is not None:
+            self._queue_delays.record(max(start - ready_time, 0.0))
+        try:
+            handle._cb()
+        finally:
+            self._record_callback_time(handle._callback, handle._args, self.time() - start)
+
+    def _record_callback_time(self, callback: Callable, args: tuple, duration: float) -> None:
+        self._callback_times.record(duration)
+        if duration >= self.slow_callback_duration:
+            self._slow_callbacks += 1
+            asyncio.log.logger.warning("Executing %s took %.3f seconds",
+                                       _format_callback(callback, args), duration)
+
+    def _timer_handle_cancelled(self, handle: QAsyncioTimerHandle) -> None:
+        """
+        Called when a scheduled timer handle is cancelled. The handle remains
+        in the heap until it is due or until the heap is compacted, unless it
+        is the earliest handle, in which case the timer is re-armed so that
+        the cancelled handle does not cause a wakeup.
+        """
+        if not handle._scheduled:
+            return
+        self._timer_cancelled_count += 1
+        scheduled = self._scheduled
+        if (len(scheduled) > _MIN_SCHEDULED_TIMER_HANDLES
+                and self._timer_cancelled_count / len(scheduled)
+                > _MIN_CANCELLED_TIMER_HANDLES_FRACTION):
+            # Too many cancelled handles, remove them all at once.
+            new_scheduled = []
+            for entry in scheduled:
+                if entry[2].cancelled():
+                    entry[2]._scheduled = False
+                else:
+                    new_scheduled.append(entry)
+            heapq.heapify(new_scheduled)
+            self._scheduled = scheduled = new_scheduled
+            self._timer_cancelled_count = 0
+        elif scheduled[0][2] is not handle:
+            return
+        self._arm_timer()
+
     def _call_soon_impl(self, callback: Callable, *args: Any,
                         context: contextvars.Context | None = None,
                         is_threadsafe: bool | None = False) -> asyncio.Handle:
-        return self._call_later_impl(0, callback, *args, context=context,
-                                     is_threadsafe=is_threadsafe)
+        return QAsyncioHandle(callback, args, self, context, is_threadsafe=is_threadsafe)
 
     def call_soon(self, callback: Callable, *args: Any,
                   context: contextvars.Context | None = None) -> asyncio.Handle:
-        return self._call_soon_impl(callback, *args, context=context, is_threadsafe=False)
+        # This is called for every step of every task, so the handle is created
+        # directly instead of through _call_soon_impl().
+        return QAsyncioHandle(callback, args, self, context)
 
     def call_soon_threadsafe(self, callback: Callable, *args: Any,
                              context: contextvars.Context | None = None) -> asyncio.Handle:
@@ -389,7 +669,9 @@ class QAsyncioEventLoop(asyncio.BaseEventLoop, QObject):
         return self._call_at_impl(when, callback, *args, context=context, is_threadsafe=False)
 
     def time(self) -> float:
-        return QDateTime.currentMSecsSinceEpoch() / 1000
+        # As with the default asyncio event loop, the clock of the loop is
+        # monotonic, i.e., it is not affected by changes of the system clock.
+        return time.monotonic()
 
     # Creating Futures and Tasks
 
@@ -426,7 +708,23 @@ class QAsyncioEventLoop(asyncio.BaseEventLoop, QObject):
             ssl_handshake_timeout=None,
             ssl_shutdown_timeout=None,
             happy_eyeballs_delay=None, interleave=None):
-        raise NotImplementedError("QAsyncioEventLoop.create_connection() is not implemented yet")
+        from . import transports
+
+        if server_hostname is not None and not ssl:
+            raise ValueError("server_hostname is only meaningful with ssl")
+        if ssl_handshake_timeout is not None and not ssl:
+            raise ValueError("ssl_handshake_timeout is only meaningful with ssl")
+        if sock is not None and (host is not None or port is not None):
+            raise ValueError("host/port and sock can not be specified at the same time")
+        if sock is None and (host is None or port is None):
+            raise ValueError("host and port was not specified and no sock specified")
+
+        qsocket = await transports.open_tcp_socket(
+            self, host, port, ssl_context=ssl, server_hostname=server_hostname,
+            local_addr=local_addr, sock=sock, ssl_handshake_timeout=ssl_handshake_timeout)
+        protocol = protocol_factory()
+        transport = transports.QAsyncioSocketTransport(self, qsocket, protocol)
+        return transport, protocol
 
     async def create_datagram_endpoint(self, protocol_factory,
                                        local_addr=None, remote_addr=None, *,
@@ -442,8 +740,19 @@ class QAsyncioEventLoop(asyncio.BaseEventLoop, QObject):
             server_hostname=None,
             ssl_handshake_timeout=None,
             ssl_shutdown_timeout=None):
-        raise NotImplementedError(
-            "QAsyncioEventLoop.create_unix_connection() is not implemented yet")
+        from . import transports
+
+        if ssl:
+            raise ValueError("ssl is not supported for Unix domain sockets")
+        if sock is not None and path is not None:
+            raise ValueError("path and sock can not be specified at the same time")
+        if sock is None and path is None:
+            raise ValueError("no path and sock were specified")
+
+        qsocket = await transports.open_local_socket(self, path, sock=sock)
+        protocol = protocol_factory()
+        transport = transports.QAsyncioSocketTransport(self, qsocket, protocol)
+        return transport, protocol
 
     # Creating network servers
 
@@ -455,7 +764,25 @@ class QAsyncioEventLoop(asyncio.BaseEventLoop, QObject):
             ssl_handshake_timeout=None,
             ssl_shutdown_timeout=None,
             start_serving=True):
-        raise NotImplementedError("QAsyncioEventLoop.create_server() is not implemented yet")
+        from . import transports
+
+        if ssl_handshake_timeout is not None and not ssl:
+            raise ValueError("ssl_handshake_timeout is only meaningful with ssl")
+        if sock is not None and (host is not None or port is not None):
+            raise ValueError("host/port and sock can not be specified at the same time")
+
+        if isinstance(host, str) or not isinstance(host, collections.abc.Iterable):
+            hosts = [host]
+        else:
+            hosts = list(host)
+        servers = await transports.listen_tcp(
+            self, hosts, port, family=family, flags=flags, sock=sock, backlog=backlog,
+            ssl_context=ssl, reuse_port=reuse_port,
+            ssl_handshake_timeout=ssl_handshake_timeout)
+        server = transports.QAsyncioServer(self, servers, protocol_factory)
+        if start_serving:
+            await server.start_serving()
+        return server
 
     async def create_unix_server(
             self, protocol_factory, path=None, *,
@@ -463,21 +790,56 @@ class QAsyncioEventLoop(asyncio.BaseEventLoop, QObject):
             ssl_handshake_timeout=None,
             ssl_shutdown_timeout=None,
             start_serving=True):
-        raise NotImplementedError("QAsyncioEventLoop.create_unix_server() is not implemented yet")
+        from . import transports
+
+        if ssl:
+            raise ValueError("ssl is not supported for Unix domain sockets")
+        if sock is not None and path is not None:
+            raise ValueError("path and sock can not be specified at the same time")
+        if sock is None and path is None:
+            raise ValueError("path was not specified, and no sock specified")
+
+        local_server = transports.listen_local(path, sock=sock, backlog=backlog)
+        server = transports.QAsyncioServer(self, [local_server], protocol_factory)
+        if start_serving:
+            await server.start_serving()
+        return server
 
     async def connect_accepted_socket(
             self, protocol_factory, sock,
             *, ssl=None,
             ssl_handshake_timeout=None,
             ssl_shutdown_timeout=None):
-        raise NotImplementedError(
-            "QAsyncioEventLoop.connect_accepted_socket() is not implemented yet")
+        from . import transports
+
+        if sock.family == getattr(socket, "AF_UNIX", None):
+            qsocket = await transports.open_local_socket(self, None, sock=sock)
+        else:
+            qsocket = await transports.open_tcp_socket(self, None, None, sock=sock)
+        if ssl:
+            await transports.start_encryption(self, qsocket, ssl, server_side=True,
+                                              ssl_handshake_timeout=ssl_handshake_timeout)
+        protocol = protocol_factory()
+        transport = transports.QAsyncioSocketTransport(self, qsocket, protocol)
+        return transport, protocol
 
     # Transferring files
 
     async def sendfile(self, transport, file, offset=0, count=None,
                        *, fallback=True):
-        raise NotImplementedError("QAsyncioEventLoop.sendfile() is not implemented yet")
+        from . import transports
+
+        if not isinstance(transport, transports.QAsyncioSocketTransport):
+            raise TypeError(f"Transport {transport!r} is not supported by sendfile()")
+        if transport.is_closing():
+            raise RuntimeError("Transport is closing")
+        if "b" not in getattr(file, "mode", "b"):
+            raise ValueError("file should be opened in binary mode")
+        if not isinstance(offset, int) or offset < 0:
+            raise ValueError(f"offset must be a non-negative integer (got {offset!r})")
+        if count is not None and (not isinstance(count, int) or count <= 0):
+            raise ValueError(f"count must be a positive integer (got {count!r})")
+        return await transport._sendfile(file, offset, count)
 
     # TLS Upgrade
 
@@ -486,68 +848,210 @@ class QAsyncioEventLoop(asyncio.BaseEventLoop, QObject):
                         server_hostname=None,
                         ssl_handshake_timeout=None,
                         ssl_shutdown_timeout=None):
-        raise NotImplementedError("QAsyncioEventLoop.start_tls() is not implemented yet")
+        from . import transports
+        from PySide6.QtNetwork import QSslSocket
 
-    # Watching file descriptors
-
-    def add_reader(self, fd, callback, *args):
-        raise NotImplementedError("QAsyncioEventLoop.add_reader() is not implemented yet")
+        if (not isinstance(transport, transports.QAsyncioSocketTransport)
+                or not isinstance(transport._socket, QSslSocket)):
+            raise TypeError(f"transport {transport!r} is not supported by start_tls()")
 
-    def remove_reader(self, fd):
-        raise NotImplementedError("QAsyncioEventLoop.remove_reader() is not implemented yet")
+        # The new transport takes over the socket of the old transport, which
+        # becomes unusable, as with the default asyncio event loop.
+        server = transport._server
+        qsocket = transport._detach_socket()
+        try:
+            await transports.start_encryption(self, qsocket, sslcontext, server_side=server_side,
+                                              server_hostname=server_hostname,
+                                              ssl_handshake_timeout=ssl_handshake_timeout)
+        except BaseException:
+            qsocket.abort()
+            qsocket.deleteLater()
+            raise
+        return transports.QAsyncioSocketTransport(self, qsocket, protocol, server,
+                                                  call_connection_made=False)
 
-    def add_writer(self, fd, callback, *args):
-        raise NotImplementedError("QAsyncioEventLoop.add_writer() is not implemented yet")
+    # Watching file descriptors
 
-    def remove_writer(self, fd):
-        raise NotImplementedError("QAsyncioEventLoop.remove_writer() is not implemented yet")
+    def _add_notifier(self, notifiers: dict[int, tuple[QSocketNotifier, asyncio.Handle]],
+                      notifier_type: QSocketNotifier.Type, fd: Any, callback: Callable,
+                      *args: Any) -> asyncio.Handle:
+        """
+        Watch a file descriptor with a QSocketNotifier, which calls the callback
+        every time the file descriptor is ready for reading or writing,
+        respectively, until the notifier is removed.
+        """
+        if self.is_closed():
+            raise RuntimeError("Event loop is closed")
+        fd = _fileobj_to_fd(fd)
+        self._remove_notifier(notifiers, fd)
+        handle = asyncio.Handle(callback, args, self, None)  # type: ignore[arg-type]
+        notifier = QSocketNotifier(fd, notifier_type, self)
+        notifier.activated.connect(lambda *_: self._run_notifier_handle(handle))
+        notifiers[fd] = (notifier, handle)
+        return handle
+
+    def _run_notifier_handle(self, handle: asyncio.Handle) -> None:
+        if handle.cancelled():
+            return
+        if not self._debug:
+            handle._run()
+            return
+        start = self.time()
+        try:
+            handle._run()
+        finally:
+            self._record_callback_time(handle._callback, handle._args,  # type: ignore[attr-defined]
+                                       self.time() - start)
+
+    def _remove_notifier(self, notifiers: dict[int, tuple[QSocketNotifier, asyncio.Handle]],
+                         fd: Any) -> bool:
+        fd = _fileobj_to_fd(fd)
+        entry = notifiers.pop(fd, None)
+        if entry is None:
+            return False
+        notifier, handle = entry
+        handle.cancel()
+        if Shiboken.isValid(notifier):
+            # The notifier might currently be emitting its activated signal, so
+            # it must not be deleted right away.
+            notifier.setEnabled(False)
+            notifier.deleteLater()
+        return True
+
+    def _add_reader(self, fd: Any, callback: Callable, *args: Any) -> asyncio.Handle:
+        return self._add_notifier(self._readers, QSocketNotifier.Type.Read, fd, callback, *args)
+
+    def _add_writer(self, fd: Any, callback: Callable, *args: Any) -> asyncio.Handle:
+        return self._add_notifier(self._writers, QSocketNotifier.Type.Write, fd, callback, *args)
+
+    def add_reader(self, fd: Any, callback: Callable, *args: Any) -> None:
+        self._add_reader(fd, callback, *args)
+
+    def remove_reader(self, fd: Any) -> bool:
+        return self._remove_notifier(self._readers, fd)
+
+    def add_writer(self, fd: Any, callback: Callable, *args: Any) -> None:
+        self._add_writer(fd, callback, *args)
+
+    def remove_writer(self, fd: Any) -> bool:
+        return self._remove_notifier(self._writers, fd)
 
     # Working with socket objects directly
 
-    async def sock_recv(self, sock, nbytes):
-        raise NotImplementedError("QAsyncioEventLoop.sock_recv() is not implemented yet")
-
-    async def sock_recv_into(self, sock, buf):
-        raise NotImplementedError("QAsyncioEventLoop.sock_recv_into() is not implemented yet")
-
-    async def sock_recvfrom(self, sock, bufsize):
-        raise NotImplementedError("QAsyncioEventLoop.sock_recvfrom() is not implemented yet")
-
-    async def sock_recvfrom_into(self, sock, buf, nbytes=0):
-        raise NotImplementedError("QAsyncioEventLoop.sock_recvfrom_into() is not implemented yet")
+    def _check_socket(self, sock: socket.socket) -> None:
+        asyncio.base_events._check_ssl_socket(sock)  # type: ignore[attr-defined]
+        if self._debug and sock.gettimeout() != 0:
+            raise ValueError("the socket must be non-blocking")
 
-    async def sock_sendall(self, sock, data):
-        raise NotImplementedError("QAsyncioEventLoop.sock_sendall() is not implemented yet")
-
-    async def sock_sendto(self, sock, data, address):
-        raise NotImplementedError("QAsyncioEventLoop.sock_sendto() is not implemented yet")
-
-    async def sock_connect(self, sock, address):
-        raise NotImplementedError("QAsyncioEventLoop.sock_connect() is not implemented yet")
+    async def _wait_fd(self, fd: int, for_writing: bool) -> None:
+        """ Wait until a file descriptor is ready for reading or writing. """
+        future = self.create_future()
+        if for_writing:
+            handle = self._add_writer(fd, _set_result_unless_done, future)
+        else:
+            handle = self._add_reader(fd, _set_result_unless_done, future)
+        try:
+            await future
+        finally:
+            # Another reader or writer might have replaced ours meanwhile.
+            if not handle.cancelled():
+                self._remove_notifier(self._writers if for_writing else self._readers, fd)
 
-    async def sock_accept(self, sock):
-        raise NotImplementedError("QAsyncioEventLoop.sock_accept() is not implemented yet")
+    async def _sock_call(self, sock: socket.socket, for_writing: bool,
+                         func: Callable, *args: Any) -> Any:
+        """
+        Call a non-blocking socket operation until it succeeds, waiting for the
+        socket to become ready whenever the operation would block.
+        """
+        while True:
+            try:
+                return func(*args)
+            except (BlockingIOError, InterruptedError):
+                await self._wait_fd(sock.fileno(), for_writing)
+
+    async def sock_recv(self, sock: socket.socket, nbytes: int) -> bytes:
+        self._check_socket(sock)
+        return await self._sock_call(sock, False, sock.recv, nbytes)
+
+    async def sock_recv_into(self, sock: socket.socket, buf: Any) -> int:
+        self._check_socket(sock)
+        return await self._sock_call(sock, False, sock.recv_into, buf)
+
+    async def sock_recvfrom(self, sock: socket.socket, bufsize: int) -> tuple[bytes, Any]:
+        self._check_socket(sock)
+        return await self._sock_call(sock, False, sock.recvfrom, bufsize)
+
+    async def sock_recvfrom_into(self, sock: socket.socket, buf: Any,
+                                 nbytes: int = 0) -> tuple[int, Any]:
+        self._check_socket(sock)
+        if not nbytes:
+            nbytes = len(buf)
+        return await self._sock_call(sock, False, sock.recvfrom_into, buf, nbytes)
+
+    async def sock_sendall(self, sock: socket.socket, data: Any) -> None:
+        self._check_socket(sock)
+        view = memoryview(data).cast("B")
+        while view:
+            sent = await self._sock_call(sock, True, sock.send, view)
+            view = view[sent:]
+
+    async def sock_sendto(self, sock: socket.socket, data: Any, address: Any) -> int:
+        self._check_socket(sock)
+        return await self._sock_call(sock, True, sock.sendto, data, address)
+
+    async def sock_connect(self, sock: socket.socket, address: Any) -> None:
+        self._check_socket(sock)
+        if sock.family == socket.AF_INET or (socket.has_ipv6 and sock.family == socket.AF_INET6):
+            resolved = await self._ensure_resolved(
+                address, family=sock.family, type=sock.type, proto=sock.proto, loop=self)
+            _, _, _, _, address = resolved[0]
+        try:
+            sock.connect(address)
+        except (BlockingIOError, InterruptedError):
+            # The connection is in progress; it is established (or has failed)
+            # once the socket becomes writable.
+            await self._wait_fd(sock.fileno(), True)
+            error = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+            if error != 0:
+                raise OSError(error, f"Connect call failed {address}")
+
+    async def sock_accept(self, sock: socket.socket) -> tuple[socket.socket, Any]:
+        self._check_socket(sock)
+        conn, address = await self._sock_call(sock, False, sock.accept)
+        conn.setblocking(False)
+        return conn, address
 
     async def sock_sendfile(self, sock, file, offset=0, count=None, *,
-                            fallback=None):
-        raise NotImplementedError("QAsyncioEventLoop.sock_sendfile() is not implemented yet")
+                            fallback=True):
+        # There is no native sendfile() support; with fallback=True, the file
+        # is sent in chunks with sock_sendall().
+        return await super().sock_sendfile(sock, file, offset, count, fallback=fallback)
 
     # DNS
 
     async def getaddrinfo(self, host, port, *,
                           family=0, type=0, proto=0, flags=0):
-        raise NotImplementedError("QAsyncioEventLoop.getaddrinfo() is not implemented yet")
+        return await self.run_in_executor(
+            None, socket.getaddrinfo, host, port, family, type, proto, flags)
 
     async def getnameinfo(self, sockaddr, flags=0):
-        raise NotImplementedError("QAsyncioEventLoop.getnameinfo() is not implemented yet")
+        return await self.run_in_executor(None, socket.getnameinfo, sockaddr, flags)
 
     # Working with pipes
 
     async def connect_read_pipe(self, protocol_factory, pipe):
-        raise NotImplementedError("QAsyncioEventLoop.connect_read_pipe() is not implemented yet")
+        from . import pipes
+
+        protocol = protocol_factory()
+        transport = pipes.QAsyncioReadPipeTransport(self, pipe, protocol)
+        return transport, protocol
 
     async def connect_write_pipe(self, protocol_factory, pipe):
-        raise NotImplementedError("QAsyncioEventLoop.connect_write_pipe() is not implemented yet")
+        from . import pipes
+
+        protocol = protocol_factory()
+        transport = pipes.QAsyncioWritePipeTransport(self, pipe, protocol)
+        return transport, protocol
 
     # Unix signals
 
@@ -561,13 +1065,19 @@ class QAsyncioEventLoop(asyncio.BaseEventLoop, QObject):
     # Executing code in thread or process pools
 
     def run_in_executor(self,
-                        executor: concurrent.futures.ThreadPoolExecutor | None,
+                        executor: (executors.QAsyncioThreadPoolExecutor
+                                   | concurrent.futures.ThreadPoolExecutor | None),
                         func: Callable, *args: tuple) -> asyncio.futures.Future:
         if self.is_closed():
             raise RuntimeError("Event loop is closed")
         if executor is None:
             executor = self._default_executor
 
+        if isinstance(executor, executors.QAsyncioThreadPoolExecutor):
+            # The threads of a QThreadPool are QThreads, so the callable can be
+            # run directly.
+            return executor._run_in_loop(self, func, args)  # type: ignore[return-value]
+
         # Executors require a bit of extra work for QtAsyncio, as we can't use
         # naked Python threads; instead, we must make sure that the thread
         # created by executor.submit() has an event loop. This is achieved by
@@ -579,10 +1089,23 @@ class QAsyncioEventLoop(asyncio.BaseEventLoop, QObject):
             executor.submit(wrapper.do), loop=self
         )
 
+    @Slot(object, object, object)
+    def _complete_executor_call(self, future: futures.QAsyncioFuture, result: Any,
+                                exception: BaseException | None) -> None:
+        if future.done():
+            return
+        if exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(result)
+
     def set_default_executor(self,
-                             executor: concurrent.futures.ThreadPoolExecutor | None) -> None:
-        if not isinstance(executor, concurrent.futures.ThreadPoolExecutor):
-            raise TypeError("The executor must be a ThreadPoolExecutor")
+                             executor: (executors.QAsyncioThreadPoolExecutor
+                                        | concurrent.futures.ThreadPoolExecutor)) -> None:
+        if not isinstance(executor, (executors.QAsyncioThreadPoolExecutor,
+                                     concurrent.futures.ThreadPoolExecutor)):
+            raise TypeError(
+                "The executor must be a QAsyncioThreadPoolExecutor or a ThreadPoolExecutor")
         self._default_executor = executor
 
     # Error Handling API
@@ -614,66 +1137,178 @@ class QAsyncioEventLoop(asyncio.BaseEventLoop, QObject):
     def set_debug(self, enabled: bool) -> None:
         self._debug = enabled
 
+    # Statistics
+
+    def get_statistics(self) -> dict[str, Any]:
+        """
+        Return a snapshot of statistics about the loop, to find out what
+        blocks the loop (and the Qt event loop along with it):
+
+        * tasks_created, tasks_completed and tasks_pending: The number of
+          QAsyncioTasks created and completed on the loop and the difference
+          between the two.
+        * ready_handles: The number of handles in the ready queue.
+        * timer_handles: The number of scheduled, not cancelled timer handles.
+        * watched_fds: The number of watched file descriptors.
+
+        In debug mode, the following are also recorded:
+
+        * callback_time: A histogram of the execution times of callbacks.
+        * queue_delay: A histogram of the delays between the time a handle is
+          ready (for a timer handle, its due time) and its execution.
+        * slow_callbacks: The number of callbacks that took longer than
+          slow_callback_duration.
+
+        The histograms are dictionaries with the count, total, mean and max of
+        the latencies (in seconds), and with the buckets mapping upper bounds
+        to the number of latencies in the bucket.
+        """
+        return {
+            "tasks_created": self._tasks_created,
+            "tasks_completed": self._tasks_completed,
+            "tasks_pending": self._tasks_created - self._tasks_completed,
+            "ready_handles": len(self._ready),
+            "timer_handles": len(self._scheduled) - self._timer_cancelled_count,
+            "watched_fds": len(self._readers) + len(self._writers),
+            "callback_time": self._callback_times.as_dict(),
+            "queue_delay": self._queue_delays.as_dict(),
+            "slow_callbacks": self._slow_callbacks,
+        }
+
+    def reset_statistics(self) -> None:
+        """
+        Reset the recorded execution times, queue delays and slow callbacks.
+        The task counters are not reset, as pending tasks would be miscounted.
+        """
+        self._slow_callbacks = 0
+        self._callback_times = _LatencyHistogram()
+        self._queue_delays = _LatencyHistogram()
+
     # Running subprocesses
 
-    async def subprocess_exec(self, protocol_factory, *args,
+    async def subprocess_exec(self, protocol_factory, program, *args,
                               stdin=subprocess.PIPE,
                               stdout=subprocess.PIPE,
                               stderr=subprocess.PIPE,
+                              universal_newlines=False, shell=False,
+                              bufsize=0, encoding=None, errors=None, text=None,
                               **kwargs):
-        raise NotImplementedError("QAsyncioEventLoop.subprocess_exec() is not implemented yet")
+        if universal_newlines:
+            raise ValueError("universal_newlines must be False")
+        if shell:
+            raise ValueError("shell must be False")
+        if bufsize != 0:
+            raise ValueError("bufsize must be 0")
+        if text:
+            raise ValueError("text must be False")
+        if encoding is not None:
+            raise ValueError("encoding must be None")
+        if errors is not None:
+            raise ValueError("errors must be None")
+        return await self._subprocess(protocol_factory, program, list(args), False,
+                                      stdin, stdout, stderr, kwargs)
 
     async def subprocess_shell(self, protocol_factory, cmd, *,
                                stdin=subprocess.PIPE,
                                stdout=subprocess.PIPE,
                                stderr=subprocess.PIPE,
+                               universal_newlines=False, shell=True,
+                               bufsize=0, encoding=None, errors=None, text=None,
                                **kwargs):
-        raise NotImplementedError("QAsyncioEventLoop.subprocess_shell() is not implemented yet")
+        if not isinstance(cmd, (bytes, str)):
+            raise ValueError("cmd must be a string")
+        if universal_newlines:
+            raise ValueError("universal_newlines must be False")
+        if not shell:
+            raise ValueError("shell must be True")
+        if bufsize != 0:
+            raise ValueError("bufsize must be 0")
+        if text:
+            raise ValueError("text must be False")
+        if encoding is not None:
+            raise ValueError("encoding must be None")
+        if errors is not None:
+            raise ValueError("errors must be None")
+        return await self._subprocess(protocol_factory, os.fsdecode(cmd), [], True,
+                                      stdin, stdout, stderr, kwargs)
+
+    async def _subprocess(self, protocol_factory, program, args, shell,
+                          stdin, stdout, stderr, kwargs):
+        from . import pipes
+
+        # Subprocesses are run with a QProcess, which does the reading and
+        # writing of the standard streams on the Qt event loop, so no file
+        # descriptors need to be watched here.
+        process, pipe_fds = pipes.create_process(
+            program, args, shell=shell, stdin=stdin, stdout=stdout, stderr=stderr, **kwargs)
+        protocol = protocol_factory()
+        transport = pipes.QAsyncioSubprocessTransport(self, protocol, process, pipe_fds)
+        try:
+            await transport._start()
+        except BaseException:
+            process.deleteLater()
+            raise
+        return transport, protocol
+
+
+def _fileobj_to_fd(fileobj: Any) -> int:
+    """ Return the file descriptor of a file object or file descriptor. """
+    if isinstance(fileobj, int):
+        fd = fileobj
+    else:
+        try:
+            fd = int(fileobj.fileno())
+        except (AttributeError, TypeError, ValueError):
+            raise ValueError(f"Invalid file object: {fileobj!r}") from None
+    if fd < 0:
+        raise ValueError(f"Invalid file descriptor: {fd}")
+    return fd
+
+
+def _format_callback(callback: Callable, args: tuple) -> str:
+    """ Format a callback for a log message, showing the task of a task step. """
+    task = getattr(callback, "__self__", None)
+    if isinstance(task, tasks.QAsyncioTask):
+        return repr(task)
+    return asyncio.format_helpers._format_callback_source(callback, args)
 
 
-class QAsyncioHandle():
+def _set_result_unless_done(future: futures.QAsyncioFuture) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class QAsyncioHandle(asyncio.Handle):
     """
     The handle enqueues a callback to be executed by the event loop, and allows
     for this callback to be cancelled before it is executed. This callback will
     typically execute the step function for a task. This makes the handle one
     of the main components of asyncio.
+
+    Handles are created for every callback, so they are kept small: the
+    attributes are stored in slots, reusing those of asyncio.Handle.
     """
-    class HandleState(enum.Enum):
-        PENDING = enum.auto()
-        CANCELLED = enum.auto()
-        DONE = enum.auto()
+    __slots__ = ("_is_threadsafe", "_ready_time")
 
     def __init__(self, callback: Callable, args: tuple,
                  loop: QAsyncioEventLoop, context: contextvars.Context | None,
                  is_threadsafe: bool | None = False) -> None:
+        # asyncio.Handle.__init__() is not called, as it copies the context and
+        # extracts the stack in debug mode.
         self._callback = callback
         self._args = args
         self._loop = loop
         self._context = context
+        self._cancelled = False
+        self._source_traceback = None
+        self._repr = None
         self._is_threadsafe = is_threadsafe
 
-        self._timeout = 0
-
-        self._state = QAsyncioHandle.HandleState.PENDING
-        self._start()
+        # In debug mode, the time at which the handle became ready, to measure
+        # how long it waits until it is executed.
+        self._ready_time: float | None = loop.time() if loop._debug else None
 
-    def _start(self) -> None:
-        self._schedule_event(self._timeout, lambda: self._cb())
-
-    def _schedule_event(self, timeout: int, func: Callable) -> None:
-        # Do not schedule events from asyncio when the app is quit from outside
-        # the event loop, as this would cause events to be enqueued after the
-        # event loop was destroyed.
-        if not self._loop.is_closed() and not self._loop._quit_from_outside:
-            if self._is_threadsafe:
-                # This singleShot overload will push func into self._loop
-                # instead of the current thread's loop. This allows scheduling
-                # a callback from a different thread, which is necessary for
-                # thread-safety.
-                # https://docs.python.org/3/library/asyncio-dev.html#asyncio-multithreading
-                QTimer.singleShot(timeout, self._loop, func)
-            else:
-                QTimer.singleShot(timeout, func)
+        loop._add_ready(self)
 
     @Slot()
     def _cb(self) -> None:
@@ -681,46 +1316,48 @@ class QAsyncioHandle():
         A slot, enqueued into the event loop, that wraps around the actual
         callback, typically the step function of a task.
         """
-        if self._state == QAsyncioHandle.HandleState.PENDING:
+        if not self._cancelled:
             if self._context is not None:
                 self._context.run(self._callback, *self._args)
             else:
                 self._callback(*self._args)
-            self._state = QAsyncioHandle.HandleState.DONE
 
     def cancel(self) -> None:
-        if self._state == QAsyncioHandle.HandleState.PENDING:
-            # The old timer that was created in _start will still trigger but
-            # _cb won't do anything, therefore the callback is effectively
-            # cancelled.
-            self._state = QAsyncioHandle.HandleState.CANCELLED
+        # The handle will still be dequeued from the ready queue, but _cb won't
+        # do anything, therefore the callback is effectively cancelled.
+        self._cancelled = True
 
     def cancelled(self) -> bool:
-        return self._state == QAsyncioHandle.HandleState.CANCELLED
+        return self._cancelled
+
 
+class QAsyncioTimerHandle(asyncio.TimerHandle):
+    """
+    A handle for a callback scheduled with call_later() or call_at(), which is
+    pushed into the timer heap of the loop instead of into the ready queue.
+    """
+    __slots__ = ()
 
-class QAsyncioTimerHandle(QAsyncioHandle, asyncio.TimerHandle):
     def __init__(self, when: float, callback: Callable, args: tuple,
                  loop: QAsyncioEventLoop, context: contextvars.Context | None,
                  is_threadsafe: bool | None = False) -> None:
-        QAsyncioHandle.__init__(self, callback, args, loop, context, is_threadsafe)
-
+        # See QAsyncioHandle.__init__().
+        self._callback = callback
+        self._args = args
+        self._loop = loop
+        self._context = context
+        self._cancelled = False
+        self._source_traceback = None
+        self._repr = None
         self._when = when
-        time = self._loop.time()
+        self._scheduled = False
 
-        # PYSIDE-2644: Timeouts should be rounded up or down instead of only up
-        # as happens with int(). Otherwise, a timeout of e.g. 0.9 would be
-        # handled as 0, where 1 would be more appropriate.
-        self._timeout = round(max(self._when - time, 0) * 1000)
+        loop._add_timer(self)
 
-        QAsyncioHandle._start(self)
+    _cb = QAsyncioHandle._cb
+    cancelled = QAsyncioHandle.cancelled
 
-    def _start(self) -> None:
-        """
-        Overridden so that timer.start() is only called once at the end of the
-        constructor for both QtHandle and QtTimerHandle.
-        """
-        pass
-
-    def when(self) -> float:
-        return self._when
+    def cancel(self) -> None:
+        if not self._cancelled:
+            self._cancelled = True
+            self._loop._timer_handle_cancelled(self)
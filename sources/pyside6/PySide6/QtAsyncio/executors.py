@@ -0,0 +1,119 @@
+# Copyright (C) 2024 The Qt Company Ltd.
+# SPDX-License-Identifier: LicenseRef-Qt-Commercial OR LGPL-3.0-only OR GPL-2.0-only OR GPL-3.0-only
+from __future__ import annotations
+
+from PySide6.QtCore import QThreadPool
+
+from . import events
+from . import futures
+
+from typing import Any, Callable
+
+import concurrent.futures
+import threading
+
+
+class QAsyncioThreadPoolExecutor(concurrent.futures.Executor):
+    """
+    An executor that runs callables on a QThreadPool, by default the global
+    thread pool of Qt, instead of on a thread pool of its own.
+
+    When used with run_in_executor() of a QAsyncioEventLoop (it is the default
+    executor of the loop), the asyncio future is completed through a queued
+    signal of the loop, without a concurrent.futures.Future and without a
+    QObject per call. submit() implements the Executor API for any other use.
+
+    :param thread_pool:     The QThreadPool to run the callables on. If None,
+                            QThreadPool.globalInstance() is used.
+    :param max_threads:     If not None, the maximum number of threads of the
+                            thread pool is set to this value.
+    :param priority:        The priority with which the callables are queued
+                            in the thread pool.
+    """
+
+    def __init__(self, thread_pool: QThreadPool | None = None, *,
+                 max_threads: int | None = None, priority: int = 0) -> None:
+        self._thread_pool = (thread_pool if thread_pool is not None
+                             else QThreadPool.globalInstance())
+        if max_threads is not None:
+            if max_threads <= 0:
+                raise ValueError("max_threads must be greater than 0")
+            self._thread_pool.setMaxThreadCount(max_threads)
+        self._priority = priority
+
+        self._shutdown = False
+        # The number of callables that were started and did not finish yet,
+        # which shutdown() waits for. The thread pool might be shared with
+        # other code, so QThreadPool.waitForDone() cannot be used for this.
+        self._pending = 0
+        self._condition = threading.Condition()
+
+    def thread_pool(self) -> QThreadPool:
+        return self._thread_pool
+
+    def _start(self, runnable: Callable[[], None]) -> None:
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError("Cannot schedule new calls after shutdown")
+            self._pending += 1
+
+        def run() -> None:
+            try:
+                runnable()
+            finally:
+                with self._condition:
+                    self._pending -= 1
+                    if self._pending == 0:
+                        self._condition.notify_all()
+
+        self._thread_pool.start(run, self._priority)
+
+    def _run_in_loop(self, loop: "events.QAsyncioEventLoop", func: Callable,
+                     args: tuple) -> futures.QAsyncioFuture:
+        """
+        Run a callable for run_in_executor(). The result or exception is passed
+        back to the thread of the loop by the queued _executor_call_done signal
+        of the loop, which then completes the future.
+        """
+        future = loop.create_future()
+
+        def run() -> None:
+            # Reading the state of the future from another thread is benign:
+            # at worst, a callable is run even though its future was just
+            # cancelled, and its result is discarded.
+            if future.cancelled():
+                return
+            try:
+                result = func(*args)
+            except BaseException as e:
+                loop._executor_call_done.emit(future, None, e)
+            else:
+                loop._executor_call_done.emit(future, result, None)
+
+        self._start(run)
+        return future
+
+    def submit(self, fn: Callable, /, *args: Any,  # type: ignore[override]
+               **kwargs: Any) -> concurrent.futures.Future:
+        future: concurrent.futures.Future = concurrent.futures.Future()
+
+        def run() -> None:
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+        self._start(run)
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        # Callables that were queued in the thread pool cannot be taken back,
+        # so cancel_futures has no effect.
+        with self._condition:
+            self._shutdown = True
+            if wait:
+                self._condition.wait_for(lambda: self._pending == 0)
@@ -14,10 +14,11 @@ import enum
 class QAsyncioFuture():
     """ https://docs.python.org/3/library/asyncio-future.html """
 
-    # Declare that this class implements the Future protocol. The field must
-    # exist and be boolean - True indicates 'await' or 'yield from', False
-    # indicates 'yield'.
-    _asyncio_future_blocking = False
+    # Futures are created for every await of an I/O operation, sleep, etc., so
+    # their attributes are stored in slots. The __weakref__ slot is needed for
+    # the task registry of asyncio.
+    __slots__ = ("_asyncio_future_blocking", "_loop", "_context", "_state", "_result",
+                 "_exception", "_cancel_message", "_callbacks", "__weakref__")
 
     class FutureState(enum.Enum):
         PENDING = enum.auto()
@@ -34,7 +35,12 @@ class QAsyncioFuture():
             self._loop = loop
         self._context = context
 
-        self._state = QAsyncioFuture.FutureState.PENDING
+        # Declare that this class implements the Future protocol. The field
+        # must exist and be boolean - True indicates 'await' or 'yield from',
+        # False indicates 'yield'.
+        self._asyncio_future_blocking = False
+
+        self._state = _PENDING
         self._result: Any = None
         self._exception: BaseException | None = None
 
@@ -60,11 +66,11 @@ class QAsyncioFuture():
                 cb, self, context=context if context else self._context)
 
     def result(self) -> Any | Exception:
-        if self._state == QAsyncioFuture.FutureState.DONE_WITH_RESULT:
+        if self._state is _DONE_WITH_RESULT:
             return self._result
-        if self._state == QAsyncioFuture.FutureState.DONE_WITH_EXCEPTION and self._exception:
+        if self._state is _DONE_WITH_EXCEPTION and self._exception:
             raise self._exception
-        if self._state == QAsyncioFuture.FutureState.CANCELLED:
+        if self._state is _CANCELLED:
             if self._cancel_message:
                 raise asyncio.CancelledError(self._cancel_message)
             else:
@@ -73,19 +79,19 @@ class QAsyncioFuture():
 
     def set_result(self, result: Any) -> None:
         self._result = result
-        self._state = QAsyncioFuture.FutureState.DONE_WITH_RESULT
+        self._state = _DONE_WITH_RESULT
         self._schedule_callbacks()
 
     def set_exception(self, exception: Exception) -> None:
         self._exception = exception
-        self._state = QAsyncioFuture.FutureState.DONE_WITH_EXCEPTION
+        self._state = _DONE_WITH_EXCEPTION
         self._schedule_callbacks()
 
     def done(self) -> bool:
-        return self._state != QAsyncioFuture.FutureState.PENDING
+        return self._state is not _PENDING
 
     def cancelled(self) -> bool:
-        return self._state == QAsyncioFuture.FutureState.CANCELLED
+        return self._state is _CANCELLED
 
     def add_done_callback(self, cb: Callable, *,
                           context: contextvars.Context | None = None) -> None:
@@ -103,13 +109,13 @@ class QAsyncioFuture():
     def cancel(self, msg: str | None = None) -> bool:
         if self.done():
             return False
-        self._state = QAsyncioFuture.FutureState.CANCELLED
+        self._state = _CANCELLED
         self._cancel_message = msg
         self._schedule_callbacks()
         return True
 
     def exception(self) -> BaseException | None:
-        if self._state == QAsyncioFuture.FutureState.CANCELLED:
+        if self._state is _CANCELLED:
             raise asyncio.CancelledError
         if self.done():
             return self._exception
@@ -117,3 +123,11 @@ class QAsyncioFuture():
 
     def get_loop(self) -> asyncio.AbstractEventLoop:
         return self._loop
+
+
+# The states of a future as module globals, so that the hot paths compare them
+# by identity without looking up the nested enum class.
+_PENDING = QAsyncioFuture.FutureState.PENDING
+_CANCELLED = QAsyncioFuture.FutureState.CANCELLED
+_DONE_WITH_RESULT = QAsyncioFuture.FutureState.DONE_WITH_RESULT
+_DONE_WITH_EXCEPTION = QAsyncioFuture.FutureState.DONE_WITH_EXCEPTION
@@ -0,0 +1,670 @@
+# Copyright (C) 2024 The Qt Company Ltd.
+# SPDX-License-Identifier: LicenseRef-Qt-Commercial OR LGPL-3.0-only OR GPL-2.0-only OR GPL-3.0-only
+from __future__ import annotations
+
+from PySide6.QtCore import QProcess, QProcessEnvironment
+
+from . import events
+
+from typing import Any
+
+import asyncio
+import os
+import shutil
+import signal
+import subprocess
+import sys
+
+# The default high water mark of the write buffer, as in asyncio.
+_DEFAULT_HIGH_WATER = 64 * 1024
+
+# The maximum number of bytes read from a pipe at once, as in asyncio.
+_MAX_READ_SIZE = 256 * 1024
+
+# The file descriptors of the standard streams of a subprocess.
+_STDIN, _STDOUT, _STDERR = 0, 1, 2
+
+
+def _call_protocol(loop: "events.QAsyncioEventLoop", transport: asyncio.BaseTransport,
+                   protocol: asyncio.BaseProtocol, method: str, *args: Any) -> None:
+    """
+    Call a method of a protocol, and pass an exception raised by it to the
+    exception handler of the loop.
+    """
+    try:
+        getattr(protocol, method)(*args)
+    except (SystemExit, KeyboardInterrupt):
+        raise
+    except BaseException as e:
+        loop.call_exception_handler({
+            "message": f"protocol.{method}() failed",
+            "exception": e,
+            "transport": transport,
+            "protocol": protocol,
+        })
+
+
+def _check_buffer_limits(high: int | None, low: int | None) -> tuple[int, int]:
+    if high is None:
+        high = _DEFAULT_HIGH_WATER if low is None else 4 * low
+    if low is None:
+        low = high // 4
+    if not high >= low >= 0:
+        raise ValueError(f"high ({high!r}) must be >= low ({low!r}) must be >= 0")
+    return high, low
+
+
+class QAsyncioReadPipeTransport(asyncio.ReadTransport):
+    """
+    A transport for the reading end of a pipe, e.g., from os.pipe(), which is
+    watched with a QSocketNotifier (see QAsyncioEventLoop.add_reader()).
+    """
+
+    def __init__(self, loop: "events.QAsyncioEventLoop", pipe: Any,
+                 protocol: asyncio.BaseProtocol) -> None:
+        super().__init__({"pipe": pipe})
+        self._loop = loop
+        self._pipe = pipe
+        self._fd = pipe.fileno()
+        self._protocol: Any = protocol
+        self._closing = False
+        self._paused = False
+
+        os.set_blocking(self._fd, False)
+        self._protocol.connection_made(self)
+        self._loop._add_reader(self._fd, self._read_ready)
+
+    def _read_ready(self) -> None:
+        try:
+            data = os.read(self._fd, _MAX_READ_SIZE)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError as e:
+            self._close(e)
+            return
+        if data:
+            try:
+                self._protocol.data_received(data)
+            except (SystemExit, KeyboardInterrupt):
+                raise
+            except BaseException as e:
+                self._fatal_error(e, "Fatal error: protocol.data_received() call failed.")
+        else:
+            self._closing = True
+            self._loop.remove_reader(self._fd)
+            self._loop.call_soon(self._protocol.eof_received)
+            self._loop.call_soon(self._call_connection_lost, None)
+
+    def is_reading(self) -> bool:
+        return not self._paused and not self._closing
+
+    def pause_reading(self) -> None:
+        if self._closing or self._paused:
+            return
+        self._paused = True
+        self._loop.remove_reader(self._fd)
+
+    def resume_reading(self) -> None:
+        if self._closing or not self._paused:
+            return
+        self._paused = False
+        self._loop._add_reader(self._fd, self._read_ready)
+
+    def set_protocol(self, protocol: asyncio.BaseProtocol) -> None:
+        self._protocol = protocol
+
+    def get_protocol(self) -> asyncio.BaseProtocol:
+        return self._protocol
+
+    def is_closing(self) -> bool:
+        return self._closing
+
+    def close(self) -> None:
+        if not self._closing:
+            self._close(None)
+
+    def _fatal_error(self, exception: BaseException, message: str) -> None:
+        if not isinstance(exception, OSError):
+            self._loop.call_exception_handler({
+                "message": message,
+                "exception": exception,
+                "transport": self,
+                "protocol": self._protocol,
+            })
+        if not self._closing:
+            self._close(exception)
+
+    def _close(self, exception: BaseException | None) -> None:
+        self._closing = True
+        self._loop.remove_reader(self._fd)
+        self._loop.call_soon(self._call_connection_lost, exception)
+
+    def _call_connection_lost(self, exception: BaseException | None) -> None:
+        try:
+            self._protocol.connection_lost(exception)
+        finally:
+            self._pipe.close()
+
+
+class QAsyncioWritePipeTransport(asyncio.WriteTransport):
+    """
+    A transport for the writing end of a pipe. Data that cannot be written
+    right away is buffered and written once the pipe becomes writable (see
+    QAsyncioEventLoop.add_writer()).
+    """
+
+    def __init__(self, loop: "events.QAsyncioEventLoop", pipe: Any,
+                 protocol: asyncio.BaseProtocol) -> None:
+        super().__init__({"pipe": pipe})
+        self._loop = loop
+        self._pipe = pipe
+        self._fd = pipe.fileno()
+        self._protocol: Any = protocol
+        self._buffer = bytearray()
+        self._closing = False
+        self._conn_lost = False
+        self._protocol_paused = False
+        self._high_water, self._low_water = _check_buffer_limits(None, None)
+
+        os.set_blocking(self._fd, False)
+        self._protocol.connection_made(self)
+
+    def write(self, data: bytes | bytearray | memoryview) -> None:
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            raise TypeError(f"data argument must be a bytes-like object, "
+                            f"not {type(data).__name__!r}")
+        if self._closing:
+            raise RuntimeError("Cannot call write() after write_eof() or close()")
+        if not data or self._conn_lost:
+            return
+        if not self._buffer:
+            try:
+                written = os.write(self._fd, data)
+            except (BlockingIOError, InterruptedError):
+                written = 0
+            except OSError as e:
+                self._fatal_error(e)
+                return
+            if written == len(data):
+                return
+            data = memoryview(data)[written:]
+            self._loop._add_writer(self._fd, self._write_ready)
+        self._buffer += data
+        self._maybe_pause_protocol()
+
+    def _write_ready(self) -> None:
+        try:
+            written = os.write(self._fd, self._buffer)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError as e:
+            self._fatal_error(e)
+            return
+        del self._buffer[:written]
+        if len(self._buffer) <= self._low_water and self._protocol_paused:
+            self._protocol_paused = False
+            _call_protocol(self._loop, self, self._protocol, "resume_writing")
+        if not self._buffer:
+            self._loop.remove_writer(self._fd)
+            if self._closing:
+                self._finish(None)
+
+    def _maybe_pause_protocol(self) -> None:
+        if not self._protocol_paused and len(self._buffer) > self._high_water:
+            self._protocol_paused = True
+            _call_protocol(self._loop, self, self._protocol, "pause_writing")
+
+    def can_write_eof(self) -> bool:
+        return True
+
+    def write_eof(self) -> None:
+        self.close()
+
+    def get_write_buffer_size(self) -> int:
+        return len(self._buffer)
+
+    def get_write_buffer_limits(self) -> tuple[int, int]:
+        return (self._low_water, self._high_water)
+
+    def set_write_buffer_limits(self, high: int | None = None, low: int | None = None) -> None:
+        self._high_water, self._low_water = _check_buffer_limits(high, low)
+        self._maybe_pause_protocol()
+
+    def set_protocol(self, protocol: asyncio.BaseProtocol) -> None:
+        self._protocol = protocol
+
+    def get_protocol(self) -> asyncio.BaseProtocol:
+        return self._protocol
+
+    def is_closing(self) -> bool:
+        return self._closing
+
+    def close(self) -> None:
+        if self._closing:
+            return
+        self._closing = True
+        if not self._buffer:
+            self._finish(None)
+
+    def abort(self) -> None:
+        self._closing = True
+        self._buffer.clear()
+        self._loop.remove_writer(self._fd)
+        self._finish(None)
+
+    def _fatal_error(self, exception: BaseException) -> None:
+        self._closing = True
+        self._buffer.clear()
+        self._loop.remove_writer(self._fd)
+        self._finish(exception)
+
+    def _finish(self, exception: BaseException | None) -> None:
+        if self._conn_lost:
+            return
+        self._conn_lost = True
+        self._loop.call_soon(self._call_connection_lost, exception)
+
+    def _call_connection_lost(self, exception: BaseException | None) -> None:
+        try:
+            self._protocol.connection_lost(exception)
+        finally:
+            self._pipe.close()
+
+
+class QAsyncioProcessPipeTransport(asyncio.ReadTransport, asyncio.WriteTransport):
+    """
+    A transport for one of the standard streams of a subprocess started with
+    a QProcess. The QProcess does the actual reading and writing; this
+    transport forwards the data and the flow control to the subprocess
+    protocol.
+    """
+
+    def __init__(self, process_transport: QAsyncioSubprocessTransport, fd: int) -> None:
+        super().__init__()
+        self._process_transport = process_transport
+        self._process = process_transport._process
+        self._fd = fd
+        self._closing = False
+        self._disconnected = False
+        self._paused = False
+        self._protocol_paused = False
+        self._high_water, self._low_water = _check_buffer_limits(None, None)
+
+    def _connection_lost(self, exception: BaseException | None) -> None:
+        if self._disconnected:
+            return
+        self._disconnected = True
+        self._closing = True
+        self._process_transport._pipe_connection_lost(self._fd, exception)
+
+    # Reading (standard output and standard error)
+
+    def _read_ready(self) -> None:
+        if self._paused or self._disconnected:
+            return
+        if self._fd == _STDOUT:
+            data = self._process.readAllStandardOutput()
+        else:
+            data = self._process.readAllStandardError()
+        if not data.isEmpty():
+            self._process_transport._pipe_data_received(self._fd, data.data())
+
+    def is_reading(self) -> bool:
+        return not self._paused and not self._closing
+
+    def pause_reading(self) -> None:
+        # The data keeps being buffered by the QProcess until reading is
+        # resumed.
+        self._paused = True
+
+    def resume_reading(self) -> None:
+        if not self._paused:
+            return
+        self._paused = False
+        self._process_transport._loop.call_soon(self._read_ready)
+
+    # Writing (standard input)
+
+    def write(self, data: bytes | bytearray | memoryview) -> None:
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            raise TypeError(f"data argument must be a bytes-like object, "
+                            f"not {type(data).__name__!r}")
+        if self._closing:
+            raise RuntimeError("Cannot call write() after write_eof() or close()")
+        if not data:
+            return
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        self._process.write(data)
+        if not self._protocol_paused and self.get_write_buffer_size() > self._high_water:
+            self._protocol_paused = True
+            self._process_transport._pipe_pause_writing()
+
+    def _bytes_written(self) -> None:
+        size = self.get_write_buffer_size()
+        if self._protocol_paused and size <= self._low_water:
+            self._protocol_paused = False
+            self._process_transport._pipe_resume_writing()
+        if self._closing and size == 0:
+            self._connection_lost(None)
+
+    def can_write_eof(self) -> bool:
+        return True
+
+    def write_eof(self) -> None:
+        self.close()
+
+    def get_write_buffer_size(self) -> int:
+        return self._process.bytesToWrite() if self._fd == _STDIN else 0
+
+    def get_write_buffer_limits(self) -> tuple[int, int]:
+        return (self._low_water, self._high_water)
+
+    def set_write_buffer_limits(self, high: int | None = None, low: int | None = None) -> None:
+        self._high_water, self._low_water = _check_buffer_limits(high, low)
+
+    # Closing
+
+    def is_closing(self) -> bool:
+        return self._closing
+
+    def close(self) -> None:
+        if self._closing:
+            return
+        self._closing = True
+        if self._fd == _STDIN:
+            # The write channel is closed once all pending data is written.
+            self._process.closeWriteChannel()
+            if self.get_write_buffer_size() == 0:
+                self._process_transport._loop.call_soon(self._connection_lost, None)
+        else:
+            self._process.closeReadChannel(QProcess.ProcessChannel.StandardOutput
+                                           if self._fd == _STDOUT
+                                           else QProcess.ProcessChannel.StandardError)
+
+    def abort(self) -> None:
+        self.close()
+
+    def get_protocol(self) -> asyncio.BaseProtocol:
+        return self._process_transport.get_protocol()
+
+    def set_protocol(self, protocol: asyncio.BaseProtocol) -> None:
+        raise NotImplementedError("The protocol of a subprocess pipe cannot be changed")
+
+
+class QAsyncioSubprocessTransport(asyncio.SubprocessTransport):
+    """
+    A subprocess transport backed by a QProcess. The standard streams of the
+    subprocess are exposed as QAsyncioProcessPipeTransport instances.
+    """
+
+    def __init__(self, loop: "events.QAsyncioEventLoop", protocol: asyncio.SubprocessProtocol,
+                 process: QProcess, pipe_fds: list[int]) -> None:
+        super().__init__()
+        self._loop = loop
+        self._protocol: Any = protocol
+        self._process = process
+        self._pid: int | None = None
+        self._returncode: int | None = None
+        self._closed = False
+        self._finished = False
+        self._exit_waiters: list[asyncio.Future] | None = []
+        # The signal sent with send_signal(), terminate() or kill(), used to
+        # compute the return code of a process that did not exit normally.
+        self._sent_signal: int | None = None
+
+        self._pipes: dict[int, QAsyncioProcessPipeTransport] = {
+            fd: QAsyncioProcessPipeTransport(self, fd) for fd in pipe_fds}
+
+        process.readyReadStandardOutput.connect(self._stdout_ready)
+        process.readyReadStandardError.connect(self._stderr_ready)
+        process.bytesWritten.connect(self._bytes_written)
+        process.finished.connect(self._process_finished)
+
+    async def _start(self) -> None:
+        """ Start the process and wait until it has started. """
+        future = self._loop.create_future()
+
+        def on_started() -> None:
+            if not future.done():
+                future.set_result(None)
+
+        def on_error(error: QProcess.ProcessError) -> None:
+            if not future.done() and error == QProcess.ProcessError.FailedToStart:
+                program = self._process.program()
+                if shutil.which(program) is None:
+                    future.set_exception(FileNotFoundError(self._process.errorString()))
+                else:
+                    future.set_exception(OSError(self._process.errorString()))
+
+        self._process.started.connect(on_started)
+        self._process.errorOccurred.connect(on_error)
+        try:
+            self._process.start()
+            await future
+        finally:
+            self._process.started.disconnect(on_started)
+            self._process.errorOccurred.disconnect(on_error)
+        self._pid = self._process.processId()
+        self._loop._transports.add(self)
+        self._protocol.connection_made(self)
+
+    def __repr__(self) -> str:
+        info = [self.__class__.__name__, f"pid={self._pid}"]
+        if self._closed:
+            info.append("closed")
+        if self._returncode is not None:
+            info.append(f"returncode={self._returncode}")
+        return f"<{' '.join(info)}>"
+
+    def _stdout_ready(self) -> None:
+        if _STDOUT in self._pipes:
+            self._pipes[_STDOUT]._read_ready()
+
+    def _stderr_ready(self) -> None:
+        if _STDERR in self._pipes:
+            self._pipes[_STDERR]._read_ready()
+
+    def _bytes_written(self, *args: Any) -> None:
+        if _STDIN in self._pipes:
+            self._pipes[_STDIN]._bytes_written()
+
+    def _pipe_data_received(self, fd: int, data: bytes) -> None:
+        _call_protocol(self._loop, self, self._protocol, "pipe_data_received", fd, data)
+
+    def _pipe_connection_lost(self, fd: int, exception: BaseException | None) -> None:
+        self._loop.call_soon(_call_protocol, self._loop, self, self._protocol,
+                             "pipe_connection_lost", fd, exception)
+        self._try_finish()
+
+    def _pipe_pause_writing(self) -> None:
+        _call_protocol(self._loop, self, self._protocol, "pause_writing")
+
+    def _pipe_resume_writing(self) -> None:
+        _call_protocol(self._loop, self, self._protocol, "resume_writing")
+
+    def _process_finished(self, exit_code: int, exit_status: QProcess.ExitStatus) -> None:
+        if exit_status == QProcess.ExitStatus.NormalExit:
+            self._returncode = exit_code
+        elif sys.platform != "win32":
+            # On Unix, the exit code of a crashed process is the number of the
+            # signal that terminated it.
+            self._returncode = -exit_code
+        else:
+            self._returncode = exit_code if self._sent_signal is None else -self._sent_signal
+
+        # The QProcess emits finished() after reading all remaining output, so
+        # this is the end of the output streams as well.
+        for fd in (_STDOUT, _STDERR):
+            pipe = self._pipes.get(fd)
+            if pipe is not None:
+                pipe._paused = False
+                pipe._read_ready()
+                pipe._connection_lost(None)
+        pipe = self._pipes.get(_STDIN)
+        if pipe is not None:
+            pipe._connection_lost(None)
+
+        self._loop.call_soon(_call_protocol, self._loop, self, self._protocol,
+                             "process_exited")
+        self._try_finish()
+
+    def _try_finish(self) -> None:
+        if self._finished or self._returncode is None:
+            return
+        if all(pipe._disconnected for pipe in self._pipes.values()):
+            self._finished = True
+            self._loop.call_soon(self._call_connection_lost, None)
+
+    def _call_connection_lost(self, exception: BaseException | None) -> None:
+        try:
+            self._protocol.connection_lost(exception)
+        finally:
+            for waiter in self._exit_waiters or []:
+                if not waiter.cancelled():
+                    waiter.set_result(self._returncode)
+            self._exit_waiters = None
+            self._loop._transports.discard(self)
+            self._process.deleteLater()
+
+    async def _wait(self) -> int:
+        """
+        Wait until the process exits and return its return code. This is used
+        by asyncio.subprocess.Process.wait().
+        """
+        if self._returncode is not None and self._exit_waiters is None:
+            return self._returncode
+        waiter = self._loop.create_future()
+        self._exit_waiters.append(waiter)  # type: ignore[union-attr]
+        return await waiter
+
+    def get_pid(self) -> int | None:
+        return self._pid
+
+    def get_returncode(self) -> int | None:
+        return self._returncode
+
+    def get_pipe_transport(self, fd: int) -> QAsyncioProcessPipeTransport | None:
+        return self._pipes.get(fd)
+
+    def _check_process(self) -> None:
+        if self._closed:
+            raise ProcessLookupError()
+
+    def send_signal(self, sig: int) -> None:
+        self._check_process()
+        if self._returncode is not None:
+            return
+        self._sent_signal = sig
+        if sys.platform == "win32":
+            if sig == signal.SIGTERM:
+                self._process.terminate()
+            else:
+                self._process.kill()
+        else:
+            os.kill(self._process.processId(), sig)
+
+    def terminate(self) -> None:
+        self.send_signal(signal.SIGTERM)
+
+    def kill(self) -> None:
+        self._check_process()
+        if self._returncode is not None:
+            return
+        self._sent_signal = getattr(signal, "SIGKILL", None)
+        self._process.kill()
+
+    def set_protocol(self, protocol: asyncio.BaseProtocol) -> None:
+        self._protocol = protocol
+
+    def get_protocol(self) -> asyncio.BaseProtocol:
+        return self._protocol
+
+    def is_closing(self) -> bool:
+        return self._closed
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        for pipe in self._pipes.values():
+            if not pipe.is_closing():
+                pipe.close()
+        if self._returncode is None:
+            # As with asyncio, a process that is still running when the
+            # transport is closed is killed.
+            self._sent_signal = getattr(signal, "SIGKILL", None)
+            self._process.kill()
+
+
+def create_process(program: str, args: list[str], *, shell: bool, stdin: Any, stdout: Any,
+                   stderr: Any, cwd: Any = None, env: dict[str, str] | None = None,
+                   **kwargs: Any) -> tuple[QProcess, list[int]]:
+    """
+    Create a QProcess for the arguments of subprocess_exec() and
+    subprocess_shell(), and return it together with the file descriptors of
+    the standard streams that are connected to pipes.
+    """
+    if kwargs:
+        raise TypeError(f"Unsupported arguments for a QProcess: {', '.join(kwargs)}")
+
+    process = QProcess()
+    if shell:
+        if sys.platform == "win32":
+            process.setProgram(os.environ.get("COMSPEC", "cmd.exe"))
+            process.setNativeArguments(f"/c {program}")
+        else:
+            process.setProgram("/bin/sh")
+            process.setArguments(["-c", program])
+    else:
+        process.setProgram(os.fspath(program))
+        process.setArguments([os.fsdecode(arg) for arg in args])
+    if cwd is not None:
+        process.setWorkingDirectory(os.fspath(cwd))
+    if env is not None:
+        environment = QProcessEnvironment()
+        for key, value in env.items():
+            environment.insert(os.fsdecode(key), os.fsdecode(value))
+        process.setProcessEnvironment(environment)
+
+    pipe_fds = []
+    if stdin == subprocess.PIPE:
+        pipe_fds.append(_STDIN)
+    elif stdin is None:
+        process.setInputChannelMode(QProcess.InputChannelMode.ForwardedInputChannel)
+    elif stdin == subprocess.DEVNULL:
+        process.setStandardInputFile(QProcess.nullDevice())
+    else:
+        raise ValueError(f"Unsupported stdin for a QProcess: {stdin!r}")
+
+    forward_stdout = stdout is None
+    forward_stderr = stderr is None
+    if stdout == subprocess.PIPE:
+        pipe_fds.append(_STDOUT)
+    elif stdout == subprocess.DEVNULL:
+        process.setStandardOutputFile(QProcess.nullDevice())
+    elif stdout is not None:
+        raise ValueError(f"Unsupported stdout for a QProcess: {stdout!r}")
+
+    if stderr == subprocess.PIPE:
+        pipe_fds.append(_STDERR)
+    elif stderr == subprocess.STDOUT:
+        if forward_stdout:
+            # QProcess cannot merge standard error into a forwarded standard
+            # output; ForwardedChannels would keep them apart.
+            raise ValueError("stderr=subprocess.STDOUT is not supported for a QProcess "
+                             "whose stdout is inherited (stdout=None)")
+        process.setProcessChannelMode(QProcess.ProcessChannelMode.MergedChannels)
+        forward_stderr = False
+    elif stderr == subprocess.DEVNULL:
+        process.setStandardErrorFile(QProcess.nullDevice())
+    elif stderr is not None:
+        raise ValueError(f"Unsupported stderr for a QProcess: {stderr!r}")
+
+    if forward_stdout and forward_stderr:
+        process.setProcessChannelMode(QProcess.ProcessChannelMode.ForwardedChannels)
+    elif forward_stdout:
+        process.setProcessChannelMode(QProcess.ProcessChannelMode.ForwardedOutputChannel)
+    elif forward_stderr:
+        process.setProcessChannelMode(QProcess.ProcessChannelMode.ForwardedErrorChannel)
+    return process, pipe_fds
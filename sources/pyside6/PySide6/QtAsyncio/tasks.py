@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from . import events
 from . import futures
+from .futures import _PENDING, _CANCELLED, _DONE_WITH_RESULT, _DONE_WITH_EXCEPTION
 
 from typing import Any
 
@@ -16,6 +17,9 @@ import contextvars
 class QAsyncioTask(futures.QAsyncioFuture):
     """ https://docs.python.org/3/library/asyncio-task.html """
 
+    __slots__ = ("_coro", "_name", "_future_to_await", "_cancelled", "_cancel_count",
+                 "_log_destroy_pending")
+
     def __init__(self, coro: collections.abc.Generator | collections.abc.Coroutine, *,
                  loop: "events.QAsyncioEventLoop | None" = None, name: str | None = None,
                  context: contextvars.Context | None = None) -> None:
@@ -39,17 +43,22 @@ class QAsyncioTask(futures.QAsyncioFuture):
         self._cancel_count = 0
         self._cancel_message: str | None = None
 
+        # Set to False by asyncio.gather() for the tasks it creates. Currently
+        # unused, as destroying a pending task is not logged.
+        self._log_destroy_pending = True
+
         # https://docs.python.org/3/library/asyncio-extending.html#task-lifetime-support
         asyncio._register_task(self)  # type: ignore[arg-type]
+        self._loop._tasks_created += 1
 
     def __repr__(self) -> str:
-        if self._state == futures.QAsyncioFuture.FutureState.PENDING:
+        if self._state is _PENDING:
             state = "Pending"
-        elif self._state == futures.QAsyncioFuture.FutureState.DONE_WITH_RESULT:
+        elif self._state is _DONE_WITH_RESULT:
             state = "Done"
-        elif self._state == futures.QAsyncioFuture.FutureState.DONE_WITH_EXCEPTION:
+        elif self._state is _DONE_WITH_EXCEPTION:
             state = f"Done with exception ({repr(self._exception)})"
-        elif self._state == futures.QAsyncioFuture.FutureState.CANCELLED:
+        elif self._state is _CANCELLED:
             state = "Cancelled"
 
         return f"Task '{self.get_name()}' with state: {state}"
@@ -105,13 +114,13 @@ class QAsyncioTask(futures.QAsyncioFuture):
             else:
                 result = self._coro.send(None)
         except StopIteration as e:
-            self._state = futures.QAsyncioFuture.FutureState.DONE_WITH_RESULT
+            self._state = _DONE_WITH_RESULT
             self._result = e.value
         except (concurrent.futures.CancelledError, asyncio.exceptions.CancelledError) as e:
-            self._state = futures.QAsyncioFuture.FutureState.CANCELLED
+            self._state = _CANCELLED
             self._exception = e
         except BaseException as e:
-            self._state = futures.QAsyncioFuture.FutureState.DONE_WITH_EXCEPTION
+            self._state = _DONE_WITH_EXCEPTION
             self._exception = e
         else:
             if asyncio.futures.isfuture(result):
@@ -167,6 +176,7 @@ class QAsyncioTask(futures.QAsyncioFuture):
 
                 # https://docs.python.org/3/library/asyncio-extending.html#task-lifetime-support
                 asyncio._unregister_task(self)  # type: ignore[arg-type]
+                self._loop._tasks_completed += 1
 
     def get_stack(self, *, limit=None) -> list[Any]:
         # TODO
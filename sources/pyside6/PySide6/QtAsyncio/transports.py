@@ -0,0 +1,752 @@
+# Copyright (C) 2024 The Qt Company Ltd.
+# SPDX-License-Identifier: LicenseRef-Qt-Commercial OR LGPL-3.0-only OR GPL-2.0-only OR GPL-3.0-only
+from __future__ import annotations
+
+from PySide6.QtCore import QByteArray
+from PySide6.QtNetwork import (QAbstractSocket, QHostAddress, QLocalServer, QLocalSocket,
+                               QSsl, QSslCertificate, QSslConfiguration, QSslServer,
+                               QSslSocket, QTcpServer, QTcpSocket)
+
+from . import events
+from . import futures
+
+from typing import Any, Callable
+
+import asyncio
+import os
+import socket
+import stat
+
+try:
+    import ssl
+except ImportError:  # pragma: no cover
+    ssl = None  # type: ignore[assignment]
+
+# The default high water mark of the write buffer, as in asyncio.
+_DEFAULT_HIGH_WATER = 64 * 1024
+
+# The size of the Qt read buffer of a socket while reading is paused. Once the
+# buffer is full, no more data is read from the operating system, which
+# eventually causes the peer to stop sending.
+_PAUSED_READ_BUFFER_SIZE = 64 * 1024
+
+# The size of the chunks in which files are sent with sendfile().
+_SENDFILE_BLOCK_SIZE = 256 * 1024
+
+# The protocols of Qt for the minimum TLS versions of an ssl.SSLContext. False
+# keeps the default of Qt, which only allows secure protocols.
+_SSL_PROTOCOLS: dict[Any, Any] = {}
+if ssl is not None:
+    _SSL_PROTOCOLS = {
+        ssl.TLSVersion.MINIMUM_SUPPORTED: False,
+        ssl.TLSVersion.TLSv1_2: QSsl.SslProtocol.TlsV1_2OrLater,
+        ssl.TLSVersion.TLSv1_3: QSsl.SslProtocol.TlsV1_3OrLater,
+    }
+
+# The errors of QAbstractSocket and QLocalSocket that map to a more specific
+# OSError than OSError itself.
+_EXCEPTION_TYPES: dict[str, type[OSError]] = {
+    "ConnectionRefusedError": ConnectionRefusedError,
+    "RemoteHostClosedError": ConnectionResetError,
+    "PeerClosedError": ConnectionResetError,
+    "HostNotFoundError": socket.gaierror,
+    "ServerNotFoundError": FileNotFoundError,
+    "SocketAccessError": PermissionError,
+    "SocketTimeoutError": TimeoutError,
+}
+
+# The errors that are emitted when the peer closes the connection, which is
+# not an error from the point of view of asyncio.
+_PEER_CLOSED_ERRORS = ("RemoteHostClosedError", "PeerClosedError")
+
+
+def _socket_exception(qsocket: QAbstractSocket | QLocalSocket) -> OSError:
+    """ Convert the last error of a socket into an OSError. """
+    exception_type = _EXCEPTION_TYPES.get(qsocket.error().name, OSError)
+    return exception_type(qsocket.errorString())
+
+
+def _ssl_configuration(ssl_context: Any, server_side: bool = False) -> QSslConfiguration:
+    """
+    Create a QSslConfiguration for the ssl argument of the asyncio API, which
+    can be True, a QSslConfiguration, or an ssl.SSLContext of a client.
+
+    The verification mode, the hostname check, the minimum protocol version
+    and the loaded CA certificates of an ssl.SSLContext are transferred.
+    NotImplementedError is raised for settings that have no equivalent in Qt.
+    A certificate chain loaded with load_cert_chain() cannot be read back
+    from an ssl.SSLContext; client certificates require a QSslConfiguration.
+    """
+    if isinstance(ssl_context, QSslConfiguration):
+        return ssl_context
+    configuration = QSslConfiguration.defaultConfiguration()
+    if ssl_context is True:
+        return configuration
+    if ssl is None or not isinstance(ssl_context, ssl.SSLContext):
+        raise TypeError("ssl argument must be True, a QSslConfiguration or an ssl.SSLContext, "
+                        f"got {ssl_context!r}")
+    if server_side:
+        # The certificate and the private key of an ssl.SSLContext cannot be
+        # transferred to Qt.
+        raise TypeError("ssl argument of a server must be a QSslConfiguration")
+
+    if ssl_context.verify_mode == ssl.CERT_NONE:
+        configuration.setPeerVerifyMode(QSslSocket.PeerVerifyMode.VerifyNone)
+    else:
+        # Qt always checks the hostname when verifying the peer.
+        if not ssl_context.check_hostname:
+            raise NotImplementedError("ssl.SSLContext.check_hostname = False is only "
+                                      "supported with verify_mode = ssl.CERT_NONE")
+        configuration.setPeerVerifyMode(QSslSocket.PeerVerifyMode.VerifyPeer)
+    if ssl_context.verify_flags & (ssl.VERIFY_CRL_CHECK_LEAF | ssl.VERIFY_CRL_CHECK_CHAIN):
+        raise NotImplementedError("CRL checks of an ssl.SSLContext are not supported")
+
+    minimum_version = _SSL_PROTOCOLS.get(ssl_context.minimum_version)
+    if minimum_version is None:
+        raise NotImplementedError("ssl.SSLContext.minimum_version = "
+                                  f"{ssl_context.minimum_version!r} is not supported")
+    if minimum_version is not False:
+        configuration.setProtocol(minimum_version)
+    if ssl_context.maximum_version != ssl.TLSVersion.MAXIMUM_SUPPORTED:
+        raise NotImplementedError("ssl.SSLContext.maximum_version is not supported")
+
+    # CA certificates that are looked up lazily in a directory are not listed
+    # here; in that case, the system CA certificates of Qt are used.
+    ca_certificates = ssl_context.get_ca_certs(binary_form=True)
+    if ca_certificates:
+        configuration.setCaCertificates(
+            [QSslCertificate(QByteArray(der), QSsl.EncodingFormat.Der)
+             for der in ca_certificates])
+    return configuration
+
+
+async def _wait_for_signal(loop: "events.QAsyncioEventLoop",
+                           qsocket: QAbstractSocket | QLocalSocket, signal: Any,
+                           start: Callable, timeout: float | None = None) -> None:
+    """
+    Call start() and wait until a signal of a socket is emitted, or raise an
+    OSError if the socket reports an error before. The signal is connected
+    before start() is called, as it might be emitted synchronously.
+    """
+    future = loop.create_future()
+
+    def on_signal(*args: Any) -> None:
+        if not future.done():
+            future.set_result(None)
+
+    def on_error(*args: Any) -> None:
+        if not future.done():
+            future.set_exception(_socket_exception(qsocket))
+
+    signal.connect(on_signal)
+    qsocket.errorOccurred.connect(on_error)
+    try:
+        start()
+        if timeout is not None:
+            await asyncio.wait_for(future, timeout)
+        else:
+            await future
+    finally:
+        signal.disconnect(on_signal)
+        qsocket.errorOccurred.disconnect(on_error)
+
+
+async def open_tcp_socket(loop: "events.QAsyncioEventLoop", host: str | None,
+                          port: int | None, *, ssl_context: Any = None,
+                          server_hostname: str | None = None,
+                          local_addr: tuple[str, int] | None = None,
+                          sock: socket.socket | None = None,
+                          ssl_handshake_timeout: float | None = None) -> QSslSocket | QTcpSocket:
+    """
+    Open a TCP connection. If SSL is supported, the connection uses a
+    QSslSocket, so that it can be upgraded to TLS with start_tls() later.
+    """
+    qsocket = QSslSocket() if QSslSocket.supportsSsl() else QTcpSocket()
+    try:
+        if sock is not None:
+            if not qsocket.setSocketDescriptor(sock.detach()):
+                raise _socket_exception(qsocket)
+        else:
+            if local_addr is not None:
+                if not qsocket.bind(QHostAddress(local_addr[0]), local_addr[1]):
+                    raise _socket_exception(qsocket)
+            await _wait_for_signal(loop, qsocket, qsocket.connected,
+                                   lambda: qsocket.connectToHost(host, port))
+        if ssl_context:
+            if not isinstance(qsocket, QSslSocket):
+                raise RuntimeError("SSL is not supported")
+            await start_encryption(loop, qsocket, ssl_context, server_side=False,
+                                   server_hostname=server_hostname or host,
+                                   ssl_handshake_timeout=ssl_handshake_timeout)
+    except BaseException:
+        qsocket.abort()
+        qsocket.deleteLater()
+        raise
+    return qsocket
+
+
+async def open_local_socket(loop: "events.QAsyncioEventLoop", path: str | None, *,
+                            sock: socket.socket | None = None) -> QLocalSocket:
+    """ Open a connection to a local server, i.e., a Unix domain socket. """
+    qsocket = QLocalSocket()
+    try:
+        if sock is not None:
+            if not qsocket.setSocketDescriptor(sock.detach()):
+                raise _socket_exception(qsocket)
+        else:
+            await _wait_for_signal(loop, qsocket, qsocket.connected,
+                                   lambda: qsocket.connectToServer(os.fspath(path)))
+    except BaseException:
+        qsocket.abort()
+        qsocket.deleteLater()
+        raise
+    return qsocket
+
+
+async def start_encryption(loop: "events.QAsyncioEventLoop", qsocket: QSslSocket,
+                           ssl_context: Any, *, server_side: bool,
+                           server_hostname: str | None = None,
+                           ssl_handshake_timeout: float | None = None) -> None:
+    """ Perform the TLS handshake on a connected socket. """
+    qsocket.setSslConfiguration(_ssl_configuration(ssl_context, server_side))
+    if server_side:
+        start = qsocket.startServerEncryption
+    else:
+        if server_hostname:
+            qsocket.setPeerVerifyName(server_hostname)
+        start = qsocket.startClientEncryption
+    await _wait_for_signal(loop, qsocket, qsocket.encrypted, start, ssl_handshake_timeout)
+
+
+async def listen_tcp(loop: "events.QAsyncioEventLoop", hosts: list[str | None], port: int | None,
+                     *, family: int, flags: int, sock: socket.socket | None,
+                     backlog: int, ssl_context: Any, reuse_port: bool | None,
+                     ssl_handshake_timeout: float | None) -> list[QTcpServer]:
+    """ Create a listening QTcpServer (or QSslServer) for each host address. """
+    if reuse_port:
+        raise ValueError("reuse_port is not supported")
+    if ssl_context and not isinstance(ssl_context, QSslConfiguration):
+        # The certificate and the private key of an ssl.SSLContext cannot be
+        # transferred to Qt.
+        raise TypeError("ssl argument of a server must be a QSslConfiguration")
+
+    def create_server() -> QTcpServer:
+        if ssl_context:
+            server = QSslServer()
+            server.setSslConfiguration(ssl_context)
+            if ssl_handshake_timeout is not None:
+                server.setHandshakeTimeout(round(ssl_handshake_timeout * 1000))
+        else:
+            server = QTcpServer()
+        server.setListenBacklogSize(backlog)
+        return server
+
+    servers = []
+    try:
+        if sock is not None:
+            server = create_server()
+            servers.append(server)
+            if not server.setSocketDescriptor(sock.detach()):
+                raise OSError(server.errorString())
+            return servers
+
+        addresses: list[QHostAddress] = []
+        for host in hosts:
+            if host is None or host == "":
+                addresses.append(QHostAddress(QHostAddress.SpecialAddress.Any))
+                continue
+            infos = await loop.getaddrinfo(host, port, family=family,
+                                           type=socket.SOCK_STREAM, flags=flags)
+            for *_, sockaddr in infos:
+                address = QHostAddress(sockaddr[0])
+                if address not in addresses:
+                    addresses.append(address)
+        for address in addresses:
+            server = create_server()
+            servers.append(server)
+            if not server.listen(address, port or 0):
+                raise OSError(f"could not bind on address {(address.toString(), port)!r}: "
+                              f"{server.errorString()}")
+    except BaseException:
+        for server in servers:
+            server.close()
+            server.deleteLater()
+        raise
+    return servers
+
+
+def listen_local(path: str | None, *, sock: socket.socket | None,
+                 backlog: int) -> QLocalServer:
+    """ Create a listening QLocalServer, i.e., a Unix domain socket server. """
+    server = QLocalServer()
+    server.setListenBacklogSize(backlog)
+    if sock is not None:
+        if not server.listen(sock.detach()):
+            raise OSError(server.errorString())
+        return server
+    path = os.fspath(path)  # type: ignore[arg-type]
+    # Remove a stale Unix domain socket, as asyncio does.
+    try:
+        if stat.S_ISSOCK(os.stat(path).st_mode):
+            os.remove(path)
+    except FileNotFoundError:
+        pass
+    if not server.listen(path):
+        raise OSError(f"could not bind on address {path!r}: {server.errorString()}")
+    return server
+
+
+class QAsyncioSocketTransport(asyncio.Transport):
+    """
+    A streaming transport backed by a QTcpSocket, a QSslSocket or a
+    QLocalSocket. Data written to the transport is buffered by the socket, and
+    the protocol is paused when the size of this buffer exceeds the high water
+    mark, and resumed when it drops to the low water mark.
+    """
+
+    def __init__(self, loop: "events.QAsyncioEventLoop",
+                 qsocket: QAbstractSocket | QLocalSocket, protocol: asyncio.BaseProtocol,
+                 server: QAsyncioServer | None = None, *,
+                 call_connection_made: bool = True) -> None:
+        super().__init__(self._create_extra(qsocket))
+        self._loop = loop
+        self._socket = qsocket
+        self._protocol: Any = protocol
+        self._server = server
+
+        # Accepted sockets are children of their server by default, and would
+        # be deleted together with it.
+        qsocket.setParent(None)
+
+        self._closing = False
+        self._conn_lost = False
+        self._paused = False
+        self._protocol_paused = False
+        self._high_water = _DEFAULT_HIGH_WATER
+        self._low_water = _DEFAULT_HIGH_WATER // 4
+
+        # Futures that are waiting for the write buffer to drain, see _drain().
+        self._drain_waiters: list[futures.QAsyncioFuture] = []
+
+        qsocket.readyRead.connect(self._read_ready)
+        qsocket.bytesWritten.connect(self._bytes_written)
+        qsocket.disconnected.connect(self._disconnected)
+        qsocket.errorOccurred.connect(self._error_occurred)
+
+        self._loop._transports.add(self)
+        if self._server is not None:
+            self._server._attach()
+
+        if call_connection_made:
+            self._protocol.connection_made(self)
+        if qsocket.bytesAvailable():
+            self._loop.call_soon(self._read_ready)
+
+    @staticmethod
+    def _create_extra(qsocket: QAbstractSocket | QLocalSocket) -> dict[str, Any]:
+        if isinstance(qsocket, QLocalSocket):
+            return {"peername": qsocket.fullServerName(), "sockname": None}
+        return {"peername": (qsocket.peerAddress().toString(), qsocket.peerPort()),
+                "sockname": (qsocket.localAddress().toString(), qsocket.localPort())}
+
+    def __repr__(self) -> str:
+        state = "closed" if self._conn_lost else "closing" if self._closing else "open"
+        return f"<{self.__class__.__name__} {state} socket={self._socket!r}>"
+
+    # Reading
+
+    def _read_ready(self) -> None:
+        if self._paused or self._conn_lost:
+            return
+        data = self._socket.readAll()
+        if data.isEmpty():
+            return
+        try:
+            self._protocol.data_received(data.data())
+        except (SystemExit, KeyboardInterrupt):
+            raise
+        except BaseException as e:
+            self._fatal_error(e, "Fatal error: protocol.data_received() call failed.")
+
+    def is_reading(self) -> bool:
+        return not self._paused and not self._closing
+
+    def pause_reading(self) -> None:
+        if self._closing or self._paused:
+            return
+        self._paused = True
+        self._socket.setReadBufferSize(_PAUSED_READ_BUFFER_SIZE)
+
+    def resume_reading(self) -> None:
+        if self._closing or not self._paused:
+            return
+        self._paused = False
+        self._socket.setReadBufferSize(0)
+        if self._socket.bytesAvailable():
+            self._loop.call_soon(self._read_ready)
+
+    # Writing
+
+    def write(self, data: bytes | bytearray | memoryview) -> None:
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            raise TypeError(f"data argument must be a bytes-like object, "
+                            f"not {type(data).__name__!r}")
+        if not data or self._conn_lost:
+            return
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        self._socket.write(data)
+        self._maybe_pause_protocol()
+
+    def writelines(self, list_of_data: Any) -> None:
+        self.write(b"".join(list_of_data))
+
+    def can_write_eof(self) -> bool:
+        # Neither QAbstractSocket nor QLocalSocket support half-closing the
+        # connection.
+        return False
+
+    def get_write_buffer_size(self) -> int:
+        return self._socket.bytesToWrite()
+
+    def get_write_buffer_limits(self) -> tuple[int, int]:
+        return (self._low_water, self._high_water)
+
+    def set_write_buffer_limits(self, high: int | None = None, low: int | None = None) -> None:
+        if high is None:
+            high = _DEFAULT_HIGH_WATER if low is None else 4 * low
+        if low is None:
+            low = high // 4
+        if not high >= low >= 0:
+            raise ValueError(f"high ({high!r}) must be >= low ({low!r}) must be >= 0")
+        self._high_water = high
+        self._low_water = low
+        self._maybe_pause_protocol()
+
+    def _maybe_pause_protocol(self) -> None:
+        if self._protocol_paused or self.get_write_buffer_size() <= self._high_water:
+            return
+        self._protocol_paused = True
+        try:
+            self._protocol.pause_writing()
+        except (SystemExit, KeyboardInterrupt):
+            raise
+        except BaseException as e:
+            self._loop.call_exception_handler({
+                "message": "protocol.pause_writing() failed",
+                "exception": e,
+                "transport": self,
+                "protocol": self._protocol,
+            })
+
+    def _bytes_written(self, *args: Any) -> None:
+        if self.get_write_buffer_size() > self._low_water:
+            return
+        self._wake_drain_waiters(None)
+        if not self._protocol_paused:
+            return
+        self._protocol_paused = False
+        try:
+            self._protocol.resume_writing()
+        except (SystemExit, KeyboardInterrupt):
+            raise
+        except BaseException as e:
+            self._loop.call_exception_handler({
+                "message": "protocol.resume_writing() failed",
+                "exception": e,
+                "transport": self,
+                "protocol": self._protocol,
+            })
+
+    def _wake_drain_waiters(self, exception: BaseException | None) -> None:
+        waiters = self._drain_waiters
+        self._drain_waiters = []
+        for waiter in waiters:
+            if waiter.done():
+                continue
+            if exception is None:
+                waiter.set_result(None)
+            else:
+                waiter.set_exception(exception)
+
+    async def _drain(self) -> None:
+        """ Wait until the write buffer dropped to the low water mark. """
+        if self._conn_lost:
+            raise ConnectionResetError("Connection lost")
+        if self.get_write_buffer_size() <= self._high_water:
+            return
+        waiter = self._loop.create_future()
+        self._drain_waiters.append(waiter)
+        await waiter
+
+    async def _sendfile(self, file: Any, offset: int, count: int | None) -> int:
+        """
+        Send a file in chunks that are read into a reusable buffer, waiting for
+        the write buffer to drain between chunks.
+        """
+        if offset:
+            file.seek(offset)
+        blocksize = min(count, _SENDFILE_BLOCK_SIZE) if count else _SENDFILE_BLOCK_SIZE
+        buffer = bytearray(blocksize)
+        total_sent = 0
+        try:
+            while True:
+                if count:
+                    blocksize = min(count - total_sent, blocksize)
+                    if blocksize <= 0:
+                        return total_sent
+                read = await self._loop.run_in_executor(
+                    None, file.readinto, memoryview(buffer)[:blocksize])
+                if not read:
+                    return total_sent
+                await self._drain()
+                self.write(buffer if read == len(buffer) else buffer[:read])
+                total_sent += read
+        finally:
+            if total_sent > 0 and hasattr(file, "seek"):
+                file.seek(offset + total_sent)
+
+    # Closing
+
+    def is_closing(self) -> bool:
+        return self._closing
+
+    def close(self) -> None:
+        if self._closing:
+            return
+        self._closing = True
+        if self._socket.state().name == "UnconnectedState":
+            self._schedule_connection_lost(None)
+        elif isinstance(self._socket, QLocalSocket):
+            # Pending data is written before the connection is closed, which
+            # then emits the disconnected signal.
+            self._socket.disconnectFromServer()
+        else:
+            self._socket.disconnectFromHost()
+
+    def abort(self) -> None:
+        self._closing = True
+        self._schedule_connection_lost(None)
+        self._socket.abort()
+
+    def _disconnected(self) -> None:
+        if self._conn_lost:
+            return
+        if not self._closing:
+            # The peer closed the connection. Deliver the remaining data and
+            # the end of the stream first.
+            self._read_ready()
+            try:
+                self._protocol.eof_received()
+            except (SystemExit, KeyboardInterrupt):
+                raise
+            except BaseException as e:
+                self._fatal_error(e, "Fatal error: protocol.eof_received() call failed.")
+                return
+            self._closing = True
+        self._schedule_connection_lost(None)
+
+    def _error_occurred(self, *args: Any) -> None:
+        if self._conn_lost or self._socket.error().name in _PEER_CLOSED_ERRORS:
+            # The disconnected signal will follow.
+            return
+        self._fatal_error(_socket_exception(self._socket), "Fatal error on transport")
+
+    def _fatal_error(self, exception: BaseException, message: str) -> None:
+        if not isinstance(exception, OSError):
+            self._loop.call_exception_handler({
+                "message": message,
+                "exception": exception,
+                "transport": self,
+                "protocol": self._protocol,
+            })
+        self._closing = True
+        self._schedule_connection_lost(exception)
+        self._socket.abort()
+
+    def _schedule_connection_lost(self, exception: BaseException | None) -> None:
+        if self._conn_lost:
+            return
+        self._conn_lost = True
+        self._loop.call_soon(self._call_connection_lost, exception)
+
+    def _call_connection_lost(self, exception: BaseException | None) -> None:
+        try:
+            self._protocol.connection_lost(exception)
+        finally:
+            self._wake_drain_waiters(ConnectionResetError("Connection lost"))
+            self._disconnect_socket()
+            self._socket.deleteLater()
+            self._loop._transports.discard(self)
+            if self._server is not None:
+                self._server._detach()
+                self._server = None
+
+    def _disconnect_socket(self) -> None:
+        self._socket.readyRead.disconnect(self._read_ready)
+        self._socket.bytesWritten.disconnect(self._bytes_written)
+        self._socket.disconnected.disconnect(self._disconnected)
+        self._socket.errorOccurred.disconnect(self._error_occurred)
+
+    def _detach_socket(self) -> QAbstractSocket | QLocalSocket:
+        """
+        Detach the socket from this transport without closing it, so that a
+        new transport can take it over (see start_tls()).
+        """
+        self._closing = True
+        self._conn_lost = True
+        self._disconnect_socket()
+        self._wake_drain_waiters(ConnectionResetError("Transport was upgraded to TLS"))
+        self._loop._transports.discard(self)
+        if self._server is not None:
+            self._server._detach()
+        return self._socket
+
+    def set_protocol(self, protocol: asyncio.BaseProtocol) -> None:
+        self._protocol = protocol
+
+    def get_protocol(self) -> asyncio.BaseProtocol:
+        return self._protocol
+
+
+class QAsyncioServer(asyncio.AbstractServer):
+    """
+    A server backed by one or more QTcpServer, QSslServer or QLocalServer
+    instances. A QAsyncioSocketTransport is created for every incoming
+    connection.
+    """
+
+    def __init__(self, loop: "events.QAsyncioEventLoop",
+                 servers: list[QTcpServer] | list[QLocalServer],
+                 protocol_factory: Callable) -> None:
+        self._loop = loop
+        self._servers: list[QTcpServer] | list[QLocalServer] | None = servers
+        self._protocol_factory = protocol_factory
+        self._active_count = 0
+        self._waiters: list[futures.QAsyncioFuture] | None = []
+        self._serving = False
+        self._serving_forever_future: futures.QAsyncioFuture | None = None
+        self._sockets: tuple[Any, ...] | None = None
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} servers={self._servers!r}>"
+
+    def _attach(self) -> None:
+        self._active_count += 1
+
+    def _detach(self) -> None:
+        self._active_count -= 1
+        if self._active_count == 0 and self._servers is None:
+            self._wakeup()
+
+    def _wakeup(self) -> None:
+        waiters = self._waiters
+        self._waiters = None
+        for waiter in waiters or []:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    def _start_serving(self) -> None:
+        if self._serving or self._servers is None:
+            return
+        self._serving = True
+        for server in self._servers:
+            server.newConnection.connect(self._accept_connections)
+            # Accept the connections that came in before serving started.
+            self._accept_connections(server)
+
+    def _accept_connections(self, server: QTcpServer | QLocalServer | None = None) -> None:
+        if self._servers is None:
+            return
+        for server in ([server] if server is not None else self._servers):
+            while server.hasPendingConnections():
+                qsocket = server.nextPendingConnection()
+                try:
+                    protocol = self._protocol_factory()
+                except (SystemExit, KeyboardInterrupt):
+                    raise
+                except BaseException as e:
+                    qsocket.abort()
+                    qsocket.deleteLater()
+                    self._loop.call_exception_handler({
+                        "message": "Error in protocol factory of a server",
+                        "exception": e,
+                    })
+                    continue
+                QAsyncioSocketTransport(self._loop, qsocket, protocol, self)
+
+    def get_loop(self) -> asyncio.AbstractEventLoop:
+        return self._loop
+
+    def is_serving(self) -> bool:
+        return self._serving
+
+    @property
+    def sockets(self) -> tuple[Any, ...]:
+        if self._servers is None:
+            return ()
+        if self._sockets is None:
+            sockets = []
+            for server in self._servers:
+                if isinstance(server, QLocalServer):
+                    continue
+                family = (socket.AF_INET6
+                          if server.serverAddress().protocol()
+                          == QAbstractSocket.NetworkLayerProtocol.IPv6Protocol
+                          else socket.AF_INET)
+                # The duplicated socket only provides information about the
+                # listening socket, such as getsockname().
+                sockets.append(asyncio.trsock.TransportSocket(socket.fromfd(
+                    server.socketDescriptor(), family, socket.SOCK_STREAM)))
+            self._sockets = tuple(sockets)
+        return self._sockets
+
+    def close(self) -> None:
+        servers = self._servers
+        if servers is None:
+            return
+        self._servers = None
+        for server in servers:
+            server.close()
+            server.deleteLater()
+        for sock in self._sockets or ():
+            sock._sock.close()
+        self._sockets = None
+        self._serving = False
+
+        if (self._serving_forever_future is not None
+                and not self._serving_forever_future.done()):
+            self._serving_forever_future.cancel()
+            self._serving_forever_future = None
+
+        if self._active_count == 0:
+            self._wakeup()
+
+    async def start_serving(self) -> None:
+        self._start_serving()
+
+    async def serve_forever(self) -> None:
+        if self._serving_forever_future is not None:
+            raise RuntimeError(f"server {self!r} is already being awaited on serve_forever()")
+        if self._servers is None:
+            raise RuntimeError(f"server {self!r} is closed")
+
+        self._start_serving()
+        self._serving_forever_future = self._loop.create_future()
+        try:
+            await self._serving_forever_future
+        except asyncio.CancelledError:
+            try:
+                self.close()
+                await self.wait_closed()
+            finally:
+                raise
+        finally:
+            self._serving_forever_future = None
+
+    async def wait_closed(self) -> None:
+        if self._waiters is None:
+            return
+        waiter = self._loop.create_future()
+        self._waiters.append(waiter)
+        await waiter
@@ -14,3 +14,7 @@ const auto points = PySide::Numpy::xyDataToQPointFList(%PYARG_1, %PYARG_2);
 const auto points = PySide::Numpy::xyDataToQPointFList(%PYARG_1, %PYARG_2);
 %CPPSELF.replace(points);
 // @snippet qxyseries-replacenp-numpy-x-y
+
+// @snippet qxyseries-pointsnp
+%PYARG_0 = PySide::Numpy::qPointFListToNumpy(%CPPSELF.points());
+// @snippet qxyseries-pointsnp
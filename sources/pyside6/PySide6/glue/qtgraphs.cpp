@@ -6,3 +6,11 @@ auto data = QtGraphsHelper::surfaceDataFromNp(%1, %2, %3, %4, %5);
 // %CPPSELF.%FUNCTION_NAME
 %CPPSELF.resetArray(data);
 // @snippet graphs-qsurfacedataproxy-resetarraynp
+
+// @snippet graphs-qxyseries-pointsnp
+%PYARG_0 = PySide::Numpy::qPointFListToNumpy(%CPPSELF.points());
+// @snippet graphs-qxyseries-pointsnp
+
+// @snippet graphs-qgraphstheme-seriescolorsnp
+%PYARG_0 = PySide::Numpy::colorListToNumpy(%CPPSELF.seriesColors());
+// @snippet graphs-qgraphstheme-seriescolorsnp
@@ -394,6 +394,174 @@ static void imageDecrefDataHandler(void *data)
 }
 // @snippet qimage-decref-image-data
 
+// @snippet qimage-numpy-layout
+// Element type and number of channels (0 for two-dimensional arrays) of the
+// numpy arrays sharing the pixels of an image. The channels are in memory
+// order, for example BGRA on little endian machines for QImage::Format_ARGB32.
+struct ImageArrayLayout
+{
+    Shiboken::Numpy::StridedView::Type type;
+    int channels;
+};
+
+static std::optional<ImageArrayLayout> imageArrayLayout(QImage::Format format)
+{
+    using Shiboken::Numpy::StridedView;
+    switch (format) {
+    case QImage::Format_Indexed8:
+    case QImage::Format_Alpha8:
+    case QImage::Format_Grayscale8:
+        return ImageArrayLayout{StridedView::UInt8, 0};
+    case QImage::Format_RGB32:
+    case QImage::Format_ARGB32:
+    case QImage::Format_ARGB32_Premultiplied:
+    case QImage::Format_RGBX8888:
+    case QImage::Format_RGBA8888:
+    case QImage::Format_RGBA8888_Premultiplied:
+    case QImage::Format_CMYK8888:
+        return ImageArrayLayout{StridedView::UInt8, 4};
+    case QImage::Format_RGB888:
+    case QImage::Format_BGR888:
+        return ImageArrayLayout{StridedView::UInt8, 3};
+    case QImage::Format_RGB16:
+    case QImage::Format_RGB555:
+    case QImage::Format_RGB444:
+    case QImage::Format_ARGB4444_Premultiplied:
+    case QImage::Format_Grayscale16:
+        return ImageArrayLayout{StridedView::UInt16, 0};
+    case QImage::Format_BGR30:
+    case QImage::Format_A2BGR30_Premultiplied:
+    case QImage::Format_RGB30:
+    case QImage::Format_A2RGB30_Premultiplied:
+        return ImageArrayLayout{StridedView::UInt32, 0};
+    case QImage::Format_RGBX64:
+    case QImage::Format_RGBA64:
+    case QImage::Format_RGBA64_Premultiplied:
+        return ImageArrayLayout{StridedView::UInt16, 4};
+    case QImage::Format_RGBX16FPx4:
+    case QImage::Format_RGBA16FPx4:
+    case QImage::Format_RGBA16FPx4_Premultiplied:
+        return ImageArrayLayout{StridedView::Float16, 4};
+    case QImage::Format_RGBX32FPx4:
+    case QImage::Format_RGBA32FPx4:
+    case QImage::Format_RGBA32FPx4_Premultiplied:
+        return ImageArrayLayout{StridedView::Float32, 4};
+    default: // Mono formats, packed 24 bit pixels (Format_RGB666...), Format_Invalid
+        break;
+    }
+    return {};
+}
+
+// Format used by QImage.fromNumpy() when none is passed
+static QImage::Format imageFormatForArray(const Shiboken::Numpy::StridedView &view)
+{
+    using Shiboken::Numpy::StridedView;
+    const int channels = view.ndim == 3 ? int(view.dimensions[2]) : 0;
+    switch (view.type) {
+    case StridedView::UInt8:
+        if (channels == 0)
+            return QImage::Format_Grayscale8;
+        if (channels == 3)
+            return QImage::Format_RGB888;
+        if (channels == 4)
+            return QImage::Format_RGBA8888;
+        break;
+    case StridedView::UInt16:
+        if (channels == 0)
+            return QImage::Format_Grayscale16;
+        if (channels == 4)
+            return QImage::Format_RGBA64;
+        break;
+    case StridedView::Float16:
+        if (channels == 4)
+            return QImage::Format_RGBA16FPx4;
+        break;
+    case StridedView::Float32:
+        if (channels == 4)
+            return QImage::Format_RGBA32FPx4;
+        break;
+    default:
+        break;
+    }
+    return QImage::Format_Invalid;
+}
+
+static const char imageCapsuleName[] = "QImage";
+
+static void imageCapsuleDestructor(PyObject *capsule)
+{
+    delete reinterpret_cast<QImage *>(PyCapsule_GetPointer(capsule, imageCapsuleName));
+}
+// @snippet qimage-numpy-layout
+
+// @snippet qimage-tonumpy
+const QImage::Format format = %CPPSELF.format();
+const auto layout = imageArrayLayout(format);
+if (%CPPSELF.isNull()) {
+    PyErr_SetString(PyExc_ValueError, "toNumpy(): The image is null.");
+} else if (!layout.has_value()) {
+    PyErr_Format(PyExc_ValueError,
+                 "toNumpy(): Images of format %d cannot be represented as numpy arrays.",
+                 int(format));
+} else {
+    // The array holds a shallow copy of the image, which keeps the data alive
+    // when the image is deleted or detached. Since the data may be shared with
+    // other images, the array is read-only.
+    auto *copy = new QImage(%CPPSELF);
+    Shiboken::Numpy::StridedView view;
+    view.data = const_cast<uchar *>(copy->constBits());
+    view.writable = false;
+    view.type = layout->type;
+    view.ndim = layout->channels > 0 ? 3 : 2;
+    view.dimensions[0] = %CPPSELF.height();
+    view.dimensions[1] = %CPPSELF.width();
+    view.dimensions[2] = layout->channels;
+    view.stride[0] = %CPPSELF.bytesPerLine();
+    view.stride[1] = %CPPSELF.depth() / 8;
+    view.stride[2] = view.itemSize();
+    PyObject *base = PyCapsule_New(copy, imageCapsuleName, imageCapsuleDestructor);
+    if (base != nullptr)
+        %PYARG_0 = Shiboken::Numpy::createArrayView(view, base);
+    else
+        delete copy;
+}
+// @snippet qimage-tonumpy
+
+// @snippet qimage-fromnumpy
+const auto view = Shiboken::Numpy::StridedView::fromPyObject(%PYARG_1);
+QImage::Format format = %2;
+if (view && format == QImage::Format_Invalid)
+    format = imageFormatForArray(view);
+const auto layout = imageArrayLayout(format);
+const int channels = view.ndim == 3 ? int(view.dimensions[2]) : 0;
+const int pixelSize = QImage::toPixelFormat(format).bitsPerPixel() / 8;
+if (!view || view.ndim < 2 || !layout.has_value()
+    || layout->type != view.type || layout->channels != channels) {
+    PyErr_Format(PyExc_ValueError,
+                 "fromNumpy(): The array does not match the image format %d.", int(format));
+} else if (view.dimensions[0] == 0 || view.dimensions[1] == 0) {
+    // QImage would be null without calling the cleanup function
+    PyErr_SetString(PyExc_ValueError, "fromNumpy(): The array is empty.");
+} else if (view.dimensions[0] > INT_MAX || view.dimensions[1] > INT_MAX
+           || view.stride[1] != pixelSize
+           || (channels > 0 && view.stride[2] != view.itemSize())
+           || view.stride[0] < view.dimensions[1] * pixelSize) {
+    PyErr_SetString(PyExc_ValueError,
+                    "fromNumpy(): The pixels of the array rows must be contiguous.");
+} else {
+    const int width = int(view.dimensions[1]);
+    const int height = int(view.dimensions[0]);
+    // The image references the array, which is released by the cleanup function
+    Py_INCREF(%PYARG_1);
+    const QImage image = view.writable
+        ? QImage(static_cast<uchar *>(view.data), width, height, view.stride[0], format,
+                 imageDecrefDataHandler, %PYARG_1)
+        : QImage(static_cast<const uchar *>(view.data), width, height, view.stride[0], format,
+                 imageDecrefDataHandler, %PYARG_1);
+    %PYARG_0 = %CONVERTTOPYTHON[QImage](image);
+}
+// @snippet qimage-fromnumpy
+
 // @snippet qimage-constbits
 %PYARG_0 = Shiboken::Buffer::newObject(%CPPSELF.%FUNCTION_NAME(), %CPPSELF.sizeInBytes());
 // @snippet qimage-constbits
@@ -692,11 +860,68 @@ PyTuple_SET_ITEM(%PYARG_0, 0, %CONVERTTOPYTHON[%RETURN_TYPE](retval_));
 PyTuple_SET_ITEM(%PYARG_0, 1, %CONVERTTOPYTHON[%ARG1_TYPE](%1));
 // @snippet qclipboard-text
 
+// @snippet qpolygonf-fromnumpy-points
+const QPolygonF polygon(PySide::Numpy::pointDataToQPointFList(%PYARG_1));
+if (PyErr_Occurred() == nullptr)
+    %PYARG_0 = %CONVERTTOPYTHON[QPolygonF](polygon);
+// @snippet qpolygonf-fromnumpy-points
+
+// @snippet qpolygonf-fromnumpy-x-y
+const QPolygonF polygon(PySide::Numpy::pointDataToQPointFList(%PYARG_1, %PYARG_2));
+if (PyErr_Occurred() == nullptr)
+    %PYARG_0 = %CONVERTTOPYTHON[QPolygonF](polygon);
+// @snippet qpolygonf-fromnumpy-x-y
+
+// @snippet qpolygonf-tonumpy
+%PYARG_0 = PySide::Numpy::qPointFListToNumpy(%CPPSELF);
+// @snippet qpolygonf-tonumpy
+
+// @snippet qpainterpath-addpolygonnp-numpy-points
+const QPolygonF polygon(PySide::Numpy::pointDataToQPointFList(%PYARG_1));
+%CPPSELF.addPolygon(polygon);
+// @snippet qpainterpath-addpolygonnp-numpy-points
+
+// @snippet qpainterpath-addpolygonnp-numpy-x-y
+const QPolygonF polygon(PySide::Numpy::pointDataToQPointFList(%PYARG_1, %PYARG_2));
+%CPPSELF.addPolygon(polygon);
+// @snippet qpainterpath-addpolygonnp-numpy-x-y
+
 // @snippet qpainter-drawpointsnp-numpy-x-y
 const auto points = PySide::Numpy::xyDataToQPointFList(%PYARG_1, %PYARG_2);
 %CPPSELF.drawPoints(points);
 // @snippet qpainter-drawpointsnp-numpy-x-y
 
+// @snippet qpainter-drawpointsnp-numpy-points
+const auto points = PySide::Numpy::pointDataToQPointFList(%PYARG_1);
+%CPPSELF.drawPoints(points.constData(), int(points.size()));
+// @snippet qpainter-drawpointsnp-numpy-points
+
+// @snippet qpainter-drawpolylinenp-numpy-points
+const auto points = PySide::Numpy::pointDataToQPointFList(%PYARG_1);
+%CPPSELF.drawPolyline(points.constData(), int(points.size()));
+// @snippet qpainter-drawpolylinenp-numpy-points
+
+// @snippet qpainter-drawpolylinenp-numpy-x-y
+const auto points = PySide::Numpy::pointDataToQPointFList(%PYARG_1, %PYARG_2);
+%CPPSELF.drawPolyline(points.constData(), int(points.size()));
+// @snippet qpainter-drawpolylinenp-numpy-x-y
+
+// @snippet qpainter-drawlinesnp-numpy-points
+const auto points = PySide::Numpy::pointDataToQPointFList(%PYARG_1);
+if (points.size() % 2 != 0)
+    PyErr_SetString(PyExc_ValueError, "drawLinesNp(): The number of points must be even.");
+else
+    %CPPSELF.drawLines(points.constData(), int(points.size() / 2));
+// @snippet qpainter-drawlinesnp-numpy-points
+
+// @snippet qpainter-drawlinesnp-numpy-x-y
+const auto points = PySide::Numpy::pointDataToQPointFList(%PYARG_1, %PYARG_2);
+if (points.size() % 2 != 0)
+    PyErr_SetString(PyExc_ValueError, "drawLinesNp(): The number of points must be even.");
+else
+    %CPPSELF.drawLines(points.constData(), int(points.size() / 2));
+// @snippet qpainter-drawlinesnp-numpy-x-y
+
 // @snippet qpainter-drawpolygon
 %CPPSELF.%FUNCTION_NAME(%1.constData(), %1.size(), %2);
 // @snippet qpainter-drawpolygon
@@ -6,16 +6,24 @@ from __future__ import annotations
 generate_pyi.py
 
 This script generates the .pyi files for all PySide modules.
+
+With --jobs, the modules are generated concurrently by a pool of worker
+processes. With --incremental, a hash of the binary extension module and of
+the signature sources is recorded next to every .pyi file, and modules whose
+hash did not change since the last run are skipped.
 """
 # mypy: disable-error-code="import-not-found"
 
 import argparse
+import hashlib
 import inspect  # noqa: F401
 import logging
 import os
 import sys
 import typing  # noqa: F401
 
+from concurrent.futures import ProcessPoolExecutor
+from importlib.util import find_spec
 from pathlib import Path
 from types import SimpleNamespace  # noqa: F401
 
@@ -23,7 +31,7 @@ from types import SimpleNamespace  # noqa: F401
 USE_PEP563 = sys.version_info[:2] >= (3, 7)
 
 
-def generate_all_pyi(outpath, options):
+def _setup(options):
     ps = os.pathsep
     if options.sys_path:
         # make sure to propagate the paths from sys_path to subprocesses
@@ -34,7 +42,7 @@ def generate_all_pyi(outpath, options):
         os.environ["PYTHONPATH"] = pypath
 
     # now we can import
-    global PySide6, inspect, typing, HintingEnumerator, build_brace_pattern
+    global PySide6, inspect, typing, HintingEnumerator, build_brace_pattern, generate_pyi
     import PySide6
     from PySide6.support.signature.lib.enum_sig import HintingEnumerator
     from PySide6.support.signature.lib.tool import build_brace_pattern
@@ -44,21 +52,112 @@ def generate_all_pyi(outpath, options):
     # Perhaps this can be automated?
     PySide6.support.signature.mapping.USE_PEP563 = USE_PEP563
 
+
+def _init_worker(options, log_level):
+    # The worker processes might be spawned instead of forked, so they
+    # have to configure logging and repeat the imports themselves.
+    if "PySide6" not in globals():
+        logging.basicConfig(level=log_level)
+        _setup(options)
+
+
+def _generate_module(mod_name, outpath, options):
+    import_name = "PySide6." + mod_name
+    if hasattr(sys, "pypy_version_info"):
+        # PYSIDE-535: We cannot use __feature__ yet in PyPy
+        generate_pyi(import_name, outpath, options)
+    else:
+        from PySide6.support import feature
+        feature_id = feature.get_select_id(options.feature)
+        with feature.force_selection(feature_id, import_name):
+            generate_pyi(import_name, outpath, options)
+    return mod_name
+
+
+def _hash_file(hasher, path):
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            hasher.update(chunk)
+
+
+def _signature_sources():
+    """
+    Return the files that determine the contents of all .pyi files besides
+    the binary extension module itself: the signature support files (which
+    might be embedded in the shiboken module) and this script.
+    """
+    sources = [Path(__file__).resolve()]
+    spec = find_spec("shiboken6.Shiboken")
+    if spec and spec.origin and Path(spec.origin).is_file():
+        sources.append(Path(spec.origin))
+    signature_dir = Path(PySide6.support.signature.__file__).parent
+    if signature_dir.is_dir():
+        sources.extend(sorted(signature_dir.rglob("*.py")))
+    return sources
+
+
+def _module_hash(mod_name, sources, options):
+    """
+    Compute the hash of a module for the incremental mode, or None if the
+    binary extension module cannot be found.
+    """
+    spec = find_spec("PySide6." + mod_name)
+    if not spec or not spec.origin or not Path(spec.origin).is_file():
+        return None
+    hasher = hashlib.sha256()
+    hasher.update(repr((sys.version_info[:2], USE_PEP563, sorted(options.feature))).encode())
+    for path in (Path(spec.origin), *sources):
+        _hash_file(hasher, path)
+    return hasher.hexdigest()
+
+
+def _hash_path(outpath, mod_name):
+    return outpath / f"{mod_name}.pyi.hash"
+
+
+def generate_all_pyi(outpath, options):
+    _setup(options)
+
     outpath = Path(outpath) if outpath and os.fspath(outpath) else Path(PySide6.__file__).parent
     name_list = PySide6.__all__ if options.modules == ["all"] else options.modules
     errors = ", ".join(set(name_list) - set(PySide6.__all__))
     if errors:
         raise ImportError(f"The module(s) '{errors}' do not exist")
-    for mod_name in name_list:
-        import_name = "PySide6." + mod_name
-        if hasattr(sys, "pypy_version_info"):
-            # PYSIDE-535: We cannot use __feature__ yet in PyPy
-            generate_pyi(import_name, outpath, options)
-        else:
-            from PySide6.support import feature
-            feature_id = feature.get_select_id(options.feature)
-            with feature.force_selection(feature_id, import_name):
-                generate_pyi(import_name, outpath, options)
+
+    hashes = {}
+    if getattr(options, "incremental", False):
+        sources = _signature_sources()
+        for mod_name in name_list:
+            hashes[mod_name] = _module_hash(mod_name, sources, options)
+        unchanged = []
+        for mod_name, module_hash in hashes.items():
+            hash_path = _hash_path(outpath, mod_name)
+            if (module_hash and (outpath / f"{mod_name}.pyi").exists()
+                    and hash_path.exists() and hash_path.read_text().strip() == module_hash):
+                unchanged.append(mod_name)
+        if unchanged:
+            options.logger.info(f"Unchanged, skipped: {', '.join(unchanged)}")
+        name_list = [mod_name for mod_name in name_list if mod_name not in unchanged]
+
+    def generated(mod_name):
+        module_hash = hashes.get(mod_name)
+        if module_hash:
+            _hash_path(outpath, mod_name).write_text(module_hash + "\n")
+
+    jobs = min(getattr(options, "jobs", 1) or os.cpu_count() or 1, len(name_list))
+    if jobs <= 1:
+        for mod_name in name_list:
+            generated(_generate_module(mod_name, outpath, options))
+        return
+
+    log_level = options.logger.getEffectiveLevel()
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                             initargs=(options, log_level)) as executor:
+        futures = [executor.submit(_generate_module, mod_name, outpath, options)
+                   for mod_name in name_list]
+        # Report the results in order, the first error aborts the run.
+        for future in futures:
+            generated(future.result())
 
 
 if __name__ == "__main__":
@@ -75,6 +174,11 @@ if __name__ == "__main__":
                         help="""a list of feature names. """
                         """Example: `--feature snake_case true_property`. """
                         """Currently not available for PyPy.""")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="number of modules to generate in parallel "
+                        "(default = 1, 0 = number of CPUs)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="skip modules whose binary and signature sources are unchanged")
     options = parser.parse_args()
 
     qtest_env = os.environ.get("QTEST_ENVIRONMENT", "")
@@ -4,32 +4,118 @@
 #include "pyside_numpy.h"
 #include <sbknumpyview.h>
 
-// Convert X,Y of type T data to a list of points (QPoint, PointF)
+#include <optional>
+#include <type_traits>
+
+using Shiboken::Numpy::StridedView;
+
+// Location of the coordinates of points in strided memory, either from
+// 2 one-dimensional arrays of x and y data or from an array of shape (N, 2).
+struct PointData
+{
+    const char *x;
+    const char *y;
+    Py_ssize_t xStride; // in bytes
+    Py_ssize_t yStride;
+    qsizetype size;
+    StridedView::Type type;
+};
+
+// The types of point data are the 16, 32 and 64 bit integer and the single
+// and double precision floating point types.
+static bool isPointDataType(StridedView::Type type)
+{
+    switch (type) {
+    case StridedView::Int8:
+    case StridedView::UInt8:
+    case StridedView::Float16:
+        return false;
+    default:
+        break;
+    }
+    return true;
+}
+
+static std::optional<PointData> xyPointData(PyObject *pyXIn, PyObject *pyYIn)
+{
+    const auto xv = StridedView::fromPyObject(pyXIn);
+    const auto yv = StridedView::fromPyObject(pyYIn);
+    if (xv.ndim != 1 || yv.ndim != 1 || xv.type != yv.type || !isPointDataType(xv.type))
+        return {};
+    return PointData{static_cast<const char *>(xv.data), static_cast<const char *>(yv.data),
+                     xv.stride[0], yv.stride[0], qMin(xv.dimensions[0], yv.dimensions[0]),
+                     xv.type};
+}
+
+static std::optional<PointData> pointArrayData(PyObject *pyIn)
+{
+    const auto view = StridedView::fromPyObject(pyIn);
+    if (view.ndim != 2 || view.dimensions[1] != 2 || !isPointDataType(view.type))
+        return {};
+    const auto *data = static_cast<const char *>(view.data);
+    return PointData{data, data + view.stride[1], view.stride[0], view.stride[0],
+                     view.dimensions[0], view.type};
+}
+
+// Convert X,Y of type T data to a list of points (QPoint, PointF), filling
+// the list in place. Floating point data are rounded for QPoint.
 template <class T, class Point>
-static QList<Point>
-    xyDataToQPointHelper(const void *xData, const void *yData, qsizetype size)
+static QList<Point> pointDataToListHelper(const PointData &pointData)
 {
-    auto *x = reinterpret_cast<const T *>(xData);
-    auto *y = reinterpret_cast<const T *>(yData);
-    QList<Point> result;
-    result.reserve(size);
-    for (auto xEnd = x + size; x < xEnd; ++x, ++y)
-        result.append(Point(*x, *y));
+    QList<Point> result(pointData.size);
+    Point *target = result.data();
+    const char *x = pointData.x;
+    const char *y = pointData.y;
+    for (Point *end = target + pointData.size; target < end; ++target) {
+        const T xValue = *reinterpret_cast<const T *>(x);
+        const T yValue = *reinterpret_cast<const T *>(y);
+        if constexpr (std::is_same_v<Point, QPoint> && std::is_floating_point_v<T>)
+            *target = QPoint(qRound(xValue), qRound(yValue));
+        else
+            *target = Point(xValue, yValue);
+        x += pointData.xStride;
+        y += pointData.yStride;
+    }
     return result;
 }
 
-// Convert X,Y of double/float type data to a list of QPoint (rounding)
-template <class T>
-static QList<QPoint>
-    xyFloatDataToQPointHelper(const void *xData, const void *yData, qsizetype size)
+template <class Point>
+static QList<Point> pointDataToList(const PointData &pointData)
 {
-    auto *x = reinterpret_cast<const T *>(xData);
-    auto *y = reinterpret_cast<const T *>(yData);
-    QList<QPoint> result;
-    result.reserve(size);
-    for (auto xEnd = x + size; x < xEnd; ++x, ++y)
-        result.append(QPoint(qRound(*x), qRound(*y)));
-    return result;
+    if (pointData.size == 0)
+        return {};
+    switch (pointData.type) {
+    case StridedView::Int16:
+        return pointDataToListHelper<int16_t, Point>(pointData);
+    case StridedView::UInt16:
+        return pointDataToListHelper<uint16_t, Point>(pointData);
+    case StridedView::Int32:
+        return pointDataToListHelper<int32_t, Point>(pointData);
+    case StridedView::UInt32:
+        return pointDataToListHelper<uint32_t, Point>(pointData);
+    case StridedView::Int64:
+        return pointDataToListHelper<int64_t, Point>(pointData);
+    case StridedView::UInt64:
+        return pointDataToListHelper<uint64_t, Point>(pointData);
+    case StridedView::Float32:
+        return pointDataToListHelper<float, Point>(pointData);
+    case StridedView::Float64:
+    case StridedView::Int8: // excluded by isPointDataType()
+    case StridedView::UInt8:
+    case StridedView::Float16:
+        break;
+    }
+    return pointDataToListHelper<double, Point>(pointData);
+}
+
+// qreal may be float or double
+template <class Real>
+static PyObject *createRealArray2(qsizetype rows, qsizetype columns, const Real *data)
+{
+    if constexpr (std::is_same_v<Real, float>)
+        return Shiboken::Numpy::createFloatArray2(rows, columns, data);
+    else
+        return Shiboken::Numpy::createDoubleArray2(rows, columns, data);
 }
 
 namespace PySide::Numpy
@@ -37,62 +123,36 @@ namespace PySide::Numpy
 
 QList<QPointF> xyDataToQPointFList(PyObject *pyXIn, PyObject *pyYIn)
 {
-    auto xv = Shiboken::Numpy::View::fromPyObject(pyXIn);
-    auto yv = Shiboken::Numpy::View::fromPyObject(pyYIn);
-    if (!xv.sameLayout(yv))
-        return {};
-    const qsizetype size = qMin(xv.dimensions[0], yv.dimensions[0]);
-    if (size == 0)
-        return {};
-    switch (xv.type) {
-    case Shiboken::Numpy::View::Int16:
-        return xyDataToQPointHelper<int16_t, QPointF>(xv.data, yv.data, size);
-    case Shiboken::Numpy::View::Unsigned16:
-        return xyDataToQPointHelper<uint16_t, QPointF>(xv.data, yv.data, size);
-    case Shiboken::Numpy::View::Int:
-        return xyDataToQPointHelper<int, QPointF>(xv.data, yv.data, size);
-    case Shiboken::Numpy::View::Unsigned:
-        return xyDataToQPointHelper<unsigned, QPointF>(xv.data, yv.data, size);
-    case Shiboken::Numpy::View::Int64:
-        return xyDataToQPointHelper<int64_t, QPointF>(xv.data, yv.data, size);
-    case Shiboken::Numpy::View::Unsigned64:
-        return xyDataToQPointHelper<uint64_t, QPointF>(xv.data, yv.data, size);
-    case Shiboken::Numpy::View::Float:
-        return xyDataToQPointHelper<float, QPointF>(xv.data, yv.data, size);
-    case Shiboken::Numpy::View::Double:
-        break;
-    }
-    return xyDataToQPointHelper<double, QPointF>(xv.data, yv.data, size);
+    const auto pointData = xyPointData(pyXIn, pyYIn);
+    return pointData.has_value() ? pointDataToList<QPointF>(pointData.value()) : QList<QPointF>{};
 }
 
 QList<QPoint> xyDataToQPointList(PyObject *pyXIn, PyObject *pyYIn)
 {
-    auto xv = Shiboken::Numpy::View::fromPyObject(pyXIn);
-    auto yv = Shiboken::Numpy::View::fromPyObject(pyYIn);
-    if (!xv.sameLayout(yv))
-        return {};
-    const qsizetype size = qMin(xv.dimensions[0], yv.dimensions[0]);
-    if (size == 0)
+    const auto pointData = xyPointData(pyXIn, pyYIn);
+    return pointData.has_value() ? pointDataToList<QPoint>(pointData.value()) : QList<QPoint>{};
+}
+
+QList<QPointF> pointDataToQPointFList(PyObject *pyXIn, PyObject *pyYIn)
+{
+    const auto pointData = pyYIn != nullptr ? xyPointData(pyXIn, pyYIn) : pointArrayData(pyXIn);
+    if (!pointData.has_value()) {
+        PyErr_SetString(PyExc_ValueError, pyYIn != nullptr
+                        ? "Expected 2 one-dimensional numpy arrays of x and y data of the same "
+                          "16, 32 or 64 bit integer or float32/float64 type."
+                        : "Expected a numpy array of shape (N, 2) of a 16, 32 or 64 bit integer "
+                          "or float32/float64 type.");
         return {};
-    switch (xv.type) {
-    case Shiboken::Numpy::View::Int16:
-        return xyDataToQPointHelper<int16_t, QPoint>(xv.data, yv.data, size);
-    case Shiboken::Numpy::View::Unsigned16:
-        return xyDataToQPointHelper<uint16_t, QPoint>(xv.data, yv.data, size);
-    case Shiboken::Numpy::View::Int:
-        return xyDataToQPointHelper<int, QPoint>(xv.data, yv.data, size);
-    case Shiboken::Numpy::View::Unsigned:
-        return xyDataToQPointHelper<unsigned, QPoint>(xv.data, yv.data, size);
-    case Shiboken::Numpy::View::Int64:
-        return xyDataToQPointHelper<int64_t, QPoint>(xv.data, yv.data, size);
-    case Shiboken::Numpy::View::Unsigned64:
-        return xyDataToQPointHelper<uint64_t, QPoint>(xv.data, yv.data, size);
-    case Shiboken::Numpy::View::Float:
-        return xyFloatDataToQPointHelper<float>(xv.data, yv.data, size);
-    case Shiboken::Numpy::View::Double:
-        break;
     }
-    return xyFloatDataToQPointHelper<double>(xv.data, yv.data, size);
+    return pointDataToList<QPointF>(pointData.value());
+}
+
+PyObject *qPointFListToNumpy(const QList<QPointF> &points)
+{
+    // QPointF consists of 2 qreal (x, y) which can be copied as a whole
+    static_assert(sizeof(QPointF) == 2 * sizeof(qreal));
+    const auto *data = reinterpret_cast<const qreal *>(points.constData());
+    return createRealArray2(points.size(), 2, data);
 }
 
 } //namespace PySide::Numpy
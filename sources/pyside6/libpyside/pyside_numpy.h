@@ -6,6 +6,7 @@
 
 #include <sbkpython.h>
 #include <sbknumpycheck.h>
+#include <sbkcpptonumpy.h>
 
 #include <pysidemacros.h>
 
@@ -16,22 +17,64 @@
 namespace PySide::Numpy
 {
 
-/// Create a list of QPointF from 2 equally sized numpy array of x and y data
-/// (float,double).
+/// Create a list of QPointF from 2 equally sized one-dimensional numpy arrays
+/// of x and y data of the same 16, 32 or 64 bit integer or float32/float64
+/// type, which may be strided. Returns an empty list for other arrays.
 /// \param pyXIn X data array
 /// \param pyYIn Y data array
 /// \return List of QPointF
 
 PYSIDE_API QList<QPointF> xyDataToQPointFList(PyObject *pyXIn, PyObject *pyYIn);
 
-/// Create a list of QPoint from 2 equally sized numpy array of x and y data
-/// (int).
+/// Create a list of QPoint from 2 equally sized one-dimensional numpy arrays
+/// of x and y data like xyDataToQPointFList(). Floating point values are
+/// rounded.
 /// \param pyXIn X data array
 /// \param pyYIn Y data array
 /// \return List of QPoint
 
 PYSIDE_API QList<QPoint> xyDataToQPointList(PyObject *pyXIn, PyObject *pyYIn);
 
+/// Create a list of QPointF from point data, which is either a numpy array
+/// of shape (N, 2) (pyYIn == nullptr) or 2 equally sized one-dimensional
+/// numpy arrays of x and y data, of a 16, 32 or 64 bit integer or
+/// float32/float64 type. The arrays may be strided (slices of other
+/// arrays); the points are read directly from their memory.
+/// Sets a Python ValueError if the arrays are not suitable.
+/// \param pyXIn Point data array or X data array
+/// \param pyYIn Y data array or nullptr
+/// \return List of QPointF
+
+PYSIDE_API QList<QPointF> pointDataToQPointFList(PyObject *pyXIn, PyObject *pyYIn = nullptr);
+
+/// Create a numpy array of shape (N, 2) from a list of QPointF (for example,
+/// a QPolygonF) in one allocation.
+/// \param points Points
+/// \return PyArrayObject or nullptr with an exception set
+
+PYSIDE_API PyObject *qPointFListToNumpy(const QList<QPointF> &points);
+
+/// Create a numpy array of shape (N, 4) of type float from a list of
+/// colors containing the red, green, blue and alpha components in the
+/// range of 0..1. This is a template since libpyside does not depend
+/// on QtGui.
+/// \param colors List of QColor
+/// \return PyArrayObject or nullptr with an exception set
+
+template <class Color>
+PyObject *colorListToNumpy(const QList<Color> &colors)
+{
+    float *target = nullptr;
+    PyObject *result = Shiboken::Numpy::createEmptyFloatArray2(colors.size(), 4, &target);
+    if (target != nullptr) {
+        for (const Color &color : colors) {
+            color.getRgbF(target, target + 1, target + 2, target + 3);
+            target += 4;
+        }
+    }
+    return result;
+}
+
 } //namespace PySide::Numpy
 
 #endif // PYSIDE_NUMPY_H
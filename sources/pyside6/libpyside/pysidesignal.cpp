@@ -580,6 +580,34 @@ static int argCountInSignature(const char *signature)
     return QByteArrayView{signature}.count(',') + 1;
 }
 
+// Check whether emit() of the source object is QObject.emit(), which allows
+// for emitting the signal directly instead of calling it.
+static bool hasDefaultEmit(PyObject *source)
+{
+    static PyTypeObject *qObjectType = Shiboken::Conversions::getPythonTypeObject("QObject*");
+    PyObject *emitName = PySide::PySideName::qtEmit();
+    auto *type = Py_TYPE(source);
+    if (type != qObjectType
+        && _PepType_Lookup(type, emitName) != _PepType_Lookup(qObjectType, emitName)) {
+        return false;
+    }
+    auto *dict = SbkObject_GetDict_NoRef(source);
+    return PyDict_GetItem(dict, emitName) == nullptr;
+}
+
+// Return the index of the signal, which is cached as long as the meta
+// object of the source does not change.
+static int signalIndex(PySideSignalInstance *signal, QObject *source)
+{
+    auto *d = signal->d;
+    const QMetaObject *metaObject = source->metaObject();
+    if (d->metaObject != metaObject) {
+        d->signalIndex = metaObject->indexOfSignal(d->signature.constData());
+        d->metaObject = metaObject;
+    }
+    return d->signalIndex;
+}
+
 static PyObject *signalInstanceEmit(PyObject *self, PyObject *args)
 {
     auto *source = reinterpret_cast<PySideSignalInstance *>(self);
@@ -591,7 +619,6 @@ static PyObject *signalInstanceEmit(PyObject *self, PyObject *args)
     if (source->deleted)
         return PyErr_Format(PyExc_RuntimeError, "The SignalInstance object was already deleted");
 
-    Shiboken::AutoDecRef pyArgs(PyList_New(0));
     int numArgsGiven = PySequence_Fast_GET_SIZE(args);
     int numArgsInSignature = argCountInSignature(source->d->signature);
 
@@ -613,6 +640,20 @@ static PyObject *signalInstanceEmit(PyObject *self, PyObject *args)
             }
         }
     }
+
+    // Emit directly unless QObject.emit() was overridden
+    QObject *sender = PySide::convertToQObject(source->d->source, false);
+    if (sender != nullptr && hasDefaultEmit(source->d->source)) {
+        const int index = signalIndex(source, sender);
+        if (index != -1) {
+            const bool ok = PySide::SignalManager::emitSignal(sender, index, args);
+            if (PyErr_Occurred() != nullptr)
+                return nullptr;
+            return PyBool_FromLong(ok ? 1 : 0);
+        }
+    }
+
+    Shiboken::AutoDecRef pyArgs(PyList_New(0));
     Shiboken::AutoDecRef sourceSignature(PySide::Signal::buildQtCompatible(source->d->signature));
 
     PyList_Append(pyArgs, sourceSignature);
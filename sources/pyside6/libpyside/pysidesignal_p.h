@@ -9,6 +9,8 @@
 #include <QtCore/QByteArray>
 #include <QtCore/QList>
 
+QT_FORWARD_DECLARE_STRUCT(QMetaObject)
+
 struct PySideSignalData
 {
     struct Signature
@@ -43,6 +45,8 @@ struct PySideSignalInstancePrivate
     PyObject *source = nullptr;
     PyObject *homonymousMethod = nullptr;
     PySideSignalInstance *next = nullptr;
+    const QMetaObject *metaObject = nullptr; // for which signalIndex was determined
+    int signalIndex = -1;
     unsigned short attributes = 0;
     short argCount = 0;
 };
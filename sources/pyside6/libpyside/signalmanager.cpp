@@ -288,7 +288,12 @@ bool SignalManager::emitSignal(QObject *source, const char *signal, PyObject *ar
     signal++;
 
     int signalIndex = source->metaObject()->indexOfSignal(signal);
-    return signalIndex != -1 && MetaFunction::call(source, signalIndex, args);
+    return signalIndex != -1 && emitSignal(source, signalIndex, args);
+}
+
+bool SignalManager::emitSignal(QObject *source, int signalIndex, PyObject *args)
+{
+    return MetaFunction::call(source, signalIndex, args);
 }
 
 // Handle errors from meta calls. Requires GIL and PyErr_Occurred()
@@ -62,6 +62,7 @@ public:
     static void setQmlMetaCallErrorHandler(QmlMetaCallErrorHandler handler);
 
     static bool emitSignal(QObject* source, const char* signal, PyObject* args);
+    static bool emitSignal(QObject *source, int signalIndex, PyObject *args);
     static int qt_metacall(QObject* object, QMetaObject::Call call, int id, void** args);
 
     // Used to register a new signal/slot on QMetaobject of source.
@@ -9,8 +9,8 @@ import asyncio
 
 from concurrent.futures import ThreadPoolExecutor
 
-from PySide6.QtCore import QThread
-from PySide6.QtAsyncio import QAsyncioEventLoopPolicy
+from PySide6.QtCore import QThread, QThreadPool
+from PySide6.QtAsyncio import QAsyncioEventLoopPolicy, QAsyncioThreadPoolExecutor
 
 
 class QAsyncioTestCaseExecutor(unittest.TestCase):
@@ -39,10 +39,48 @@ class QAsyncioTestCaseExecutor(unittest.TestCase):
 
             self.assertEqual(result, 42)
 
+    def failing_function(self):
+        raise ValueError("failed")
+
+    async def run_default_executor(self):
+        main_thread = QThread.currentThread()
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(None, self.blocking_function)
+        self.assertEqual(result, 42)
+        self.assertEqual(QThread.currentThread(), main_thread)
+        self.assertNotEqual(self.executor_thread, main_thread)
+
+        with self.assertRaises(ValueError):
+            await loop.run_in_executor(None, self.failing_function)
+
+        results = await asyncio.gather(
+            *(asyncio.to_thread(pow, i, 2) for i in range(100)))
+        self.assertEqual(results, [i ** 2 for i in range(100)])
+
+    async def run_thread_pool_executor(self):
+        thread_pool = QThreadPool()
+        executor = QAsyncioThreadPoolExecutor(thread_pool, max_threads=2)
+        self.assertEqual(thread_pool.maxThreadCount(), 2)
+        result = await asyncio.get_running_loop().run_in_executor(
+            executor, self.blocking_function)
+        self.assertEqual(result, 42)
+        self.assertEqual(executor.submit(pow, 3, 2).result(), 9)
+        executor.shutdown()
+        with self.assertRaises(RuntimeError):
+            executor.submit(pow, 3, 2)
+
     def test_qasyncio_executor(self):
         asyncio.set_event_loop_policy(QAsyncioEventLoopPolicy())
         asyncio.run(self.run_asyncio_executor())
 
+    def test_default_executor(self):
+        asyncio.set_event_loop_policy(QAsyncioEventLoopPolicy())
+        asyncio.run(self.run_default_executor())
+
+    def test_thread_pool_executor(self):
+        asyncio.set_event_loop_policy(QAsyncioEventLoopPolicy())
+        asyncio.run(self.run_thread_pool_executor())
+
 
 if __name__ == '__main__':
     unittest.main()
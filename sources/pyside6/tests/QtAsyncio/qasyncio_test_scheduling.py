@@ -0,0 +1,130 @@
+# Copyright (C) 2024 The Qt Company Ltd.
+# SPDX-License-Identifier: LicenseRef-Qt-Commercial OR GPL-3.0-only WITH Qt-GPL-exception-1.0
+from __future__ import annotations
+
+'''Test cases for QtAsyncio'''
+
+import unittest
+import asyncio
+import threading
+
+from PySide6.QtAsyncio import QAsyncioEventLoopPolicy
+from shiboken6 import Shiboken
+
+
+class QAsyncioTestCaseScheduling(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        asyncio.set_event_loop_policy(QAsyncioEventLoopPolicy())
+        self.loop = asyncio.new_event_loop()
+        self.output = []
+
+    def tearDown(self) -> None:
+        self.loop.close()
+        super().tearDown()
+
+    def append(self, value):
+        self.output.append(value)
+
+    def test_fifo(self):
+        for i in range(100):
+            self.loop.call_soon(self.append, i)
+        self.loop.call_soon(self.loop.stop)
+        self.loop.run_forever()
+        self.assertEqual(self.output, list(range(100)))
+
+    def test_cancel_soon(self):
+        self.loop.call_soon(self.append, 1)
+        handle = self.loop.call_soon(self.append, 2)
+        self.loop.call_soon(self.append, 3)
+        handle.cancel()
+        self.assertTrue(handle.cancelled())
+        self.loop.call_soon(self.loop.stop)
+        self.loop.run_forever()
+        self.assertEqual(self.output, [1, 3])
+
+    def test_nested_call_soon(self):
+        # Callbacks scheduled while the ready queue is drained are executed in
+        # the next iteration, after the callbacks that were already queued.
+        def nested():
+            self.append("nested")
+            self.loop.call_soon(self.append, "inner")
+
+        self.loop.call_soon(nested)
+        self.loop.call_soon(self.append, "outer")
+        self.loop.call_soon(self.loop.call_soon, self.loop.stop)
+        self.loop.run_forever()
+        self.assertEqual(self.output, ["nested", "outer", "inner"])
+
+    def test_order(self):
+        self.loop.call_later(0.03, self.append, 3)
+        self.loop.call_later(0.01, self.append, 1)
+        self.loop.call_later(0.02, self.append, 2)
+        when = self.loop.time() + 0.04
+        self.loop.call_at(when, self.append, 4)
+        self.loop.call_at(when, self.append, 5)
+        self.loop.call_later(0.05, self.loop.stop)
+        self.loop.run_forever()
+        self.assertEqual(self.output, [1, 2, 3, 4, 5])
+        self.assertEqual(len(self.loop._scheduled), 0)
+
+    def test_cancel_later(self):
+        handle = self.loop.call_later(0.01, self.append, 1)
+        self.loop.call_later(0.02, self.append, 2)
+        handle.cancel()
+        self.assertTrue(handle.cancelled())
+        # The cancelled handle was the earliest one and is removed right away.
+        self.assertEqual(len(self.loop._scheduled), 1)
+        self.loop.call_later(0.03, self.loop.stop)
+        self.loop.run_forever()
+        self.assertEqual(self.output, [2])
+
+    def test_compaction(self):
+        self.loop.call_later(0.01, self.append, "first")
+        handles = [self.loop.call_later(10 + i, self.append, i) for i in range(1000)]
+        for handle in handles:
+            handle.cancel()
+        # The heap is compacted once more than half of the handles are
+        # cancelled.
+        self.assertLess(len(self.loop._scheduled), 600)
+        self.loop.call_later(0.02, self.loop.stop)
+        self.loop.run_forever()
+        self.assertEqual(self.output, ["first"])
+        self.assertEqual(len(self.loop._scheduled), 0)
+
+    def test_wait_for(self):
+        async def main():
+            for _ in range(100):
+                await asyncio.wait_for(asyncio.sleep(0), timeout=10)
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(asyncio.sleep(10), timeout=0.01)
+
+        self.loop.run_until_complete(main())
+        self.assertLess(len(self.loop._scheduled), 100)
+
+    def test_other_thread(self):
+        errors = []
+
+        def call_later():
+            try:
+                self.loop.call_later(0.01, self.append, 1)
+            except RuntimeError as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=call_later)
+        thread.start()
+        thread.join()
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(len(self.loop._scheduled), 0)
+
+    def test_close_deleted_timer(self):
+        self.loop.call_later(10, self.append, 1)
+        # As happens when the loop is closed from __del__()
+        Shiboken.delete(self.loop._timer)
+        self.loop.close()
+        self.assertTrue(self.loop.is_closed())
+
+
+if __name__ == '__main__':
+    unittest.main()
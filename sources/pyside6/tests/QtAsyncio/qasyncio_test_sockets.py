@@ -0,0 +1,96 @@
+# Copyright (C) 2024 The Qt Company Ltd.
+# SPDX-License-Identifier: LicenseRef-Qt-Commercial OR GPL-3.0-only WITH Qt-GPL-exception-1.0
+from __future__ import annotations
+
+'''Test cases for QtAsyncio'''
+
+import unittest
+import asyncio
+import socket
+
+import PySide6.QtAsyncio as QtAsyncio
+
+
+class QAsyncioTestCaseSockets(unittest.TestCase):
+
+    async def reader(self, output):
+        loop = asyncio.get_running_loop()
+        rsock, wsock = socket.socketpair()
+        rsock.setblocking(False)
+        received = asyncio.Event()
+
+        def on_readable():
+            output.append(rsock.recv(100))
+            received.set()
+
+        loop.add_reader(rsock, on_readable)
+        loop.call_soon(wsock.send, b"data")
+        await received.wait()
+        self.assertTrue(loop.remove_reader(rsock))
+        self.assertFalse(loop.remove_reader(rsock))
+        rsock.close()
+        wsock.close()
+
+    async def socketpair(self, output):
+        loop = asyncio.get_running_loop()
+        rsock, wsock = socket.socketpair()
+        rsock.setblocking(False)
+        wsock.setblocking(False)
+
+        # Send more data than fits into the socket buffers, so that
+        # sock_sendall() has to wait until the socket becomes writable.
+        data = b"x" * 4 * 1024 * 1024
+        send_task = asyncio.ensure_future(loop.sock_sendall(wsock, data))
+        received = 0
+        while received < len(data):
+            chunk = await loop.sock_recv(rsock, 65536)
+            received += len(chunk)
+        await send_task
+        output.append(received)
+
+        buf = bytearray(4)
+        await loop.sock_sendall(wsock, b"ping")
+        output.append(await loop.sock_recv_into(rsock, buf))
+        output.append(bytes(buf))
+        rsock.close()
+        wsock.close()
+
+    async def server(self, output):
+        loop = asyncio.get_running_loop()
+        server_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server_sock.bind(("127.0.0.1", 0))
+        server_sock.listen()
+        server_sock.setblocking(False)
+
+        client_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        client_sock.setblocking(False)
+
+        accept_task = asyncio.ensure_future(loop.sock_accept(server_sock))
+        await loop.sock_connect(client_sock, server_sock.getsockname())
+        conn, _ = await accept_task
+
+        await loop.sock_sendall(client_sock, b"hello")
+        output.append(await loop.sock_recv(conn, 5))
+
+        conn.close()
+        client_sock.close()
+        server_sock.close()
+
+    def test_reader(self):
+        output = []
+        QtAsyncio.run(self.reader(output), keep_running=False)
+        self.assertEqual(output, [b"data"])
+
+    def test_socketpair(self):
+        output = []
+        QtAsyncio.run(self.socketpair(output), keep_running=False)
+        self.assertEqual(output, [4 * 1024 * 1024, 4, b"ping"])
+
+    def test_server(self):
+        output = []
+        QtAsyncio.run(self.server(output), keep_running=False)
+        self.assertEqual(output, [b"hello"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+# Copyright (C) 2024 The Qt Company Ltd.
+# SPDX-License-Identifier: LicenseRef-Qt-Commercial OR GPL-3.0-only WITH Qt-GPL-exception-1.0
+from __future__ import annotations
+
+'''Test cases for QtAsyncio'''
+
+import unittest
+import asyncio
+import time
+
+import PySide6.QtAsyncio as QtAsyncio
+
+
+class QAsyncioTestCaseStatistics(unittest.TestCase):
+
+    async def tasks(self, output):
+        loop = asyncio.get_running_loop()
+        before = loop.get_statistics()
+
+        async def sleep():
+            await asyncio.sleep(0)
+
+        await asyncio.gather(*(sleep() for _ in range(10)))
+        loop.call_later(60, lambda: None)
+        after = loop.get_statistics()
+        output.append(after["tasks_created"] - before["tasks_created"])
+        output.append(after["tasks_completed"] - before["tasks_completed"])
+        output.append(after["timer_handles"])
+
+    async def slow_callback(self, output):
+        loop = asyncio.get_running_loop()
+        loop.slow_callback_duration = 0.05
+        loop.reset_statistics()
+
+        with self.assertLogs("asyncio", "WARNING") as logs:
+            loop.call_soon(time.sleep, 0.1)
+            await asyncio.sleep(0.01)
+        statistics = loop.get_statistics()
+        output.append(statistics["slow_callbacks"])
+        output.append(statistics["callback_time"]["max"] >= 0.1)
+        output.append(statistics["callback_time"]["count"] == sum(
+            statistics["callback_time"]["buckets"].values()))
+        # The sleep() callback is due while the slow callback is running, so
+        # its queue delay includes the execution time of the slow callback.
+        output.append(statistics["queue_delay"]["max"] >= 0.05)
+        output.append("sleep(0.1) took" in logs.output[0])
+
+    def test_tasks(self):
+        output = []
+        QtAsyncio.run(self.tasks(output), keep_running=False)
+        self.assertEqual(output, [10, 10, 1])
+
+    def test_slow_callback(self):
+        output = []
+        QtAsyncio.run(self.slow_callback(output), keep_running=False, debug=True)
+        self.assertEqual(output, [1, True, True, True, True])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,158 @@
+# Copyright (C) 2024 The Qt Company Ltd.
+# SPDX-License-Identifier: LicenseRef-Qt-Commercial OR GPL-3.0-only WITH Qt-GPL-exception-1.0
+from __future__ import annotations
+
+'''Test cases for QtAsyncio'''
+
+import unittest
+import asyncio
+import os
+import ssl
+import sys
+import tempfile
+
+import PySide6.QtAsyncio as QtAsyncio
+from PySide6.QtAsyncio import transports
+from PySide6.QtNetwork import QSsl, QSslConfiguration, QSslSocket
+
+
+class QAsyncioTestCaseStreams(unittest.TestCase):
+
+    async def handle_echo(self, reader, writer):
+        while data := await reader.read(65536):
+            writer.write(data)
+            await writer.drain()
+        writer.close()
+        await writer.wait_closed()
+
+    async def echo(self, reader, writer, output):
+        writer.write(b"Hello ")
+        writer.write(b"World")
+        await writer.drain()
+        output.append(await reader.readexactly(11))
+
+        # Write more data than the high water mark of the transport, so that
+        # the protocol is paused until the buffer drains.
+        data = os.urandom(4 * 1024 * 1024)
+        writer.write(data)
+        drain_task = asyncio.ensure_future(writer.drain())
+        output.append(await reader.readexactly(len(data)) == data)
+        await drain_task
+
+        writer.close()
+        await writer.wait_closed()
+
+    async def tcp(self, output):
+        server = await asyncio.start_server(self.handle_echo, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            self.assertEqual(writer.get_extra_info("peername"), ("127.0.0.1", port))
+            await self.echo(reader, writer, output)
+
+    async def unix(self, output):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "socket")
+            server = await asyncio.start_unix_server(self.handle_echo, path)
+            async with server:
+                reader, writer = await asyncio.open_unix_connection(path)
+                await self.echo(reader, writer, output)
+
+    async def refused(self, output):
+        server = await asyncio.start_server(self.handle_echo, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        server.close()
+        await server.wait_closed()
+        try:
+            await asyncio.open_connection("127.0.0.1", port)
+        except ConnectionRefusedError:
+            output.append("refused")
+
+    async def sendfile(self, output):
+        data = os.urandom(1024 * 1024 + 123)
+        received = asyncio.get_running_loop().create_future()
+
+        async def handle(reader, writer):
+            received.set_result(await reader.read())
+            writer.close()
+
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            with tempfile.TemporaryFile() as file:
+                file.write(data)
+                file.seek(0)
+                sent = await asyncio.get_running_loop().sendfile(writer.transport, file, 10)
+                output.append(sent)
+                output.append(file.tell())
+            writer.close()
+            output.append(await received == data[10:])
+
+    def test_tcp(self):
+        output = []
+        QtAsyncio.run(self.tcp(output), keep_running=False)
+        self.assertEqual(output, [b"Hello World", True])
+
+    @unittest.skipIf(sys.platform == "win32", "Requires Unix domain sockets")
+    def test_unix(self):
+        output = []
+        QtAsyncio.run(self.unix(output), keep_running=False)
+        self.assertEqual(output, [b"Hello World", True])
+
+    def test_connection_refused(self):
+        output = []
+        QtAsyncio.run(self.refused(output), keep_running=False)
+        self.assertEqual(output, ["refused"])
+
+    def test_sendfile(self):
+        output = []
+        QtAsyncio.run(self.sendfile(output), keep_running=False)
+        self.assertEqual(output, [1024 * 1024 + 113, 1024 * 1024 + 123, True])
+
+
+class QAsyncioTestCaseSslConfiguration(unittest.TestCase):
+
+    def test_verify_mode(self):
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        configuration = transports._ssl_configuration(context)
+        self.assertEqual(configuration.peerVerifyMode(), QSslSocket.PeerVerifyMode.VerifyPeer)
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+        configuration = transports._ssl_configuration(context)
+        self.assertEqual(configuration.peerVerifyMode(), QSslSocket.PeerVerifyMode.VerifyNone)
+
+    def test_minimum_version(self):
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        context.minimum_version = ssl.TLSVersion.TLSv1_3
+        configuration = transports._ssl_configuration(context)
+        self.assertEqual(configuration.protocol(), QSsl.SslProtocol.TlsV1_3OrLater)
+
+    def test_ca_certificates(self):
+        ca_certificates = ssl.create_default_context().get_ca_certs(binary_form=True)
+        if not ca_certificates:
+            self.skipTest("no CA certificates loaded by default")
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        context.load_verify_locations(cadata=ca_certificates[0])
+        configuration = transports._ssl_configuration(context)
+        self.assertEqual([c.toDer().data() for c in configuration.caCertificates()],
+                         [ca_certificates[0]])
+
+    def test_unsupported(self):
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        context.check_hostname = False
+        self.assertRaises(NotImplementedError, transports._ssl_configuration, context)
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        context.maximum_version = ssl.TLSVersion.TLSv1_2
+        self.assertRaises(NotImplementedError, transports._ssl_configuration, context)
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        context.verify_flags |= ssl.VERIFY_CRL_CHECK_LEAF
+        self.assertRaises(NotImplementedError, transports._ssl_configuration, context)
+        self.assertRaises(TypeError, transports._ssl_configuration,
+                          ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER), True)
+        configuration = QSslConfiguration.defaultConfiguration()
+        self.assertIs(transports._ssl_configuration(configuration, True), configuration)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+# Copyright (C) 2024 The Qt Company Ltd.
+# SPDX-License-Identifier: LicenseRef-Qt-Commercial OR GPL-3.0-only WITH Qt-GPL-exception-1.0
+from __future__ import annotations
+
+'''Test cases for QtAsyncio'''
+
+import unittest
+import asyncio
+import os
+import signal
+import sys
+
+import PySide6.QtAsyncio as QtAsyncio
+
+
+class QAsyncioTestCaseSubprocess(unittest.TestCase):
+
+    async def communicate(self, output):
+        code = "import sys; data = sys.stdin.buffer.read(); print(len(data)); sys.exit(3)"
+        process = await asyncio.create_subprocess_exec(
+            sys.executable, "-c", code, stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE)
+        # Write more data than the high water mark of the stdin pipe.
+        stdout, stderr = await process.communicate(os.urandom(1024 * 1024))
+        output.append(stdout.strip())
+        output.append(stderr)
+        output.append(process.returncode)
+
+    async def shell(self, output):
+        process = await asyncio.create_subprocess_shell(
+            "echo out && echo err 1>&2", stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT)
+        stdout, _ = await process.communicate()
+        output.append(stdout.split())
+        output.append(await process.wait())
+
+    async def merged_channels(self, output):
+        code = "import sys; print('out'); print('err', file=sys.stderr)"
+        # Standard error cannot be merged into an inherited standard output.
+        try:
+            await asyncio.create_subprocess_exec(sys.executable, "-c", code,
+                                                 stderr=asyncio.subprocess.STDOUT)
+        except ValueError:
+            output.append("rejected")
+        process = await asyncio.create_subprocess_exec(
+            sys.executable, "-c", code, stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.STDOUT)
+        output.append(await process.wait())
+
+    async def terminate(self, output):
+        code = "import time; time.sleep(60)"
+        process = await asyncio.create_subprocess_exec(sys.executable, "-c", code)
+        process.terminate()
+        output.append(await process.wait())
+
+    async def not_found(self, output):
+        try:
+            await asyncio.create_subprocess_exec("qasyncio-test-program-that-does-not-exist")
+        except FileNotFoundError:
+            output.append("not found")
+
+    async def pipes(self, output):
+        loop = asyncio.get_running_loop()
+        read_fd, write_fd = os.pipe()
+        reader = asyncio.StreamReader()
+        await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader),
+                                     os.fdopen(read_fd, "rb"))
+        transport, _ = await loop.connect_write_pipe(asyncio.Protocol,
+                                                     os.fdopen(write_fd, "wb"))
+        data = os.urandom(1024 * 1024)
+        transport.write(data)
+        transport.close()
+        output.append(await reader.read() == data)
+
+    async def failing_protocol(self, output):
+        loop = asyncio.get_running_loop()
+        read_fd, write_fd = os.pipe()
+        connection_lost = loop.create_future()
+
+        class FailingProtocol(asyncio.Protocol):
+            def data_received(self, data):
+                raise ValueError("data_received() failed")
+
+            def connection_lost(self, exc):
+                connection_lost.set_result(exc)
+
+        transport, _ = await loop.connect_read_pipe(FailingProtocol, os.fdopen(read_fd, "rb"))
+        os.write(write_fd, b"data")
+        exception = await asyncio.wait_for(connection_lost, 10)
+        os.close(write_fd)
+        output.append(type(exception))
+        output.append(transport.is_closing())
+
+    def test_communicate(self):
+        output = []
+        QtAsyncio.run(self.communicate(output), keep_running=False)
+        self.assertEqual(output, [b"1048576", b"", 3])
+
+    @unittest.skipIf(sys.platform == "win32", "Requires a POSIX shell")
+    def test_shell(self):
+        output = []
+        QtAsyncio.run(self.shell(output), keep_running=False)
+        self.assertEqual(output, [[b"out", b"err"], 0])
+
+    def test_merged_channels(self):
+        output = []
+        QtAsyncio.run(self.merged_channels(output), keep_running=False)
+        self.assertEqual(output, ["rejected", 0])
+
+    @unittest.skipIf(sys.platform == "win32", "Requires Unix signals")
+    def test_terminate(self):
+        output = []
+        QtAsyncio.run(self.terminate(output), keep_running=False)
+        self.assertEqual(output, [-signal.SIGTERM])
+
+    def test_not_found(self):
+        output = []
+        QtAsyncio.run(self.not_found(output), keep_running=False)
+        self.assertEqual(output, ["not found"])
+
+    @unittest.skipIf(sys.platform == "win32", "Requires non-blocking pipes")
+    def test_pipes(self):
+        output = []
+        QtAsyncio.run(self.pipes(output), keep_running=False)
+        self.assertEqual(output, [True])
+
+    @unittest.skipIf(sys.platform == "win32", "Requires non-blocking pipes")
+    def test_failing_protocol(self):
+        output = []
+        QtAsyncio.run(self.failing_protocol(output), keep_running=False)
+        self.assertEqual(output, [ValueError, True])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,6 +7,7 @@ from __future__ import annotations
 import unittest
 import asyncio
 import datetime
+import time
 
 from PySide6.QtAsyncio import QAsyncioEventLoopPolicy
 
@@ -45,6 +46,42 @@ class QAsyncioTestCaseTime(unittest.TestCase):
         if self.exception is not None:
             raise self.exception
 
+    def test_monotonic(self):
+        asyncio.set_event_loop_policy(QAsyncioEventLoopPolicy())
+        loop = asyncio.new_event_loop()
+
+        before = time.monotonic()
+        loop_time = loop.time()
+        after = time.monotonic()
+        self.assertLessEqual(before, loop_time)
+        self.assertLessEqual(loop_time, after)
+        loop.close()
+
+    def test_short_delays(self):
+        asyncio.set_event_loop_policy(QAsyncioEventLoopPolicy())
+        loop = asyncio.new_event_loop()
+        delays = []
+
+        def callback(when, remaining):
+            # The callback must not be executed before it is due.
+            delays.append(loop.time() - when)
+            if remaining:
+                when = loop.time() + 0.0005 * remaining
+                loop.call_at(when, callback, when, remaining - 1)
+            else:
+                loop.stop()
+
+        loop.call_soon(callback, loop.time(), 10)
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+
+        self.assertEqual(len(delays), 11)
+        for delay in delays:
+            self.assertGreaterEqual(delay, -loop._clock_resolution)
+            self.assertLess(delay, 0.1)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -45,6 +45,18 @@ class QChartsNumpyTestCase(UsesQApplication):
             self.assertEqual(point.x(), 2)
             self.assertEqual(point.y(), 3)
 
+    @unittest.skipUnless(HAVE_NUMPY, "requires numpy")
+    def testPointsNp(self):
+        line_series = QLineSeries()
+        x = np.arange(5, dtype=np.float64)
+        line_series.appendNp(x, x * 2)
+        points = line_series.pointsNp()
+        self.assertEqual(points.shape, (5, 2))
+        self.assertEqual(points.dtype, np.float64)
+        self.assertTrue(np.array_equal(points[:, 0], x))
+        self.assertTrue(np.array_equal(points[:, 1], x * 2))
+        self.assertEqual(QLineSeries().pointsNp().shape, (0, 2))
+
 
 if __name__ == '__main__':
     unittest.main()
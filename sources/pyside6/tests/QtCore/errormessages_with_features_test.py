@@ -91,6 +91,18 @@ class ErrormessagesWithFeatures(unittest.TestCase):
             qApp.quit_on_last_window_closed = object
         self.assertTrue(self.probe in cm.exception.args[0])
 
+    def testRepeatedErrorMessages(self):
+        # Argument errors are cached per function and argument types, and
+        # are plain TypeErrors.
+        messages = []
+        for _ in range(2):
+            with self.assertRaises(TypeError) as cm:
+                QLabel().setFont(42)
+            messages.append(cm.exception.args[0])
+        self.assertEqual(messages[0], messages[1])
+        self.assertIs(type(cm.exception), TypeError)
+        self.assertTrue(self.probe in str(cm.exception))
+
     def testDocIsWorking(self):
         """
         make sure that it does not crash when touched
@@ -0,0 +1,59 @@
+#!/usr/bin/python
+# Copyright (C) 2024 The Qt Company Ltd.
+# SPDX-License-Identifier: LicenseRef-Qt-Commercial OR GPL-3.0-only WITH Qt-GPL-exception-1.0
+from __future__ import annotations
+
+'''Test cases for QtGraphs/numpy'''
+
+import os
+import sys
+import unittest
+try:
+    import numpy as np
+    HAVE_NUMPY = True
+except ModuleNotFoundError:
+    HAVE_NUMPY = False
+
+from pathlib import Path
+sys.path.append(os.fspath(Path(__file__).resolve().parents[1]))
+from init_paths import init_test_paths
+init_test_paths(False)
+
+from helper.usesqapplication import UsesQApplication
+from PySide6.QtCore import QPointF
+from PySide6.QtGui import QColor
+from PySide6.QtGraphs import QGraphsTheme, QLineSeries
+
+
+class QtGraphsNumpyTestCase(UsesQApplication):
+    '''Tests related to QtGraphs/numpy'''
+
+    @unittest.skipUnless(HAVE_NUMPY, "requires numpy")
+    def testSeriesColorsNp(self):
+        theme = QGraphsTheme()
+        # The default colors of the theme
+        colors = theme.seriesColorsNp()
+        self.assertEqual(colors.dtype, np.float32)
+        expected = np.array([color.getRgbF() for color in theme.seriesColors()],
+                            dtype=np.float32)
+        self.assertEqual(colors.shape, (len(theme.seriesColors()), 4))
+        self.assertTrue(np.array_equal(colors, expected))
+
+        theme.setSeriesColors([QColor(255, 0, 0), QColor(0, 0, 255, 51)])
+        colors = theme.seriesColorsNp()
+        self.assertEqual(colors.shape, (2, 4))
+        self.assertTrue(np.allclose(colors, [[1, 0, 0, 1], [0, 0, 1, 0.2]]))
+
+    @unittest.skipUnless(HAVE_NUMPY, "requires numpy")
+    def testPointsNp(self):
+        line_series = QLineSeries()
+        line_series.append([QPointF(1, 2), QPointF(3, 4), QPointF(5, 6)])
+        points = line_series.pointsNp()
+        self.assertEqual(points.shape, (3, 2))
+        self.assertEqual(points.dtype, np.float64)
+        self.assertTrue(np.array_equal(points, [[1, 2], [3, 4], [5, 6]]))
+        self.assertEqual(QLineSeries().pointsNp().shape, (0, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
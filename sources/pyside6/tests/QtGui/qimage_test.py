@@ -13,7 +13,13 @@ sys.path.append(os.fspath(Path(__file__).resolve().parents[1]))
 from init_paths import init_test_paths
 init_test_paths(False)
 
-from PySide6.QtGui import QImage
+try:
+    import numpy as np
+    HAVE_NUMPY = True
+except ModuleNotFoundError:
+    HAVE_NUMPY = False
+
+from PySide6.QtGui import QColor, QImage, QPainter
 from helper.usesqapplication import UsesQApplication
 from xpm_data import xpm
 
@@ -52,6 +58,85 @@ class QImageTest(UsesQApplication):
         self.assertEqual(img.width(), 27)
         self.assertEqual(img.height(), 22)
 
+    @unittest.skipUnless(HAVE_NUMPY, "requires numpy")
+    def testToNumpy(self):
+        img = QImage(5, 3, QImage.Format_Grayscale8)  # Scan lines are padded to 8
+        img.fill(0)
+        img.setPixelColor(2, 1, QColor(200, 200, 200))
+        array = img.toNumpy()
+        self.assertEqual(array.shape, (3, 5))
+        self.assertEqual(array.strides, (img.bytesPerLine(), 1))
+        self.assertEqual(array.dtype, np.uint8)
+        self.assertFalse(array.flags.writeable)
+        self.assertEqual(array[1, 2], 200)
+
+        rgba = QImage(4, 2, QImage.Format_RGBA8888)
+        rgba.fill(QColor(1, 2, 3, 4))
+        array = rgba.toNumpy()
+        self.assertEqual(array.shape, (2, 4, 4))
+        self.assertEqual(list(array[1, 3]), [1, 2, 3, 4])
+        del rgba
+        self.assertEqual(list(array[0, 0]), [1, 2, 3, 4])  # The array keeps the data
+
+        self.assertRaises(ValueError, QImage().toNumpy)
+        self.assertRaises(ValueError, QImage(8, 8, QImage.Format_Mono).toNumpy)
+        # The bytes of packed 24 bit pixels are not channels
+        self.assertRaises(ValueError, QImage(8, 8, QImage.Format_RGB666).toNumpy)
+        self.assertRaises(ValueError, QImage(8, 8,
+                                             QImage.Format_ARGB8565_Premultiplied).toNumpy)
+
+    @unittest.skipUnless(HAVE_NUMPY, "requires numpy")
+    def testToNumpySharedData(self):
+        '''Test that the arrays of an image share its data without copying it, and
+           keep it when the image is detached.'''
+        img = QImage(4, 2, QImage.Format_Grayscale8)
+        img.fill(10)
+        array1 = img.toNumpy()
+        array2 = img.toNumpy()
+        self.assertEqual(array1.__array_interface__['data'][0],
+                         array2.__array_interface__['data'][0])
+
+        # Detach the image while another image shares the data, then release
+        # that image.
+        other = QImage(img)
+        img.fill(20)
+        del other
+        self.assertEqual(array1[1, 3], 10)
+        self.assertEqual(img.toNumpy()[1, 3], 20)
+
+        painter = QPainter(img)
+        painter.fillRect(0, 0, 4, 2, QColor(50, 50, 50))
+        painter.end()
+        self.assertEqual(array2[0, 1], 10)
+        del img
+        self.assertEqual(array2[1, 3], 10)
+
+    @unittest.skipUnless(HAVE_NUMPY, "requires numpy")
+    def testFromNumpy(self):
+        array = np.zeros((3, 4, 4), dtype=np.uint8)
+        array[2, 1] = (10, 20, 30, 255)
+        img = QImage.fromNumpy(array)
+        self.assertEqual(img.format(), QImage.Format_RGBA8888)
+        self.assertEqual(img.size().toTuple(), (4, 3))
+        self.assertEqual(img.pixelColor(1, 2), QColor(10, 20, 30))
+        array[0, 0] = (40, 50, 60, 255)  # The image shares the data
+        self.assertEqual(img.pixelColor(0, 0), QColor(40, 50, 60))
+
+        # Padded rows of a view
+        padded = np.zeros((2, 8), dtype=np.uint16)
+        img = QImage.fromNumpy(padded[:, :5], QImage.Format_Grayscale16)
+        self.assertEqual(img.bytesPerLine(), 16)
+        self.assertTrue(np.array_equal(img.toNumpy(), padded[:, :5]))
+
+        self.assertRaises(ValueError, QImage.fromNumpy, np.zeros((2, 2), dtype=np.float64))
+        self.assertRaises(ValueError, QImage.fromNumpy, np.zeros((4, 4), dtype=np.uint8)[:, ::2])
+        self.assertRaises(ValueError, QImage.fromNumpy, array, QImage.Format_RGB16)
+        self.assertRaises(ValueError, QImage.fromNumpy, np.zeros((2, 2, 3), dtype=np.uint8),
+                          QImage.Format_RGB666)
+        # Empty arrays would result in null images
+        self.assertRaises(ValueError, QImage.fromNumpy, np.zeros((0, 4), dtype=np.uint8))
+        self.assertRaises(ValueError, QImage.fromNumpy, np.zeros((3, 0, 4), dtype=np.uint8))
+
 
 if __name__ == '__main__':
     unittest.main()
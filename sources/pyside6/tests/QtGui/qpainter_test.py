@@ -99,6 +99,13 @@ class QPainterDrawText(UsesQApplication):
             x = np.array([10.0, 20.0, 80.0, 90.0])
             y = np.array([80.0, 10.0, 30.0, 70.0])
             self.painter.drawPointsNp(x, y)
+            points = np.column_stack((x, y))
+            self.painter.drawPointsNp(points)
+            self.painter.drawPolylineNp(points)
+            self.painter.drawPolylineNp(x, y)
+            self.painter.drawLinesNp(points)
+            self.painter.drawLinesNp(points[:, 0], points[:, 1])
+            self.assertRaises(ValueError, self.painter.drawLinesNp, points[:3])
 
 
 class SetBrushWithOtherArgs(UsesQApplication):
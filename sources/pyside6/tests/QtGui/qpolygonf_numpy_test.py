@@ -0,0 +1,56 @@
+# Copyright (C) 2024 The Qt Company Ltd.
+# SPDX-License-Identifier: LicenseRef-Qt-Commercial OR GPL-3.0-only WITH Qt-GPL-exception-1.0
+from __future__ import annotations
+
+'''Test cases for QPolygonF/numpy'''
+
+import os
+import sys
+import unittest
+try:
+    import numpy as np
+    HAVE_NUMPY = True
+except ModuleNotFoundError:
+    HAVE_NUMPY = False
+
+from pathlib import Path
+sys.path.append(os.fspath(Path(__file__).resolve().parents[1]))
+from init_paths import init_test_paths
+init_test_paths(False)
+
+from PySide6.QtCore import QPointF
+from PySide6.QtGui import QPainterPath, QPolygonF
+
+
+class QPolygonFNumpyTest(unittest.TestCase):
+    '''Tests related to QPolygonF/numpy'''
+
+    @unittest.skipUnless(HAVE_NUMPY, "requires numpy")
+    def testFromNumpy(self):
+        data = np.array([[0.0, 1.0], [2.0, 3.0], [4.5, 5.5]])
+        expected = [QPointF(0.0, 1.0), QPointF(2.0, 3.0), QPointF(4.5, 5.5)]
+        self.assertEqual(list(QPolygonF.fromNumpy(data)), expected)
+        # Strided columns and other types
+        self.assertEqual(list(QPolygonF.fromNumpy(data[:, 0], data[:, 1])), expected)
+        ints = np.array([[1, 2], [3, 4]], dtype=np.int16)
+        self.assertEqual(list(QPolygonF.fromNumpy(ints.T.copy().T)),
+                         [QPointF(1, 2), QPointF(3, 4)])
+        self.assertEqual(len(QPolygonF.fromNumpy(np.empty((0, 2)))), 0)
+
+        self.assertRaises(ValueError, QPolygonF.fromNumpy, np.zeros((3, 3)))
+        self.assertRaises(ValueError, QPolygonF.fromNumpy, np.zeros(3), np.zeros(3, np.int32))
+        self.assertRaises(ValueError, QPolygonF.fromNumpy, np.zeros((3, 2), np.int8))
+        self.assertRaises(ValueError, QPolygonF.fromNumpy, np.zeros((3, 2), np.float16))
+
+        exported = QPolygonF.fromNumpy(data).toNumpy()
+        self.assertEqual(exported.shape, (3, 2))
+        self.assertTrue(np.array_equal(exported, data))
+
+        path = QPainterPath()
+        path.addPolygonNp(data)
+        self.assertEqual(path.elementCount(), 3)
+        self.assertEqual(path.currentPosition(), QPointF(4.5, 5.5))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -55,6 +55,27 @@ class PySideSignatureTest(unittest.TestCase):
         called_default = sig.parameters["exclude"].default()
         self.assertEqual(type(called_default), PySide6.QtCore.QByteArray)
 
+    def testLazySignatureProps(self):
+        # Lazily created properties are parsed on first use, also for the
+        # snake_case copies, and give the same signatures as parsed ones.
+        from PySide6.support.signature import layout, parser
+        sig_strings = ["1:PySide6.QtCore.QPoint(self)",
+                       "0:PySide6.QtCore.QPoint(self,xpos:int,ypos:int)",
+                       "PySide6.QtCore.QPoint.setX(self,x:int)"]
+        props = parser._calculate_type_props(sig_strings)
+        lazy_props = parser._lazy_type_props(sig_strings)
+        self.assertEqual(parser.build_signature_index(sig_strings),
+                         {"QPoint": (0, 2), "setX": (2, 3)})
+        snake_props = dict(lazy_props["setX"], name="set_x")
+        for name in ("QPoint", "setX"):
+            self.assertIn(parser._LAZY, lazy_props[name])
+            self.assertEqual(str(layout.create_signature(lazy_props[name], "method")),
+                             str(layout.create_signature(props[name], "method")))
+            self.assertEqual(lazy_props[name], props[name])
+        layout.create_signature(snake_props, "method")
+        self.assertEqual(snake_props["name"], "set_x")
+        self.assertEqual(snake_props["varnames"], props["setX"]["varnames"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,131 @@
+# Copyright (C) 2024 The Qt Company Ltd.
+# SPDX-License-Identifier: LicenseRef-Qt-Commercial OR LGPL-3.0-only OR GPL-2.0-only OR GPL-3.0-only
+from __future__ import annotations
+
+"""
+Benchmark the numpy entry points for bulk point data against the list-based ones
+--------------------------------------------------------------------------------
+
+Usage: python3 numpy_points_benchmark.py [--points N] [--repeat N] [benchmark ...]
+
+Runs each benchmark once with numpy arrays (the xxxNp() functions and
+QPolygonF.fromNumpy()) and once with a list of QPointF created from the same
+data, which is the time needed to get the data of a numpy array into the
+list-based overloads. Prints the best time of each and their ratio. The
+benchmarks are:
+
+    polygon     create a QPolygonF
+    path        add the points to a QPainterPath as polygon
+    polyline    draw a polyline onto an image
+    lines       draw the points as lines onto an image
+    points      draw the points onto an image
+"""
+import argparse
+import sys
+
+from timeit import default_timer as timer
+
+import numpy as np
+
+from PySide6.QtCore import QPointF
+from PySide6.QtGui import QGuiApplication, QImage, QPainter, QPainterPath, QPolygonF
+
+
+def to_points(data):
+    return [QPointF(x, y) for x, y in data.tolist()]
+
+
+def polygon_np(data, image):
+    QPolygonF.fromNumpy(data)
+
+
+def polygon_list(data, image):
+    QPolygonF(to_points(data))
+
+
+def path_np(data, image):
+    QPainterPath().addPolygonNp(data)
+
+
+def path_list(data, image):
+    QPainterPath().addPolygon(QPolygonF(to_points(data)))
+
+
+def polyline_np(data, image):
+    with QPainter(image) as painter:
+        painter.drawPolylineNp(data)
+
+
+def polyline_list(data, image):
+    with QPainter(image) as painter:
+        painter.drawPolyline(to_points(data))
+
+
+def lines_np(data, image):
+    with QPainter(image) as painter:
+        painter.drawLinesNp(data)
+
+
+def lines_list(data, image):
+    with QPainter(image) as painter:
+        painter.drawLines(to_points(data))
+
+
+def points_np(data, image):
+    with QPainter(image) as painter:
+        painter.drawPointsNp(data)
+
+
+def points_list(data, image):
+    with QPainter(image) as painter:
+        painter.drawPoints(to_points(data))
+
+
+BENCHMARKS = {
+    "polygon": (polygon_np, polygon_list),
+    "path": (path_np, path_list),
+    "polyline": (polyline_np, polyline_list),
+    "lines": (lines_np, lines_list),
+    "points": (points_np, points_list),
+}
+
+
+def best_time(benchmark, data, image, repeat):
+    times = []
+    for _ in range(repeat):
+        start_time = timer()
+        benchmark(data, image)
+        times.append(timer() - start_time)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("benchmarks", nargs="*", choices=[[], *BENCHMARKS],
+                        help="the benchmarks to run (default: all)")
+    parser.add_argument("--points", type=int, default=1000000,
+                        help="number of points (default: 1000000)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="number of runs per benchmark, the best is reported")
+    options = parser.parse_args()
+
+    app = QGuiApplication(sys.argv[:1])  # noqa: F841
+    image = QImage(1000, 1000, QImage.Format_ARGB32_Premultiplied)
+    # A trace as plotted: x ascending, y random. Use an even count for lines.
+    count = options.points - options.points % 2
+    data = np.column_stack((np.linspace(0.0, 1000.0, count),
+                            np.random.default_rng(0).uniform(0.0, 1000.0, count)))
+
+    print(f"{'benchmark':<12}{'numpy':>12}{'list':>12}{'ratio':>8}")
+    for name in options.benchmarks or BENCHMARKS:
+        numpy_benchmark, list_benchmark = BENCHMARKS[name]
+        numpy_time = best_time(numpy_benchmark, data, image, options.repeat)
+        list_time = best_time(list_benchmark, data, image, options.repeat)
+        print(f"{name:<12}{numpy_time:>11.4f}s{list_time:>11.4f}s"
+              f"{list_time / numpy_time:>8.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
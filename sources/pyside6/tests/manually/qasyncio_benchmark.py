@@ -0,0 +1,143 @@
+# Copyright (C) 2024 The Qt Company Ltd.
+# SPDX-License-Identifier: LicenseRef-Qt-Commercial OR LGPL-3.0-only OR GPL-2.0-only OR GPL-3.0-only
+from __future__ import annotations
+
+"""
+Benchmark the QtAsyncio event loop against the default asyncio event loop
+--------------------------------------------------------------------------
+
+Usage: python3 qasyncio_benchmark.py [--repeat N] [--max-ratio R] [benchmark ...]
+
+Runs each benchmark with QtAsyncio.run() and with asyncio.run(), and prints
+the best time of each loop and their ratio. The benchmarks are:
+
+    spawn       create and await many tasks, one after the other
+    pingpong    two tasks passing a value back and forth through futures
+    gather      gather 10000 tasks
+    timers      schedule and cancel many timers, running some of them
+
+With --max-ratio, the script exits with an error if QtAsyncio is more than R
+times slower than asyncio for any benchmark, so that it can be used to catch
+performance regressions of QtAsyncio.
+"""
+import argparse
+import asyncio
+import sys
+
+from timeit import default_timer as timer
+
+import PySide6.QtAsyncio as QtAsyncio
+
+N = 10000
+
+
+async def noop():
+    pass
+
+
+async def spawn():
+    loop = asyncio.get_running_loop()
+    for _ in range(N):
+        await loop.create_task(noop())
+
+
+async def pingpong():
+    loop = asyncio.get_running_loop()
+    ping = loop.create_future()
+    pong = loop.create_future()
+
+    async def player(count):
+        nonlocal ping
+        for _ in range(count):
+            value = await ping
+            ping = loop.create_future()
+            pong.set_result(value + 1)
+
+    task = loop.create_task(player(N))
+    value = 0
+    for _ in range(N):
+        ping.set_result(value)
+        value = await pong
+        pong = loop.create_future()
+    await task
+    assert value == N
+
+
+async def gather():
+    await asyncio.gather(*(noop() for _ in range(N)))
+
+
+async def timers():
+    loop = asyncio.get_running_loop()
+    done = loop.create_future()
+    count = 0
+
+    def fired():
+        nonlocal count
+        count += 1
+        if count == N // 10 and not done.done():
+            done.set_result(None)
+
+    for i in range(N):
+        handle = loop.call_later(0.001 * (i % 10), fired)
+        if i % 10:
+            handle.cancel()
+    await done
+
+
+BENCHMARKS = {
+    "spawn": spawn,
+    "pingpong": pingpong,
+    "gather": gather,
+    "timers": timers,
+}
+
+
+def run_qtasyncio(benchmark):
+    QtAsyncio.run(benchmark(), keep_running=False)
+
+
+def run_asyncio(benchmark):
+    asyncio.run(benchmark())
+
+
+def best_time(run, benchmark, repeat):
+    times = []
+    for _ in range(repeat):
+        start_time = timer()
+        run(benchmark)
+        times.append(timer() - start_time)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("benchmarks", nargs="*", choices=[[], *BENCHMARKS],
+                        help="the benchmarks to run (default: all)")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="number of runs per benchmark, the best is reported")
+    parser.add_argument("--max-ratio", type=float, default=None,
+                        help="fail if QtAsyncio is more than this many times slower")
+    options = parser.parse_args()
+
+    failed = []
+    print(f"{'benchmark':<12}{'QtAsyncio':>12}{'asyncio':>12}{'ratio':>8}")
+    for name in options.benchmarks or BENCHMARKS:
+        benchmark = BENCHMARKS[name]
+        qt_time = best_time(run_qtasyncio, benchmark, options.repeat)
+        asyncio_time = best_time(run_asyncio, benchmark, options.repeat)
+        ratio = qt_time / asyncio_time
+        print(f"{name:<12}{qt_time:>11.4f}s{asyncio_time:>11.4f}s{ratio:>8.2f}")
+        if options.max_ratio is not None and ratio > options.max_ratio:
+            failed.append(name)
+
+    if failed:
+        print(f"QtAsyncio is more than {options.max_ratio} times slower for: "
+              f"{', '.join(failed)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,49 @@
+# Copyright (C) 2024 The Qt Company Ltd.
+# SPDX-License-Identifier: LicenseRef-Qt-Commercial OR LGPL-3.0-only OR GPL-2.0-only OR GPL-3.0-only
+from __future__ import annotations
+
+'''Test that generate_pyi produces the same stubs serially and in parallel'''
+
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from pathlib import Path
+sys.path.append(os.fspath(Path(__file__).resolve().parents[1]))
+from init_paths import init_test_paths
+init_test_paths(False)
+
+import PySide6
+
+# QtNetwork has global enums, whose type must not depend on the modules
+# generated before in the same process.
+MODULES = [name for name in ("QtCore", "QtGui", "QtWidgets", "QtNetwork")
+           if name in PySide6.__all__]
+
+
+class GeneratePyiJobsTest(unittest.TestCase):
+
+    def _generate(self, outpath: Path, *args: str) -> dict[str, str]:
+        script = Path(PySide6.__file__).parent / "support" / "generate_pyi.py"
+        cmd = [sys.executable, os.fspath(script), *args, "--quiet", "--outpath",
+               os.fspath(outpath)]
+        subprocess.run(cmd, check=True)
+        return {path.name: path.read_text(encoding="utf-8") for path in outpath.glob("*.pyi")}
+
+    def testSerialParallel(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp_path = Path(tmp)
+            serial = self._generate(tmp_path / "serial", *MODULES)
+            parallel = self._generate(tmp_path / "parallel", *MODULES, "--jobs", "2")
+            single = self._generate(tmp_path / "single", MODULES[-1])
+        self.assertEqual(sorted(serial.keys()), sorted(f"{name}.pyi" for name in MODULES))
+        for name, text in serial.items():
+            self.assertEqual(text, parallel[name], f"{name} differs with --jobs")
+        name = f"{MODULES[-1]}.pyi"
+        self.assertEqual(serial[name], single[name], f"{name} differs when generated alone")
+
+
+if __name__ == '__main__':
+    unittest.main()
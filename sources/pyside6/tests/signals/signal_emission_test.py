@@ -142,6 +142,93 @@ class DynamicSignalsToFuncPartial(UsesQApplication):
         self.assertTrue(called)
 
 
+class ArgumentSender(QObject):
+    '''Sender class with signals of various argument types'''
+
+    int_signal = Signal(int)
+    float_signal = Signal(float)
+    str_signal = Signal(str)
+
+
+class EmittingSender(ArgumentSender):
+    '''Sender class overriding emit()'''
+
+    def __init__(self):
+        super().__init__()
+        self.emitted = []
+
+    def emit(self, *args):
+        self.emitted.append(args[0])
+        return super().emit(*args)
+
+
+class SignalInstanceEmission(UsesQApplication):
+    '''Emission of Python signals by SignalInstance.emit()'''
+
+    def setUp(self):
+        super().setUp()
+        self.args = []
+
+    def slot(self, *args):
+        self.args.append(args)
+
+    def testConversion(self):
+        '''Arguments are converted to the signal types'''
+        sender = ArgumentSender()
+        sender.int_signal.connect(self.slot)
+        sender.float_signal.connect(self.slot)
+        sender.str_signal.connect(self.slot)
+        self.assertTrue(sender.int_signal.emit(True))
+        sender.float_signal.emit(3)
+        sender.str_signal.emit('text')
+        self.assertEqual(self.args, [(1,), (3.0,), ('text',)])
+        self.assertIs(type(self.args[0][0]), int)
+        self.assertIs(type(self.args[1][0]), float)
+
+    def testOverriddenEmit(self):
+        sender = EmittingSender()
+        sender.int_signal.connect(self.slot)
+        sender.int_signal.emit(42)
+        self.assertEqual(self.args, [(42,)])
+        self.assertEqual(sender.emitted, [SIGNAL('int_signal(int)')])
+
+    def testInstanceEmit(self):
+        '''An emit() set on an instance is called like an overridden one'''
+        sender = ArgumentSender()
+        emitted = []
+
+        def emit(*args):
+            emitted.append(args[0])
+            return QObject.emit(sender, *args)
+
+        sender.int_signal.connect(self.slot)
+        signal_instance = sender.int_signal
+        signal_instance.emit(1)
+        sender.emit = emit
+        signal_instance.emit(2)
+        del sender.emit
+        signal_instance.emit(3)
+        self.assertEqual(self.args, [(1,), (2,), (3,)])
+        self.assertEqual(emitted, [SIGNAL('int_signal(int)')])
+
+    def testMetaObjectChange(self):
+        '''A signal instance emits the right signal after signals were added to
+           the meta object of its sender'''
+        sender = ArgumentSender()
+        signal_instance = sender.str_signal
+        signal_instance.connect(self.slot)
+        signal_instance.emit('before')
+        method_count = sender.metaObject().methodCount()
+
+        # Connecting to an unknown signal adds a dynamic signal
+        sender.connect(SIGNAL('dynamicSignal(int)'), functools.partial(self.slot, 'dynamic'))
+        self.assertEqual(sender.metaObject().methodCount(), method_count + 1)
+        signal_instance.emit('after')
+        sender.emit(SIGNAL('dynamicSignal(int)'), 42)
+        sender.int_signal.emit(7)
+        self.assertEqual(self.args, [('before',), ('after',), ('dynamic', 42)])
+
+
 class EmitUnknownType(UsesQApplication):
     def testIt(self):
         a = QObject()
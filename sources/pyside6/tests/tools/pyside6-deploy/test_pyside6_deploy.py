@@ -444,6 +444,73 @@ class TestLongCommand(DeployTestBase):
                                   if line.startswith("# nuitka-project:")]), 517)
 
 
+class TestImportScanning(DeployTestBase):
+    def setUp(self):
+        self.project_dir = Path(tempfile.mkdtemp(dir=self.temp_dir))
+        (self.project_dir / "main.py").write_text(
+            "from PySide6.QtCore import QObject, QCameraPermission\n"
+            "from PySide6 import QtGui\n")
+        (self.project_dir / "helper.py").write_text("from . import main\n")
+        self.dependency_util = importlib.import_module("deploy_lib.dependency_util")
+
+    def _find_imports(self):
+        # Results are cached per run
+        self.dependency_util.get_py_files.cache_clear()
+        self.dependency_util._find_project_imports.cache_clear()
+        modules = self.dependency_util.find_pyside_modules(project_dir=self.project_dir,
+                                                           extra_ignore_dirs=["tmp"])
+        permissions = self.dependency_util.find_permission_categories(
+            project_dir=self.project_dir, extra_ignore_dirs=["tmp"])
+        return set(modules), permissions
+
+    def testImportCache(self):
+        self.assertEqual(self._find_imports(), ({"Core", "Gui"}, {"Camera"}))
+        cache_file = self.project_dir / self.dependency_util.IMPORT_CACHE_FILE
+        self.assertTrue(cache_file.is_file())
+
+        # Unchanged files are not scanned again
+        with patch("deploy_lib.dependency_util._scan_file_imports") as mock_scan:
+            self.assertEqual(self._find_imports(), ({"Core", "Gui"}, {"Camera"}))
+            mock_scan.assert_not_called()
+
+        # Modified files are
+        with (self.project_dir / "helper.py").open("a") as f:
+            f.write("from PySide6.QtNetwork import QTcpSocket\n")
+        self.assertEqual(self._find_imports(), ({"Core", "Gui", "Network"}, {"Camera"}))
+
+    def testParallelScan(self):
+        modules = ["QtCore", "QtGui", "QtNetwork", "QtWidgets"]
+        for i, module in enumerate(modules):
+            (self.project_dir / f"module_{i}.py").write_text(
+                f"from PySide6.{module} import QObject\n")
+        py_files = sorted(self.project_dir.glob("*.py"))
+        cache_file = self.project_dir / self.dependency_util.IMPORT_CACHE_FILE
+
+        serial = self.dependency_util.scan_imports(py_files, self.project_dir, jobs=1)
+        cache_file.unlink()
+        # Scan the files in worker processes although there are only a few of them
+        with patch("deploy_lib.dependency_util.PARALLEL_SCAN_MIN_FILES", 1), \
+             patch("deploy_lib.dependency_util.ProcessPoolExecutor",
+                   wraps=self.dependency_util.ProcessPoolExecutor) as mock_executor:
+            parallel = self.dependency_util.scan_imports(py_files, self.project_dir, jobs=2)
+            mock_executor.assert_called_once()
+        self.assertEqual(parallel, serial)
+        self.assertEqual(set(parallel), set(py_files))
+        self.assertTrue(cache_file.is_file())
+
+
+@unittest.skipIf(sys.platform != "linux", "Test only works on Linux")
+class TestElfReader(DeployTestBase):
+    def testReadNeededLibraries(self):
+        from PySide6 import QtWidgets
+        elf_reader = importlib.import_module("deploy_lib.elf_reader")
+        needed = elf_reader.read_needed_libraries(Path(QtWidgets.__file__))
+        self.assertIn("libQt6Widgets.so.6", needed)
+        self.assertIn("libQt6Core.so.6", needed)
+        with self.assertRaises(ValueError):
+            elf_reader.read_needed_libraries(Path(__file__))
+
+
 @unittest.skipIf(sys.platform == "darwin" and int(platform.mac_ver()[0].split('.')[0]) <= 11,
                  "Test only works on macOS version 12+")
 @patch("deploy_lib.config.QtDependencyReader.find_plugin_dependencies")
@@ -0,0 +1,173 @@
+# Copyright (C) 2024 The Qt Company Ltd.
+# SPDX-License-Identifier: LicenseRef-Qt-Commercial OR LGPL-3.0-only OR GPL-2.0-only OR GPL-3.0-only
+from __future__ import annotations
+
+"""Test for the binary resources of pyside6-project and pyside6-deploy"""
+
+import importlib
+import importlib.util
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.append(os.fspath(Path(__file__).resolve().parents[2]))
+from init_paths import init_test_paths  # noqa: E402
+init_test_paths(False)
+
+from PySide6.QtCore import QFile, QIODevice  # noqa: E402
+
+QRC_CONTENTS = """<!DOCTYPE RCC><RCC version="1.0">
+<qresource prefix="/binary_resources_test">
+    <file>data.txt</file>
+</qresource>
+</RCC>
+"""
+
+
+class ProjectTestBase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.pyside_root = Path(__file__).parents[5].resolve()
+        tools_path = cls.pyside_root / "sources" / "pyside-tools"
+        if os.fspath(tools_path) not in sys.path:
+            sys.path.append(os.fspath(tools_path))
+        cls.project_lib = importlib.import_module("project")
+        cls.deploy_lib = importlib.import_module("deploy_lib")
+        # project.py is shadowed by the project package
+        spec = importlib.util.spec_from_file_location("pyside6_project", tools_path / "project.py")
+        cls.project_tool = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(cls.project_tool)
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp()).resolve()
+        (self.temp_dir / "main.py").write_text("import rc_resources\n", encoding="utf-8")
+        (self.temp_dir / "data.txt").write_text("binary resource data", encoding="utf-8")
+        (self.temp_dir / "resources.qrc").write_text(QRC_CONTENTS, encoding="utf-8")
+        self.project_file = self.temp_dir / "app.pyproject"
+        self.project_file.write_text(json.dumps({"files": ["main.py", "resources.qrc"]}),
+                                     encoding="utf-8")
+        self.rcc_file = self.temp_dir / "resources.rcc"
+        self.py_file = self.temp_dir / "rc_resources.py"
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+        self.project_lib.Singleton._instances.pop(self.project_lib.ClOptions, None)
+        super().tearDown()
+
+    def _project(self, binary_resources: bool):
+        """Return a project with fresh command line options (ClOptions is a singleton)."""
+        self.project_lib.Singleton._instances.pop(self.project_lib.ClOptions, None)
+        self.project_lib.ClOptions(dry_run=False, quiet=True, force=False, qml_module=False,
+                                   binary_resources=binary_resources)
+        return self.project_tool.Project(self.project_file)
+
+
+class TestPySide6ProjectBinaryResources(ProjectTestBase):
+
+    def testLoaderModule(self):
+        self._project(binary_resources=True).build()
+        self.assertTrue(self.rcc_file.is_file())
+        self.assertIn("QResource.registerResource", self.py_file.read_text(encoding="utf-8"))
+
+        spec = importlib.util.spec_from_file_location("rc_resources", self.py_file)
+        rc_resources = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(rc_resources)
+        try:
+            file = QFile(":/binary_resources_test/data.txt")
+            self.assertTrue(file.open(QIODevice.OpenModeFlag.ReadOnly))
+            self.assertEqual(bytes(file.readAll()), b"binary resource data")
+            file.close()
+        finally:
+            rc_resources.qCleanupResources()
+        self.assertFalse(QFile.exists(":/binary_resources_test/data.txt"))
+
+    def testRebuildOnOptionSwitch(self):
+        self._project(binary_resources=False).build()
+        self.assertFalse(self.rcc_file.exists())
+        self.assertIn("qt_resource_data", self.py_file.read_text(encoding="utf-8"))
+
+        # The recorded rcc command changed, so the resources are rebuilt.
+        self._project(binary_resources=True).build()
+        self.assertTrue(self.rcc_file.is_file())
+        self.assertNotIn("qt_resource_data", self.py_file.read_text(encoding="utf-8"))
+
+        # The stale binary resource file is removed, so that it is not deployed.
+        self._project(binary_resources=False).build()
+        self.assertIn("qt_resource_data", self.py_file.read_text(encoding="utf-8"))
+        self.assertFalse(self.rcc_file.exists())
+
+    def testClean(self):
+        # The binary resource file is removed, also when cleaning without the option.
+        for clean_binary_resources in (True, False):
+            self._project(binary_resources=True).build()
+            self.assertTrue(self.rcc_file.is_file())
+            self._project(binary_resources=clean_binary_resources).clean()
+            self.assertFalse(self.rcc_file.exists())
+            self.assertFalse(self.py_file.exists())
+
+
+class TestPySide6DeployBinaryResources(ProjectTestBase):
+
+    def testNuitkaDataFiles(self):
+        self._project(binary_resources=True).build()
+        sub_dir = self.temp_dir / "sub"
+        sub_dir.mkdir()
+        sub_rcc_file = sub_dir / "other.rcc"
+        sub_rcc_file.write_bytes(b"")
+        # Outside of the directory of the main file, the files are placed relative to the
+        # project directory. Files outside of the project directory are skipped.
+        src_dir = self.temp_dir / "src"
+        src_dir.mkdir()
+        (src_dir / "main.py").write_text("", encoding="utf-8")
+        outside_rcc_file = self.temp_dir.parent / f"{self.temp_dir.name}.rcc"
+        outside_rcc_file.write_bytes(b"")
+        self.addCleanup(outside_rcc_file.unlink)
+
+        nuitka = self.deploy_lib.Nuitka(nuitka=[sys.executable, "-m", "nuitka"])
+        for source_file in (self.temp_dir / "main.py", src_dir / "main.py"):
+            with mock.patch("sys.stdout"), self.assertLogs(level="WARNING") as logs:
+                command = nuitka.create_executable(
+                    source_file=source_file, extra_args="", qml_files=[],
+                    qt_plugins=[], excluded_qml_plugins=[], icon="icon", dry_run=True,
+                    permissions=[], mode=self.deploy_lib.DesktopConfig.NuitkaMode.ONEFILE,
+                    resource_files=[self.rcc_file, sub_rcc_file, outside_rcc_file],
+                    project_dir=self.temp_dir)
+            self.assertIn(f"--include-data-files={self.rcc_file}=./resources.rcc", command)
+            self.assertIn(f"--include-data-files={sub_rcc_file}=./sub/other.rcc", command)
+            self.assertNotIn(os.fspath(outside_rcc_file), command)
+            self.assertIn(os.fspath(outside_rcc_file), logs.output[0])
+
+    def testFindResourceFiles(self):
+        # Without a project file, the .rcc files of the project directory are found, skipping
+        # the ignored directories like virtual environments.
+        self._project(binary_resources=True).build()
+        for ignored in (Path(".venv"), Path("venv") / "lib" / "site-packages", Path("build"),
+                        Path("skipped")):
+            (self.temp_dir / ignored).mkdir(parents=True)
+            (self.temp_dir / ignored / "ignored.rcc").write_bytes(b"")
+        config = self.deploy_lib.Config.__new__(self.deploy_lib.Config)
+        config.project_data = None
+        config._project_dir = self.temp_dir
+        config.extra_ignore_dirs = ["skipped"]
+
+        walked = []
+        os_walk = os.walk
+
+        def walk(top):
+            for root, dirs, files in os_walk(top):
+                walked.append(Path(root))
+                yield root, dirs, files
+
+        with mock.patch("deploy_lib.config.os.walk", walk):
+            self.assertEqual(config._find_resource_files(), [self.rcc_file])
+        self.assertEqual(walked, [self.temp_dir, self.temp_dir / "venv",
+                                  self.temp_dir / "venv" / "lib"])
+
+
+if __name__ == "__main__":
+    unittest.main()
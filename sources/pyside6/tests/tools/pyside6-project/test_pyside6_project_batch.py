@@ -0,0 +1,118 @@
+# Copyright (C) 2024 The Qt Company Ltd.
+# SPDX-License-Identifier: LicenseRef-Qt-Commercial OR LGPL-3.0-only OR GPL-2.0-only OR GPL-3.0-only
+from __future__ import annotations
+
+"""Test for the batch API for compiling forms and resources used by pyside6-project"""
+
+import importlib
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.append(os.fspath(Path(__file__).resolve().parents[2]))
+from init_paths import init_test_paths  # noqa: E402
+init_test_paths(False)
+
+UI_CONTENTS = """<?xml version="1.0" encoding="UTF-8"?>
+<ui version="4.0">
+ <class>{name}</class>
+ <widget class="QWidget" name="{name}">
+  <widget class="QLabel" name="label">
+   <property name="text">
+    <string>{name} label</string>
+   </property>
+  </widget>
+ </widget>
+ <resources/>
+ <connections/>
+</ui>
+"""
+
+QRC_CONTENTS = """<!DOCTYPE RCC><RCC version="1.0">
+<qresource prefix="/{name}">
+    <file>data.txt</file>
+</qresource>
+</RCC>
+"""
+
+
+class TestPySideToolBatch(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        tools_path = Path(__file__).parents[5].resolve() / "sources" / "pyside-tools"
+        if os.fspath(tools_path) not in sys.path:
+            sys.path.append(os.fspath(tools_path))
+        cls.pyside_tool = importlib.import_module("pyside_tool")
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp()).resolve()
+        (self.temp_dir / "data.txt").write_text("batch resource data", encoding="utf-8")
+        self.ui_files = []
+        self.qrc_files = []
+        for name in ("first", "second", "third"):
+            ui_file = self.temp_dir / f"{name}.ui"
+            ui_file.write_text(UI_CONTENTS.format(name=name), encoding="utf-8")
+            self.ui_files.append(ui_file)
+            qrc_file = self.temp_dir / f"{name}.qrc"
+            qrc_file.write_text(QRC_CONTENTS.format(name=name), encoding="utf-8")
+            self.qrc_files.append(qrc_file)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+        super().tearDown()
+
+    def testCompileUiFiles(self):
+        for jobs in (1, 2):
+            result = self.pyside_tool.compile_ui_files(self.ui_files, jobs=jobs)
+            self.assertEqual(result, {ui_file: 0 for ui_file in self.ui_files})
+            for ui_file in self.ui_files:
+                py_file = ui_file.parent / f"ui_{ui_file.stem}.py"
+                code = py_file.read_text(encoding="utf-8")
+                self.assertIn(f"class Ui_{ui_file.stem}(object):", code)
+                py_file.unlink()
+
+        # Output files can be specified by a dict
+        output = self.temp_dir / "form.py"
+        result = self.pyside_tool.compile_ui_files({self.ui_files[0]: output})
+        self.assertEqual(result, {self.ui_files[0]: 0})
+        self.assertIn("class Ui_first(object):", output.read_text(encoding="utf-8"))
+
+    def testCompileResourceFiles(self):
+        result = self.pyside_tool.compile_resource_files(self.qrc_files, jobs=2)
+        self.assertEqual(result, {qrc_file: 0 for qrc_file in self.qrc_files})
+        for qrc_file in self.qrc_files:
+            code = (qrc_file.parent / f"rc_{qrc_file.stem}.py").read_text(encoding="utf-8")
+            self.assertIn("def qInitResources():", code)
+
+    def testCompileBinaryResourceFiles(self):
+        result = self.pyside_tool.compile_resource_files(self.qrc_files, jobs=2, binary=True)
+        self.assertEqual(result, {qrc_file: 0 for qrc_file in self.qrc_files})
+        for qrc_file in self.qrc_files:
+            rcc_file = qrc_file.with_suffix(".rcc")
+            self.assertEqual(rcc_file.read_bytes()[:4], b"qres")
+            self.assertFalse((qrc_file.parent / f"rc_{qrc_file.stem}.py").exists())
+
+    def testFailure(self):
+        # A failing file yields a non-zero exit code without affecting the others.
+        self.ui_files[1].write_text("<ui", encoding="utf-8")
+        self.qrc_files[1].write_text(QRC_CONTENTS.replace("data.txt", "missing.txt"),
+                                     encoding="utf-8")
+        ui_result = self.pyside_tool.compile_ui_files(self.ui_files, jobs=2)
+        qrc_result = self.pyside_tool.compile_resource_files(self.qrc_files, jobs=2)
+        for result, files in ((ui_result, self.ui_files), (qrc_result, self.qrc_files)):
+            self.assertEqual(result[files[0]], 0)
+            self.assertNotEqual(result[files[1]], 0)
+            self.assertEqual(result[files[2]], 0)
+
+    def testRunToolCommands(self):
+        commands = [[sys.executable, "-c", f"import sys; sys.exit({code})"]
+                    for code in (0, 3, 0, 5)]
+        for jobs in (1, 4):
+            self.assertEqual(self.pyside_tool.run_tool_commands(commands, jobs), [0, 3, 0, 5])
+
+
+if __name__ == "__main__":
+    unittest.main()
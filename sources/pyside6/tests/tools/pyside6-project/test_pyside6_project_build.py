@@ -0,0 +1,177 @@
+# Copyright (C) 2024 The Qt Company Ltd.
+# SPDX-License-Identifier: LicenseRef-Qt-Commercial OR LGPL-3.0-only OR GPL-2.0-only OR GPL-3.0-only
+from __future__ import annotations
+
+"""Test for the build graph and the build database of pyside6-project"""
+
+import importlib
+import importlib.util
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+sys.path.append(os.fspath(Path(__file__).resolve().parents[2]))
+from init_paths import init_test_paths  # noqa: E402
+init_test_paths(False)
+
+QRC_CONTENTS = """<!DOCTYPE RCC><RCC version="1.0">
+<qresource prefix="/i18n">
+    <file>app_de.qm</file>
+</qresource>
+</RCC>
+"""
+
+
+class ProjectBuildTestBase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        tools_path = Path(__file__).parents[5].resolve() / "sources" / "pyside-tools"
+        if os.fspath(tools_path) not in sys.path:
+            sys.path.append(os.fspath(tools_path))
+        cls.project_lib = importlib.import_module("project")
+        # project.py is shadowed by the project package
+        spec = importlib.util.spec_from_file_location("pyside6_project", tools_path / "project.py")
+        cls.project_tool = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(cls.project_tool)
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp()).resolve()
+        for name in ("main.py", "form.ui", "app_de.ts"):
+            (self.temp_dir / name).write_text("", encoding="utf-8")
+        (self.temp_dir / "i18n.qrc").write_text(QRC_CONTENTS, encoding="utf-8")
+        self.project_file = self.temp_dir / "app.pyproject"
+        files = ["main.py", "form.ui", "app_de.ts", "i18n.qrc"]
+        self.project_file.write_text(json.dumps({"files": files}), encoding="utf-8")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+        self.project_lib.Singleton._instances.pop(self.project_lib.ClOptions, None)
+        super().tearDown()
+
+
+class TestPySide6ProjectBuildGraph(ProjectBuildTestBase):
+
+    def _build_steps(self):
+        """Return the build steps by source file name."""
+        self.project_lib.Singleton._instances.pop(self.project_lib.ClOptions, None)
+        self.project_lib.ClOptions(dry_run=True, quiet=True, force=False, qml_module=False)
+        steps = self.project_tool.Project(self.project_file)._build_steps([])
+        return {step.source.name: step for step in steps}
+
+    def testQrcDependsOnTranslation(self):
+        steps = self._build_steps()
+        self.assertEqual(sorted(steps.keys()), ["app_de.ts", "form.ui", "i18n.qrc"])
+        # The .qrc file lists the .qm file built from the .ts file.
+        self.assertEqual(steps["i18n.qrc"].dependencies, [steps["app_de.ts"]])
+        self.assertEqual(steps["form.ui"].dependencies, [])
+        self.assertEqual(steps["app_de.ts"].dependencies, [])
+
+    def testUnreadableQrc(self):
+        # When the files listed in a .qrc file cannot be determined, it is built
+        # after all other steps.
+        (self.temp_dir / "i18n.qrc").write_text("<RCC", encoding="utf-8")
+        steps = self._build_steps()
+        self.assertCountEqual(steps["i18n.qrc"].dependencies,
+                              [steps["form.ui"], steps["app_de.ts"]])
+
+    def _diamond(self, log: list[str]):
+        """Return the steps of a graph a -> (b, c) -> d."""
+        BuildStep = self.project_lib.BuildStep
+        lock = threading.Lock()
+
+        def action(name):
+            def append():
+                with lock:
+                    log.append(name)
+            return append
+
+        a = BuildStep(Path("a"), action("a"))
+        b = BuildStep(Path("b"), action("b"), [a])
+        c = BuildStep(Path("c"), action("c"), [a])
+        d = BuildStep(Path("d"), action("d"), [b, c])
+        return [d, c, b, a]
+
+    def testRunBuildSteps(self):
+        for jobs in (1, 4):
+            log: list[str] = []
+            self.project_lib.run_build_steps(self._diamond(log), jobs)
+            self.assertEqual(len(log), 4)
+            self.assertEqual(log[0], "a")
+            self.assertEqual(set(log[1:3]), {"b", "c"})
+            self.assertEqual(log[3], "d")
+
+    def testRunBuildStepsFailure(self):
+        # A failing tool exits, the steps depending on it are not run.
+        log: list[str] = []
+        steps = self._diamond(log)
+        d, c, b, a = steps
+
+        def fail():
+            raise SystemExit(1)
+
+        b.action = fail
+        with self.assertRaises(SystemExit):
+            self.project_lib.run_build_steps(steps, 4)
+        self.assertNotIn("d", log)
+
+
+class TestPySide6ProjectBuildDatabase(ProjectBuildTestBase):
+
+    def setUp(self):
+        super().setUp()
+        self.images_dir = self.temp_dir / "images"
+        (self.images_dir / "sub").mkdir(parents=True)
+        (self.images_dir / "a.txt").write_text("a", encoding="utf-8")
+        (self.images_dir / "sub" / "b.txt").write_text("b", encoding="utf-8")
+        self.qrc_file = self.temp_dir / "images.qrc"
+        self.qrc_file.write_text(QRC_CONTENTS.replace("app_de.qm", "images"), encoding="utf-8")
+        self.project_file.write_text(json.dumps({"files": ["main.py", "images.qrc"]}),
+                                     encoding="utf-8")
+
+    def _requires_rebuild(self) -> bool:
+        """Check whether the resources need to be rebuilt as a new invocation would."""
+        project = self.project_tool.Project(self.project_file)
+        artifacts, command = project._get_artifacts(self.qrc_file)
+        return project._build_database.requires_rebuild(self.qrc_file, artifacts, command,
+                                                        project._build_inputs(self.qrc_file))
+
+    def testQrcDirectory(self):
+        # Listed directories are expanded like rcc does.
+        self.assertEqual(self.project_lib.qrc_file_list(self.qrc_file),
+                         [self.images_dir / "a.txt", self.images_dir / "sub" / "b.txt"])
+
+        self.project_lib.Singleton._instances.pop(self.project_lib.ClOptions, None)
+        self.project_lib.ClOptions(dry_run=False, quiet=True, force=False, qml_module=False)
+        self.project_tool.Project(self.project_file).build()
+        self.assertTrue((self.temp_dir / "rc_images.py").is_file())
+        self.assertFalse(self._requires_rebuild())
+
+        # Touching a file does not cause a rebuild, changing its contents does.
+        os.utime(self.images_dir / "a.txt", ns=(1, 1))
+        self.assertFalse(self._requires_rebuild())
+        (self.images_dir / "sub" / "b.txt").write_text("c", encoding="utf-8")
+        self.assertTrue(self._requires_rebuild())
+
+        self.project_tool.Project(self.project_file).build()
+        self.assertFalse(self._requires_rebuild())
+        (self.images_dir / "c.txt").write_text("c", encoding="utf-8")
+        self.assertTrue(self._requires_rebuild())
+
+    def testUnreadableInput(self):
+        # An input that cannot be hashed causes a rebuild instead of an error.
+        database = self.project_lib.BuildDatabase(self.project_file)
+        artifact = self.temp_dir / "rc_images.py"
+        artifact.write_text("", encoding="utf-8")
+        command = ["rcc", os.fspath(self.qrc_file)]
+        inputs = [self.qrc_file, self.images_dir]
+        database.record(self.qrc_file, [artifact], command, inputs)
+        self.assertTrue(database.requires_rebuild(self.qrc_file, [artifact], command, inputs))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+# Copyright (C) 2024 The Qt Company Ltd.
+# SPDX-License-Identifier: LicenseRef-Qt-Commercial OR LGPL-3.0-only OR GPL-2.0-only OR GPL-3.0-only
+from __future__ import annotations
+
+"""Test for the watch mode of pyside6-project"""
+
+import importlib
+import importlib.util
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.append(os.fspath(Path(__file__).resolve().parents[2]))
+from init_paths import init_test_paths  # noqa: E402
+init_test_paths(False)
+
+from PySide6.QtCore import QCoreApplication, QDeadlineTimer, QProcess  # noqa: E402
+
+QRC_CONTENTS = """<!DOCTYPE RCC><RCC version="1.0">
+<qresource prefix="/watch_test">
+    <file>data.txt</file>
+</qresource>
+</RCC>
+"""
+
+TIMEOUT_MS = 10000
+
+
+def process_events_until(condition) -> bool:
+    """Process events until condition() is met or the timeout expires."""
+    deadline = QDeadlineTimer(TIMEOUT_MS)
+    while not condition():
+        if deadline.hasExpired():
+            return False
+        QCoreApplication.processEvents()
+        time.sleep(0.01)
+    return True
+
+
+class ProjectWatchTestBase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        tools_path = Path(__file__).parents[5].resolve() / "sources" / "pyside-tools"
+        if os.fspath(tools_path) not in sys.path:
+            sys.path.append(os.fspath(tools_path))
+        cls.project_lib = importlib.import_module("project")
+        cls.watcher = importlib.import_module("project.watcher")
+        # project.py is shadowed by the project package
+        spec = importlib.util.spec_from_file_location("pyside6_project", tools_path / "project.py")
+        cls.project_tool = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(cls.project_tool)
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp()).resolve()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+        self.project_lib.Singleton._instances.pop(self.project_lib.ClOptions, None)
+        super().tearDown()
+
+
+class TestPySide6ProjectFileWatcher(ProjectWatchTestBase):
+
+    def testFileWatcher(self):
+        data_file = self.temp_dir / "data.txt"
+        data_file.write_text("a", encoding="utf-8")
+        changes: list[set[Path]] = []
+        watcher = self.watcher.FileWatcher([data_file], changes.append)  # noqa: F841
+
+        data_file.write_text("b", encoding="utf-8")
+        self.assertTrue(process_events_until(lambda: changes))
+        self.assertEqual(changes, [{data_file}])
+
+        # Editors saving by renaming replace the file, which is noticed by
+        # watching the directory.
+        replacement = self.temp_dir / "data.txt.tmp"
+        replacement.write_text("c", encoding="utf-8")
+        os.replace(replacement, data_file)
+        self.assertTrue(process_events_until(lambda: len(changes) == 2))
+        self.assertEqual(changes[1], {data_file})
+
+    def testRestartableProcess(self):
+        command = [sys.executable, "-c", "import time; time.sleep(60)"]
+        process = self.watcher.RestartableProcess(command, self.temp_dir)
+        qprocess = process._process
+        try:
+            with mock.patch("builtins.print"):
+                process.restart()
+                self.assertTrue(qprocess.waitForStarted())
+                first_pid = qprocess.processId()
+                # Restarting terminates the running child and starts a new one
+                process.restart()
+                self.assertTrue(qprocess.waitForStarted())
+            self.assertNotEqual(qprocess.processId(), first_pid)
+            self.assertEqual(qprocess.state(), QProcess.ProcessState.Running)
+            if sys.platform != "win32":
+                with self.assertRaises(ProcessLookupError):
+                    os.kill(first_pid, 0)
+        finally:
+            qprocess.kill()
+            qprocess.waitForFinished()
+
+
+class TestPySide6ProjectWatch(ProjectWatchTestBase):
+
+    def setUp(self):
+        super().setUp()
+        (self.temp_dir / "main.py").write_text("import rc_resources\n", encoding="utf-8")
+        self.data_file = self.temp_dir / "data.txt"
+        self.data_file.write_text("watch data before", encoding="utf-8")
+        (self.temp_dir / "resources.qrc").write_text(QRC_CONTENTS, encoding="utf-8")
+        self.project_file = self.temp_dir / "app.pyproject"
+        self.project_file.write_text(json.dumps({"files": ["main.py", "resources.qrc"]}),
+                                     encoding="utf-8")
+        self.py_file = self.temp_dir / "rc_resources.py"
+
+    def testRebuildOnChange(self):
+        self.project_lib.ClOptions(dry_run=False, quiet=True, force=False, qml_module=False)
+        project = self.project_tool.Project(self.project_file)
+        rebuilt = []
+
+        def exec_(watcher):
+            # Instead of running until interrupted, change a file listed in
+            # the .qrc file and wait for the resources to be rebuilt.
+            built = self.py_file.read_bytes()
+            self.data_file.write_text("watch data after", encoding="utf-8")
+            rebuilt.append(process_events_until(lambda: self.py_file.read_bytes() != built))
+            return 0
+
+        with mock.patch.object(self.watcher.FileWatcher, "exec", exec_):
+            project.watch()
+        self.assertEqual(rebuilt, [True])
+
+
+if __name__ == "__main__":
+    unittest.main()
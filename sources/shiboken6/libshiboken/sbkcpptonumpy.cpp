@@ -7,19 +7,39 @@ namespace Shiboken::Numpy {
 
 #ifdef HAVE_NUMPY
 
-// Helper to create a 1-dimensional numpy array
+// Helper to create a numpy array of 1 or 2 dimensions from row-major data
 template <class Type>
-static PyObject *_createArray1(Py_ssize_t size, int numpyType, const Type *data)
+static PyObject *_createArray(int nd, const npy_intp *dims, int numpyType, const Type *data)
 {
-    const npy_intp dims[1] = {size};
-    PyObject *result = PyArray_EMPTY(1, dims, numpyType, 0);
+    if (!initNumPy()) {
+        PyErr_SetString(PyExc_ImportError, "numpy could not be imported.");
+        return nullptr;
+    }
+    PyObject *result = PyArray_EMPTY(nd, dims, numpyType, 0);
+    if (result == nullptr)
+        return nullptr;
     auto *array = reinterpret_cast<PyArrayObject *>(result);
     auto *rawTargetData = PyArray_DATA(array);
     auto *targetData = reinterpret_cast<Type *>(rawTargetData);
-    std::copy(data, data + size, targetData);
+    std::copy(data, data + PyArray_SIZE(array), targetData);
     return result;
 }
 
+template <class Type>
+static PyObject *_createArray1(Py_ssize_t size, int numpyType, const Type *data)
+{
+    const npy_intp dims[1] = {size};
+    return _createArray(1, dims, numpyType, data);
+}
+
+template <class Type>
+static PyObject *_createArray2(Py_ssize_t rows, Py_ssize_t columns, int numpyType,
+                               const Type *data)
+{
+    const npy_intp dims[2] = {rows, columns};
+    return _createArray(2, dims, numpyType, data);
+}
+
 PyObject *createByteArray1(Py_ssize_t size, const uint8_t *data)
 {
     return _createArray1(size, NPY_BYTE, data);
@@ -40,6 +60,91 @@ PyObject *createIntArray1(Py_ssize_t size, const int *data)
     return _createArray1(size, NPY_INT, data);
 }
 
+PyObject *createDoubleArray2(Py_ssize_t rows, Py_ssize_t columns, const double *data)
+{
+    return _createArray2(rows, columns, NPY_DOUBLE, data);
+}
+
+PyObject *createFloatArray2(Py_ssize_t rows, Py_ssize_t columns, const float *data)
+{
+    return _createArray2(rows, columns, NPY_FLOAT, data);
+}
+
+PyObject *createEmptyFloatArray2(Py_ssize_t rows, Py_ssize_t columns, float **data)
+{
+    *data = nullptr;
+    if (!initNumPy()) {
+        PyErr_SetString(PyExc_ImportError, "numpy could not be imported.");
+        return nullptr;
+    }
+    const npy_intp dims[2] = {rows, columns};
+    PyObject *result = PyArray_EMPTY(2, dims, NPY_FLOAT, 0);
+    if (result == nullptr)
+        return nullptr;
+    auto *array = reinterpret_cast<PyArrayObject *>(result);
+    *data = reinterpret_cast<float *>(PyArray_DATA(array));
+    return result;
+}
+
+static int numpyType(StridedView::Type type)
+{
+    switch (type) {
+    case StridedView::UInt8:
+        return NPY_UBYTE;
+    case StridedView::UInt16:
+        return NPY_USHORT;
+    case StridedView::UInt32:
+        return NPY_UINT32;
+    case StridedView::Float16:
+        return NPY_HALF;
+    case StridedView::Float32:
+        break;
+    case StridedView::Int8:
+        return NPY_BYTE;
+    case StridedView::Int16:
+        return NPY_SHORT;
+    case StridedView::Int32:
+        return NPY_INT32;
+    case StridedView::Int64:
+        return NPY_INT64;
+    case StridedView::UInt64:
+        return NPY_UINT64;
+    case StridedView::Float64:
+        return NPY_DOUBLE;
+    }
+    return NPY_FLOAT;
+}
+
+PyObject *createArrayView(const StridedView &view, PyObject *base)
+{
+    if (!initNumPy()) {
+        Py_DECREF(base);
+        PyErr_SetString(PyExc_ImportError, "numpy could not be imported.");
+        return nullptr;
+    }
+    npy_intp dims[3];
+    npy_intp strides[3];
+    for (int d = 0; d < view.ndim; ++d) {
+        dims[d] = view.dimensions[d];
+        strides[d] = view.stride[d];
+    }
+    int flags = NPY_ARRAY_ALIGNED;
+    if (view.writable)
+        flags |= NPY_ARRAY_WRITEABLE;
+    PyObject *result = PyArray_New(&PyArray_Type, view.ndim, dims, numpyType(view.type),
+                                   strides, view.data, int(view.itemSize()), flags, nullptr);
+    if (result == nullptr) {
+        Py_DECREF(base);
+        return nullptr;
+    }
+    // Steals the reference to base, also on failure
+    if (PyArray_SetBaseObject(reinterpret_cast<PyArrayObject *>(result), base) < 0) {
+        Py_DECREF(result);
+        return nullptr;
+    }
+    return result;
+}
+
 #else // HAVE_NUMPY
 
 PyObject *createByteArray1(Py_ssize_t, const uint8_t *)
@@ -62,6 +167,29 @@ PyObject *createIntArray1(Py_ssize_t, const int *)
     Py_RETURN_NONE;
 }
 
+PyObject *createDoubleArray2(Py_ssize_t, Py_ssize_t, const double *)
+{
+    Py_RETURN_NONE;
+}
+
+PyObject *createFloatArray2(Py_ssize_t, Py_ssize_t, const float *)
+{
+    Py_RETURN_NONE;
+}
+
+PyObject *createEmptyFloatArray2(Py_ssize_t, Py_ssize_t, float **data)
+{
+    *data = nullptr;
+    Py_RETURN_NONE;
+}
+
+PyObject *createArrayView(const StridedView &, PyObject *base)
+{
+    Py_DECREF(base);
+    PyErr_SetString(PyExc_ImportError, "PySide was built without numpy support.");
+    return nullptr;
+}
+
 #endif // !HAVE_NUMPY
 
 } //namespace Shiboken::Numpy
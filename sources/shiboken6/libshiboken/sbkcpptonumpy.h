@@ -12,6 +12,8 @@
 namespace Shiboken::Numpy
 {
 
+struct StridedView;
+
 /// Create a one-dimensional numpy array of type uint8/NPY_BYTE
 /// \param size Size
 /// \param data Data
@@ -36,6 +38,44 @@ LIBSHIBOKEN_API PyObject *createFloatArray1(Py_ssize_t size, const float *data);
 /// \return PyArrayObject
 LIBSHIBOKEN_API PyObject *createIntArray1(Py_ssize_t size, const int *data);
 
+/// Create a two-dimensional numpy array of type double/NPY_DOUBLE from
+/// row-major data
+/// \param rows Number of rows
+/// \param columns Number of columns
+/// \param data Data
+/// \return PyArrayObject, nullptr with an exception set or None
+///         when built without numpy support
+LIBSHIBOKEN_API PyObject *createDoubleArray2(Py_ssize_t rows, Py_ssize_t columns,
+                                             const double *data);
+
+/// Create a two-dimensional numpy array of type float/NPY_FLOAT from
+/// row-major data
+/// \param rows Number of rows
+/// \param columns Number of columns
+/// \param data Data
+/// \return PyArrayObject, nullptr with an exception set or None
+///         when built without numpy support
+LIBSHIBOKEN_API PyObject *createFloatArray2(Py_ssize_t rows, Py_ssize_t columns,
+                                            const float *data);
+
+/// Create an uninitialized two-dimensional numpy array of type
+/// float/NPY_FLOAT to be filled with row-major data
+/// \param rows Number of rows
+/// \param columns Number of columns
+/// \param data Receives the data of the array, nullptr if no array was created
+/// \return PyArrayObject, nullptr with an exception set or None
+///         when built without numpy support
+LIBSHIBOKEN_API PyObject *createEmptyFloatArray2(Py_ssize_t rows, Py_ssize_t columns,
+                                                 float **data);
+
+/// Create a numpy array sharing the memory described by a strided view
+/// without copying it. The array keeps \a base alive, which is expected to
+/// own the memory.
+/// \param view View (up to 3 dimensions)
+/// \param base Owner of the data, reference is stolen
+/// \return PyArrayObject or nullptr with an exception set
+LIBSHIBOKEN_API PyObject *createArrayView(const StridedView &view, PyObject *base);
+
 } //namespace Shiboken::Numpy
 
 #endif // SBKCPPTONUMPY_H
@@ -304,7 +304,10 @@ static PyTypeObject *createEnumForPython(PyObject *scopeOrModule,
     const char *dot = strrchr(qual, '.');
     AutoDecRef name(Shiboken::String::fromCString(dot ? dot + 1 : qual));
 
-    static PyObject *enumName = String::createStaticString("IntEnum");
+    // Note: enumName must not be static, it would keep the type of the
+    // previous enum for global enums.
+    static PyObject *const intEnumName = String::createStaticString("IntEnum");
+    PyObject *enumName = intEnumName;
     if (PyType_Check(scopeOrModule)) {
         // For global objects, we have no good solution, yet where to put the int info.
         auto type = reinterpret_cast<PyTypeObject *>(scopeOrModule);
@@ -18,27 +18,28 @@ namespace Shiboken::Numpy
 {
 
 #ifdef HAVE_NUMPY
-static void initNumPy()
+// Returns whether numpy could be imported
+static bool initNumPy()
 {
     // PYSIDE-2404: Delay-initialize numpy from check() as it causes a
     // significant startup delay (~770 allocations in memray)
-    static bool initialized = false;
-    if (initialized)
-        return;
-    initialized = true;
-    // Expanded from macro "import_array" in __multiarray_api.h
-    // Make sure to read about the magic defines PY_ARRAY_UNIQUE_SYMBOL etc.,
-    // when changing this or spreading the code over several source files.
-    if (_import_array() < 0)
-        PyErr_Print();
+    static int initialized = -1;
+    if (initialized == -1) {
+        // Expanded from macro "import_array" in __multiarray_api.h
+        // Make sure to read about the magic defines PY_ARRAY_UNIQUE_SYMBOL etc.,
+        // when changing this or spreading the code over several source files.
+        initialized = _import_array() < 0 ? 0 : 1;
+        if (initialized == 0)
+            PyErr_Print();
+    }
+    return initialized == 1;
 }
 #endif // HAVE_NUMPY
 
 bool check(PyObject *pyIn)
 {
 #ifdef HAVE_NUMPY
-    initNumPy();
-    return PyArray_Check(pyIn);
+    return initNumPy() && PyArray_Check(pyIn);
 #else
     SBK_UNUSED(pyIn);
     return false;
@@ -84,6 +84,72 @@ View View::fromPyObject(PyObject *pyIn)
     return result;
 }
 
+static std::optional<StridedView::Type> stridedViewTypeFromNumPy(PyArrayObject *ar)
+{
+    const int npt = PyArray_TYPE(ar);
+    if (npt == NPY_HALF)
+        return StridedView::Float16;
+    if (npt == NPY_FLOAT)
+        return StridedView::Float32;
+    if (npt == NPY_DOUBLE)
+        return StridedView::Float64;
+    if (PyArray_ISUNSIGNED(ar) != 0) {
+        switch (PyArray_ITEMSIZE(ar)) {
+        case 1:
+            return StridedView::UInt8;
+        case 2:
+            return StridedView::UInt16;
+        case 4:
+            return StridedView::UInt32;
+        case 8:
+            return StridedView::UInt64;
+        default:
+            break;
+        }
+    } else if (PyArray_ISSIGNED(ar) != 0) {
+        switch (PyArray_ITEMSIZE(ar)) {
+        case 1:
+            return StridedView::Int8;
+        case 2:
+            return StridedView::Int16;
+        case 4:
+            return StridedView::Int32;
+        case 8:
+            return StridedView::Int64;
+        default:
+            break;
+        }
+    }
+    return {};
+}
+
+StridedView StridedView::fromPyObject(PyObject *pyIn)
+{
+    if (pyIn == nullptr || !check(pyIn))
+        return {};
+    auto *ar = reinterpret_cast<PyArrayObject *>(pyIn);
+    if (PyArray_ISALIGNED(ar) == 0 || PyArray_ISNOTSWAPPED(ar) == 0)
+        return {};
+    const int ndim = PyArray_NDIM(ar);
+    if (ndim < 1 || ndim > 3)
+        return {};
+
+    const auto typeO = stridedViewTypeFromNumPy(ar);
+    if (!typeO.has_value())
+        return {};
+
+    StridedView result;
+    result.ndim = ndim;
+    result.type = typeO.value();
+    result.data = PyArray_DATA(ar);
+    result.writable = PyArray_ISWRITEABLE(ar) != 0;
+    for (int d = 0; d < 3; ++d) {
+        result.dimensions[d] = d < ndim ? PyArray_DIMS(ar)[d] : 0;
+        result.stride[d] = d < ndim ? PyArray_STRIDES(ar)[d] : 0;
+    }
+    return result;
+}
+
 } // namespace Numpy
 
 template <class T>
@@ -219,6 +285,11 @@ View View::fromPyObject(PyObject *)
     return {};
 }
 
+StridedView StridedView::fromPyObject(PyObject *)
+{
+    return {};
+}
+
 std::ostream &operator<<(std::ostream &str, const debugPyArrayObject &)
 {
     str << "Unimplemented function " <<  __FUNCTION__ << ", (numpy was not found).";
@@ -262,4 +333,46 @@ std::ostream &operator<<(std::ostream &str, const View &v)
     return str;
 }
 
+Py_ssize_t StridedView::itemSize(Type type)
+{
+    switch (type) {
+    case UInt8:
+    case Int8:
+        return 1;
+    case UInt16:
+    case Int16:
+    case Float16:
+        return 2;
+    case UInt32:
+    case Int32:
+    case Float32:
+        break;
+    case UInt64:
+    case Int64:
+    case Float64:
+        return 8;
+    }
+    return 4;
+}
+
+std::ostream &operator<<(std::ostream &str, const StridedView &v)
+{
+    str << "Shiboken::Numpy::StridedView(";
+    if (v) {
+        str << "type=" << v.type << ", ndim=" << v.ndim << " [";
+        for (int d = 0; d < v.ndim; ++d)
+            str << (d ? ", " : "") << v.dimensions[d];
+        str << "], stride=[";
+        for (int d = 0; d < v.ndim; ++d)
+            str << (d ? ", " : "") << v.stride[d];
+        str << "], data=" << v.data;
+        if (!v.writable)
+            str << " [read-only]";
+    } else {
+        str << "invalid";
+    }
+    str << ')';
+    return str;
+}
+
 } //namespace Shiboken::Numpy
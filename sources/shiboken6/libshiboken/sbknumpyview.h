@@ -40,7 +40,32 @@ struct LIBSHIBOKEN_API View
     Type type = Int;
 };
 
+/// A view of an up to 3 dimensional array whose elements need not be
+/// contiguous (for example, images with padded rows). It is used to share
+/// memory between numpy and C++ without copying (see createArrayView()).
+struct LIBSHIBOKEN_API StridedView
+{
+    enum Type { UInt8, UInt16, UInt32, Float16, Float32,
+                Int8, Int16, Int32, Int64, UInt64, Float64 };
+
+    /// Create a view of an aligned numpy array in native byte order
+    static StridedView fromPyObject(PyObject *pyIn);
+
+    operator bool() const { return ndim > 0; }
+
+    static Py_ssize_t itemSize(Type type);
+    Py_ssize_t itemSize() const { return itemSize(type); }
+
+    int ndim = 0;
+    Py_ssize_t dimensions[3];
+    Py_ssize_t stride[3]; // in bytes
+    void *data = nullptr;
+    Type type = UInt8;
+    bool writable = false;
+};
+
 LIBSHIBOKEN_API std::ostream &operator<<(std::ostream &, const View &v);
+LIBSHIBOKEN_API std::ostream &operator<<(std::ostream &, const StridedView &v);
 
 } //namespace Shiboken::Numpy
 
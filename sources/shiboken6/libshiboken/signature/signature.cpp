@@ -669,20 +669,29 @@ static PyObject *adjustFuncName(const char *func_name)
     if (res.isNull())
         return nullptr;
 
-    // Run `eval` on the type string to get the object.
+    // Run `eval` on the type string to get the object. The result is cached,
+    // because argument errors can be frequent when they are caught.
     // PYSIDE-1710: If the eval does not work, return the given string.
-    AutoDecRef obtype(PyRun_String(_path, Py_eval_input, ns, ns));
-    if (obtype.isNull())
-        return String::fromCString(func_name);
+    static PyObject *evaluated_paths = PyDict_New();
+    AutoDecRef path(String::fromCString(_path));
+    PyObject *obtype = PyDict_GetItem(evaluated_paths, path);
+    if (obtype == nullptr) {
+        AutoDecRef evaluated(PyRun_String(_path, Py_eval_input, ns, ns));
+        if (evaluated.isNull())
+            return String::fromCString(func_name);
+        if (PyDict_SetItem(evaluated_paths, path, evaluated) < 0)
+            return nullptr;
+        obtype = evaluated.object();
+    }
 
-    if (PyModule_Check(obtype.object())) {
+    if (PyModule_Check(obtype)) {
         // This is a plain function. Return the unmangled name.
         return String::fromCString(func_name);
     }
     assert(PyType_Check(obtype));   // This was not true for __init__!
 
     // Find the feature flags
-    auto *type = reinterpret_cast<PyTypeObject *>(obtype.object());
+    auto *type = reinterpret_cast<PyTypeObject *>(obtype);
     AutoDecRef dict(PepType_GetDict(type));
     int id = currentSelectId(type);
     id = id < 0 ? 0 : id;   // if undefined, set to zero
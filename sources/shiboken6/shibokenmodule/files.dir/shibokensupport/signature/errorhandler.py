@@ -19,6 +19,11 @@ At the moment, it is unclear whether the information given is
 enough to produce a useful ValueError.
 
 This matter will be improved in a later version.
+
+Some programs catch these errors on purpose, for instance to try another
+type of argument. Therefore, the outcome of the signature matching is cached
+per function and argument types, and the list of supported signatures is
+formatted once per function.
 """
 
 import collections.abc
@@ -66,47 +71,78 @@ def matched_type(args, sigs):
     return None
 
 
-def seterror_argument(args, func_name, info):
-    func = None
-    try:
-        func = eval(func_name, namespace)
-    except Exception as e:
-        msg = f"Error evaluating `{func_name}`: {e}"
-        return type(e), msg
-    if info and type(info) is str:
-        err = TypeError
-        if info == "<":
-            msg = f"{func_name}(): not enough arguments"
-        elif info == "0":
-            msg = (f"{func_name}(): not enough arguments. "
-                   "Note: keyword arguments are only supported for optional parameters.")
-        elif info == ">":
-            msg = f"{func_name}(): too many arguments"
-        elif info.isalnum():
-            msg = f"{func_name}(): got multiple values for keyword argument '{info}'"
+# (function name, *argument types) -> (signatures, matched signature)
+_argument_cache = {}
+_ARGUMENT_CACHE_SIZE = 1000
+
+# function name -> the formatted list of its signatures
+_signature_text_cache = {}
+
+
+def _argument_cache_key(func_name, args):
+    key = [func_name]
+    for arg in args:
+        if isinstance(arg, (str, bytes)):
+            # All items of a string have the same type, only emptiness counts.
+            key.append((type(arg), not arg))
+        elif isinstance(arg, collections.abc.Iterable):
+            # The matching of other iterables depends on their items.
+            return None
         else:
-            msg = f"{func_name}(): {info}"
-            err = AttributeError
-        return err, msg
-    if isinstance(info, Exception):
-        # PYSIDE-2230: Python 3.12 seems to always do normalization.
-        err = type(info)
-        info = info.args[0]
-        msg = f"{func_name}(): {info}"
-        return err, msg
-    if info and type(info) is dict:
-        msg = f"{func_name}(): unsupported keyword '{tuple(info)[0]}'"
-        return AttributeError, msg
-    sigs = get_signature(func, "typeerror")
-    if not sigs:
-        msg = f"{func_name}({args}) is wrong (missing signature)"
-        return TypeError, msg
-    if type(sigs) != list:
-        sigs = [sigs]
+            key.append(type(arg))
+    return tuple(key)
+
+
+def seterror_argument(args, func_name, info):
     if type(args) != tuple:
         args = (args,)
-    # temp!
-    found = matched_type(args, sigs)
+    key = _argument_cache_key(func_name, args) if info is None else None
+    if key in _argument_cache:
+        sigs, found = _argument_cache[key]
+    else:
+        func = None
+        try:
+            func = eval(func_name, namespace)
+        except Exception as e:
+            msg = f"Error evaluating `{func_name}`: {e}"
+            return type(e), msg
+        if info and type(info) is str:
+            err = TypeError
+            if info == "<":
+                msg = f"{func_name}(): not enough arguments"
+            elif info == "0":
+                msg = (f"{func_name}(): not enough arguments. "
+                       "Note: keyword arguments are only supported for optional parameters.")
+            elif info == ">":
+                msg = f"{func_name}(): too many arguments"
+            elif info.isalnum():
+                msg = f"{func_name}(): got multiple values for keyword argument '{info}'"
+            else:
+                msg = f"{func_name}(): {info}"
+                err = AttributeError
+            return err, msg
+        if isinstance(info, Exception):
+            # PYSIDE-2230: Python 3.12 seems to always do normalization.
+            err = type(info)
+            info = info.args[0]
+            msg = f"{func_name}(): {info}"
+            return err, msg
+        if info and type(info) is dict:
+            msg = f"{func_name}(): unsupported keyword '{tuple(info)[0]}'"
+            return AttributeError, msg
+        sigs = get_signature(func, "typeerror")
+        if not sigs:
+            msg = f"{func_name}({args}) is wrong (missing signature)"
+            return TypeError, msg
+        if type(sigs) != list:
+            sigs = [sigs]
+        # temp!
+        found = matched_type(args, sigs)
+        if key is not None:
+            if len(_argument_cache) >= _ARGUMENT_CACHE_SIZE:
+                _argument_cache.clear()
+                _signature_text_cache.clear()
+            _argument_cache[key] = sigs, found
     if found:
         msg = dedent(f"""
             {func_name!r} called with wrong argument values:
@@ -116,13 +152,14 @@ def seterror_argument(args, func_name, info):
             """).strip()
         return ValueError, msg
     type_str = ", ".join(type(arg).__name__ for arg in args)
-    msg = dedent(f"""
-        {func_name!r} called with wrong argument types:
-          {func_name}({type_str})
-        Supported signatures:
-        """).strip()
-    for sig in sigs:
-        msg += f"\n  {func_name}{sig}"
+    sigs_text = _signature_text_cache.get(func_name)
+    if sigs_text is None:
+        sigs_text = "".join(f"\n  {func_name}{sig}" for sig in sigs)
+        if key is not None:
+            _signature_text_cache[func_name] = sigs_text
+    msg = (f"{func_name!r} called with wrong argument types:\n"
+           f"  {func_name}({type_str})\n"
+           f"Supported signatures:{sigs_text}")
     # We don't raise the error here, to avoid the loader in the traceback.
     return TypeError, msg
 
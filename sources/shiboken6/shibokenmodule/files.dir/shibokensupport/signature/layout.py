@@ -24,6 +24,7 @@ import typing
 from types import SimpleNamespace
 from textwrap import dedent
 from shibokensupport.signature.mapping import ellipsis
+from shibokensupport.signature.parser import materialize_props
 
 
 class SignatureLayout(SimpleNamespace):
@@ -296,6 +297,8 @@ def create_signature(props, key):
     if not props:
         # empty signatures string
         return
+    # Properties that pyside_type_init() created lazily are parsed now.
+    materialize_props(props)
     if isinstance(props["multi"], list):
         # multi sig: call recursively.
         res = list(create_signature(elem, key) for elem in props["multi"])
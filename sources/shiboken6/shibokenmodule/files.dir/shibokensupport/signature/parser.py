@@ -513,10 +513,95 @@ def fix_variables(props, line):
     props.defaults = tuple(defaults)
 
 
+"""
+Lazy signature properties
+
+A type like QWidget has hundreds of signature strings, but usually only the
+signatures of a few of its functions are ever asked for, for instance by
+help() or by the error message of a wrong call. With LAZY_SIGNATURES,
+pyside_type_init() does not parse the signature strings. It only builds an
+index that maps every function name to the range of its lines (the overloads
+of a function are adjacent), and returns placeholder properties that contain
+this range under the key _LAZY. layout.create_signature() parses the lines of
+a function by materialize_props() when its signature is created the first
+time, and fills the result into the placeholder in place.
+"""
+
+LAZY_SIGNATURES = True
+
+_LAZY = "_lazy"
+
+
+def _signature_name(line):
+    """
+    Return the short name and the multi-index of a signature line, without
+    parsing it. The name is the same as calculate_props() computes.
+    """
+    head = line[:line.index("(")].strip()
+    multi, _, funcname = head.rpartition(":")
+    name = funcname[funcname.rindex(".") + 1:]
+    if name in keyword.kwlist:
+        name += "_"
+    return name, int(multi) if multi else None
+
+
+def build_signature_index(sig_strings):
+    """
+    Build a dict that maps every function name of a type to the range of its
+    lines in sig_strings.
+    """
+    index = {}
+    start = 0
+    for idx, line in enumerate(sig_strings):
+        name, multi = _signature_name(line)
+        if multi:
+            # more overloads of this function follow
+            continue
+        index[name] = start, idx + 1
+        start = idx + 1
+    return index
+
+
+def _lazy_type_props(sig_strings):
+    return {name: {_LAZY: (sig_strings, start, stop)}
+            for name, (start, stop) in build_signature_index(sig_strings).items()}
+
+
+def materialize_props(props):
+    """
+    Parse the lines of placeholder properties and fill them in.
+
+    For the snake_case variant of a name, the C++ side copies the properties
+    and sets their "name" field, which then replaces the parsed name.
+    """
+    lazy = props.get(_LAZY)
+    if lazy is None:
+        return props
+    update_mapping()
+    sig_strings, start, stop = lazy
+    (parsed,) = _calculate_type_props(sig_strings[start:stop]).values()
+    name = props.get("name")
+    props.update(parsed)
+    del props[_LAZY]
+    if name is not None:
+        if isinstance(props["multi"], list):
+            del props["name"]
+            props["multi"] = [dict(elem, name=name) for elem in props["multi"]]
+        else:
+            props["name"] = name
+    return props
+
+
 def pyside_type_init(type_key, sig_strings):
     dprint()
     dprint(f"Initialization of type key '{type_key}'")
     update_mapping()
+    if LAZY_SIGNATURES:
+        return _lazy_type_props(sig_strings)
+    return _calculate_type_props(sig_strings)
+
+
+def _calculate_type_props(sig_strings):
     ret = {}
     multi_props = []
     for line in sig_strings:
@@ -116,6 +116,54 @@ class VirtualMethodsTest(unittest.TestCase):
         self.assertTrue(eevd.grand_grand_daughter_name_called)
         self.assertEqual(eevd.name().prepend(self.prefix_from_codeinjection), name)
 
+    def testOverrideChangedAfterCall(self):
+        '''Test that overrides added to or removed from a class after a call are found.'''
+        class Derived(VirtualMethods):
+            pass
+
+        self.assertEqual(Derived().callSum0(1, 2, 3), 6)
+        Derived.sumThree = lambda self, a0, a1, a2: a0 * a1 * a2
+        self.assertEqual(Derived().callSum0(2, 3, 4), 24)
+        del Derived.sumThree
+        self.assertEqual(Derived().callSum0(2, 3, 4), 9)
+
+    def testOverrideChangedInBaseAfterCall(self):
+        '''Test that overrides added to or removed from a Python base class after a
+           call are found.'''
+        class Base(VirtualMethods):
+            pass
+
+        class Mixin:
+            pass
+
+        class Derived(Mixin, Base):
+            pass
+
+        self.assertEqual(Derived().callSum0(2, 3, 4), 9)
+        Base.sumThree = lambda self, a0, a1, a2: a0 * a1 * a2
+        self.assertEqual(Derived().callSum0(2, 3, 4), 24)
+        Mixin.sumThree = lambda self, a0, a1, a2: a0 - a1 - a2
+        self.assertEqual(Derived().callSum0(2, 3, 4), -5)
+        del Mixin.sumThree
+        self.assertEqual(Derived().callSum0(2, 3, 4), 24)
+        del Base.sumThree
+        self.assertEqual(Derived().callSum0(2, 3, 4), 9)
+
+    def testOverrideChangedInInstanceAfterCall(self):
+        '''Test that overrides set on or removed from an instance after a call are found.'''
+        class Derived(VirtualMethods):
+            def sumThree(self, a0, a1, a2):
+                return a0 * a1 * a2
+
+        obj = Derived()
+        other = Derived()
+        self.assertEqual(obj.callSum0(2, 3, 4), 24)
+        obj.sumThree = lambda a0, a1, a2: a0 - a1 - a2
+        self.assertEqual(obj.callSum0(2, 3, 4), -5)
+        self.assertEqual(other.callSum0(2, 3, 4), 24)
+        del obj.sumThree
+        self.assertEqual(obj.callSum0(2, 3, 4), 24)
+
     def testStringView(self):
         virtual_methods = VirtualMethods()
         self.assertEqual(virtual_methods.stringViewLength('bla'), 3)